@@ -0,0 +1,105 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, insert, text
+from src.common.database import apply_sqlite_profile
+from src.common.migrations import migrate
+from src.models.battle_log import BattleLog
+from src.models.user_champion import UserChampion
+
+QUERIES = {
+    "recent_battles": (
+        "SELECT id, winner, created_at FROM battle_logs "
+        "WHERE user_id = :user ORDER BY created_at DESC LIMIT 20"
+    ),
+    "battles_in_range": (
+        "SELECT COUNT(*) FROM battle_logs "
+        "WHERE user_id = :user AND created_at >= :since"
+    ),
+    "champion_by_key": (
+        "SELECT id, level, exp FROM user_champions "
+        "WHERE user_id = :user AND champion_key = :key"
+    ),
+}
+INDEXES = {
+    "ix_battle_logs_user_created": "CREATE INDEX ix_battle_logs_user_created ON battle_logs (user_id, created_at)",
+    "ix_user_champions_user_key": "CREATE INDEX ix_user_champions_user_key ON user_champions (user_id, champion_key)",
+}
+CHAMPION_KEYS = ["Garen", "Darius", "Ahri", "Jinx", "LeeSin", "Lux", "Jax", "Irelia"]
+
+
+def _fill(engine, rows: int, users: int, rng: random.Random):
+    start = datetime(2025, 1, 1)
+    blob = bytes(200)
+    with engine.begin() as conn:
+        conn.execute(insert(UserChampion.__table__), [
+            {"user_id": u, "champion_key": key, "level": 1, "exp": 0}
+            for u in range(1, users + 1) for key in CHAMPION_KEYS
+        ])
+    for offset in range(0, rows, 50000):
+        batch = [
+            {
+                "user_id": rng.randint(1, users),
+                "left_champion": "Garen", "right_champion": "Darius", "winner": "Garen",
+                "turn_count": 10, "history_blob": blob,
+                "created_at": start + timedelta(seconds=offset + i),
+            }
+            for i in range(min(50000, rows - offset))
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(BattleLog.__table__), batch)
+
+
+def _time_queries(engine, users: int, count: int, rng: random.Random) -> dict:
+    since = datetime(2025, 1, 1) + timedelta(days=7)
+    result = {}
+    with engine.connect() as conn:
+        for name, sql in QUERIES.items():
+            stmt = text(sql)
+            started = time.perf_counter()
+            for _ in range(count):
+                conn.execute(stmt, {"user": rng.randint(1, users), "since": since,
+                                    "key": rng.choice(CHAMPION_KEYS)}).fetchall()
+            result[name] = (time.perf_counter() - started) / count * 1000
+    return result
+
+
+def run_db_benchmark():
+    parser = argparse.ArgumentParser(description="LeagueSLG DB 쿼리 벤치마크 (인덱스 유무 비교)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="battle_logs 행 수")
+    parser.add_argument("--users", type=int, default=10_000, help="유저 수")
+    parser.add_argument("--queries", type=int, default=200, help="쿼리 종류별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        apply_sqlite_profile(engine)
+        migrate(engine)
+
+        print(f"=== DB 벤치마크: battle_logs {args.rows:,}행, 유저 {args.users:,}명 ===")
+        started = time.perf_counter()
+        _fill(engine, args.rows, args.users, rng)
+        print(f"{'insert':>22}: {time.perf_counter() - started:.2f}s")
+
+        with_index = _time_queries(engine, args.users, args.queries, rng)
+        with engine.begin() as conn:
+            for name in INDEXES:
+                conn.execute(text(f"DROP INDEX {name}"))
+        without_index = _time_queries(engine, args.users, max(1, args.queries // 10), rng)
+        with engine.begin() as conn:
+            for sql in INDEXES.values():
+                conn.execute(text(sql))
+        engine.dispose()
+
+    print(f"{'query (ms/op)':>22}  {'indexed':>10}  {'no index':>10}")
+    for name in QUERIES:
+        print(f"{name:>22}  {with_index[name]:>10.3f}  {without_index[name]:>10.3f}")
+
+
+if __name__ == "__main__":
+    run_db_benchmark()
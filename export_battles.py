@@ -0,0 +1,36 @@
+import argparse
+import sys
+from src.battle_export import HISTORY_FORMATS, PAGE_SIZE, iter_battle_logs, to_ndjson
+
+
+def run_export():
+    parser = argparse.ArgumentParser(description="전투 로그 NDJSON 내보내기 (stdout 또는 파일)")
+    parser.add_argument("--user", type=int, help="유저 id")
+    parser.add_argument("--champion", help="왼쪽/오른쪽 어느 쪽이든 이 챔피언이 참가한 전투")
+    parser.add_argument("--since", help="created_at 이상 (예: 2025-01-01)")
+    parser.add_argument("--until", help="created_at 미만 (예: 2025-02-01)")
+    parser.add_argument("--after", help="이어받을 커서 (마지막 줄의 cursor 값)")
+    parser.add_argument("--limit", type=int, help="최대 건수")
+    parser.add_argument("--history", choices=HISTORY_FORMATS, default="rows", help="전투 기록 출력 방식")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--output", "-o", help="출력 파일 (기본: stdout)")
+    args = parser.parse_args()
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count, cursor = 0, args.after
+    try:
+        for record in iter_battle_logs(
+            after=args.after, limit=args.limit, page_size=args.page_size, user_id=args.user,
+            champion=args.champion, since=args.since, until=args.until, history=args.history,
+        ):
+            out.write(to_ndjson(record))
+            count, cursor = count + 1, record["cursor"]
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        # 중단되어도 마지막 커서로 이어받을 수 있도록 stderr에 남김
+        print(f"exported {count} battles, last cursor: {cursor}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    run_export()
@@ -9,13 +9,13 @@ import os
 
 #  --- DB CODE --- #
 from fastapi import FastAPI
-from db.database import Base, engine
+from src.common.database import init_db
 # from src. import user, battle_log
 
 app = FastAPI()
 
-# 테이블 생성 (초기 개발용)
-Base.metadata.create_all(bind=engine)
+# 스키마 마이그레이션 (src/common/migrations.py)
+init_db()
 #  --- DB CODE --- #
 
 def printChamp(champ: Champion):
@@ -67,10 +67,6 @@ if __name__ == "__main__":
     webbrowser.open(f"file:///{report_abs_path}")
     print("브라우저에서 리포트를 열었습니다.")
 
-    # 전투 결과 저장
-    user.save_data()
-    print("\n--- 데이터 저장 완료 ---")
-
-    # 전투 결과 로깅
-    db_manager.save_battle_log(user.user_id, battle1)
-    print("\n--- 전투 로그 저장 완료 ---")
\ No newline at end of file
+    # 전투 결과 저장 (챔피언 상태 + 전투 로그를 한 번에 커밋)
+    user.save_data(battle1)
+    print("\n--- 데이터 및 전투 로그 저장 완료 ---")
\ No newline at end of file
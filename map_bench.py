@@ -0,0 +1,33 @@
+import argparse
+from src.logic.simulation import WorldSimulation
+
+
+def run_map_benchmark():
+    parser = argparse.ArgumentParser(description="LeagueSLG 맵 레이어 헤드리스 벤치마크")
+    parser.add_argument("--size", type=int, default=200, help="맵 한 변의 타일 수")
+    parser.add_argument("--bots", type=int, default=50, help="봇 유저 수")
+    parser.add_argument("--armies", type=int, default=3, help="봇당 부대 수")
+    parser.add_argument("--ticks", type=int, default=500, help="시뮬레이션 틱 수")
+    parser.add_argument("--tick-seconds", type=float, default=10.0, help="틱당 가상 경과 시간(초)")
+    parser.add_argument("--workers", type=int, default=0, help="도착 전투 병렬 워커 수 (0 = 순차)")
+    parser.add_argument("--intercept", action="store_true", help="행군 경로 조우(야전) 탐지 사용")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"=== 맵 벤치마크: {args.size}x{args.size}, 봇 {args.bots}명 x 부대 {args.armies}, {args.ticks}틱 ===")
+    sim = WorldSimulation(
+        size=args.size, bots=args.bots, armies_per_bot=args.armies, seed=args.seed,
+        tick_seconds=args.tick_seconds, workers=args.workers,
+        intercept=args.intercept,
+    )
+    try:
+        report = sim.run(args.ticks)
+    finally:
+        sim.close()
+
+    for key, value in report.items():
+        print(f"{key:>22}: {value:.2f}" if isinstance(value, float) else f"{key:>22}: {value}")
+
+
+if __name__ == "__main__":
+    run_map_benchmark()
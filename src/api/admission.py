@@ -0,0 +1,108 @@
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
+
+
+class Rejected(Exception):
+    """요청 거절 (status: HTTP 상태 코드, retry_after: 재시도까지 초)"""
+    def __init__(self, status: int, detail: str, retry_after: float = 1.0):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class BudgetExceeded(Exception):
+    """요청 시간 예산 초과 (시뮬레이션 루프가 deadline을 넘김)"""
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지는 최대 burst개 토큰 버킷"""
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def try_take(self, now: float) -> float:
+        """토큰 하나를 쓰면 0, 부족하면 다음 토큰까지 남은 초"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class ClientRateLimiter:
+    """
+    클라이언트별 토큰 버킷
+    - 버킷은 최근 사용 순으로 max_clients개까지만 유지 (오래된 클라이언트는 가득 찬 상태로 다시 시작)
+    """
+    def __init__(self, rate: float, burst: float, max_clients: int = 10000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.clock = clock
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def check(self, client: str):
+        """허용되면 그대로 반환, 초과면 Rejected(429)"""
+        now = self.clock()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = TokenBucket(self.rate, self.burst, now)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+        wait = bucket.try_take(now)
+        if wait > 0:
+            raise Rejected(429, "rate limit exceeded", wait)
+
+
+class AdmissionController:
+    """
+    동시 실행 제한 + 유한 대기열
+    - 최대 max_concurrent개 실행, 그 뒤로 max_queue개까지 대기
+    - 대기열이 가득 차면 즉시 Rejected(503), 대기 시간이 queue_timeout을 넘어도 Rejected(503)
+    """
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float = 2.0):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.running = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        if self.running >= self.max_concurrent and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise Rejected(503, "server busy", self.queue_timeout)
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise Rejected(503, "server busy", self.queue_timeout)
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        try:
+            yield
+        finally:
+            self.running -= 1
+            self._semaphore.release()
+
+
+def check_deadline(deadline: Optional[float]):
+    """CPU 루프 안에서 주기적으로 호출 (deadline은 time.monotonic 기준)"""
+    if deadline is not None and time.monotonic() > deadline:
+        raise BudgetExceeded()
@@ -0,0 +1,84 @@
+from typing import Any, Dict, List
+
+# 압축 전투 로그 포맷 (static/js/game.js의 decodeCompactBattle와 짝)
+WIRE_VERSION = 1
+COMPACT_MEDIA_TYPE = "application/vnd.leagueslg.battle+json"
+# 데미지/HP 고정소수점 배율 (0.1 단위)
+SCALE = 10
+# rows는 행동 하나당 아래 순서의 정수 STRIDE개를 이어 붙인 1차원 배열
+ROW_FIELDS = ("turn_delta", "actor", "action", "damage", "left_hp_delta", "right_hp_delta")
+STRIDE = len(ROW_FIELDS)
+
+
+def _fixed(value: float) -> int:
+    return int(round((value or 0) * SCALE))
+
+
+def encode_compact(battle) -> Dict[str, Any]:
+    """
+    WebBattle(run_to_end 이후)의 기록을 압축 포맷으로 변환
+    - 챔피언 표(0=왼쪽, 1=오른쪽)와 행동 이름 사전은 헤더에 한 번만
+    - 턴 번호와 HP는 직전 행과의 차이, 대상은 행동자의 반대편이므로 생략
+    - HP 차이는 양자화된 절대값끼리 계산하므로 누적해도 오차가 쌓이지 않음
+    """
+    actions: List[str] = []
+    action_index: Dict[str, int] = {}
+    rows: List[int] = []
+    left, right = battle.left, battle.right
+    prev_turn = 0
+    prev_left = _fixed(left.max_hp)
+    prev_right = _fixed(right.max_hp)
+    for log in battle.logs:
+        action = log["action"]
+        if action not in action_index:
+            action_index[action] = len(actions)
+            actions.append(action)
+        left_hp, right_hp = _fixed(log["left_hp"]), _fixed(log["right_hp"])
+        rows.extend((
+            log["turn"] - prev_turn,
+            0 if log["side"] == "left" else 1,
+            action_index[action],
+            _fixed(log["damage"]),
+            left_hp - prev_left,
+            right_hp - prev_right,
+        ))
+        prev_turn, prev_left, prev_right = log["turn"], left_hp, right_hp
+    return {
+        "v": WIRE_VERSION,
+        "scale": SCALE,
+        "champions": [
+            {"name": left.name, "max_hp": left.max_hp},
+            {"name": right.name, "max_hp": right.max_hp},
+        ],
+        "winner": 0 if left.is_alive() else 1,
+        "actions": actions,
+        "rows": rows,
+    }
+
+
+def decode_compact(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """encode_compact의 역변환 (메시지 문자열 제외, 값은 0.1 단위로 반올림됨)"""
+    if data.get("v") != WIRE_VERSION:
+        raise ValueError(f"Unsupported battle wire version: {data.get('v')}")
+    scale = data["scale"]
+    names = [c["name"] for c in data["champions"]]
+    rows = data["rows"]
+    turn = 0
+    left_hp = int(round(data["champions"][0]["max_hp"] * scale))
+    right_hp = int(round(data["champions"][1]["max_hp"] * scale))
+    logs = []
+    for i in range(0, len(rows), STRIDE):
+        turn_delta, actor, action, damage, left_delta, right_delta = rows[i:i + STRIDE]
+        turn += turn_delta
+        left_hp += left_delta
+        right_hp += right_delta
+        logs.append({
+            "turn": turn,
+            "actor": names[actor],
+            "target": names[1 - actor],
+            "action": data["actions"][action],
+            "damage": damage / scale,
+            "left_hp": left_hp / scale,
+            "right_hp": right_hp / scale,
+        })
+    return logs
@@ -0,0 +1,115 @@
+import gzip
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from src.factories.champion_factory import _load_champion_data
+from src.factories.skill_factory import _load_skill_data
+from src.factories.item_factory import _load_item_data
+
+# 카탈로그 이름 → (원본 데이터 로더, fields 미지정 시 기본 필드 / None이면 전체)
+CATALOGS: Dict[str, Tuple[Callable[[], Dict[str, Dict[str, Any]]], Optional[Tuple[str, ...]]]] = {
+    # /champions의 기존 응답 형태 유지
+    "champions": (_load_champion_data, ("id", "name", "base_stat")),
+    "skills": (_load_skill_data, None),
+    "items": (_load_item_data, None),
+}
+# 필드 조합별 캐시 상한 (임의의 fields 조합으로 메모리가 늘지 않도록)
+MAX_PROJECTIONS = 64
+
+
+class CatalogBody:
+    """직렬화가 끝난 응답 본문 (원본/gzip)과 각각의 strong ETag"""
+    __slots__ = ("body", "etag", "gzip_body", "gzip_etag")
+
+    def __init__(self, body: bytes, version: str):
+        self.body = body
+        self.etag = f'"{version}"'
+        self.gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+        # 인코딩이 다르면 다른 표현이므로 strong ETag도 구분
+        self.gzip_etag = f'"{version}-gz"'
+
+    def select(self, accept_encoding: str) -> Tuple[bytes, str, bool]:
+        """(본문, ETag, gzip 여부)"""
+        if "gzip" in (accept_encoding or "").lower():
+            return self.gzip_body, self.gzip_etag, True
+        return self.body, self.etag, False
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(목록/W/ 접두사/*)가 etag와 일치하는지"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class CatalogResponses:
+    """
+    정적 카탈로그(챔피언/스킬/아이템) 응답 캐시
+    - 데이터 버전 = 원본 JSON의 내용 해시. 버전이 같으면 직렬화/압축은 (카탈로그, 필드 조합)당 한 번
+    - 요청 처리는 캐시 조회 + ETag 비교만 수행
+    """
+    def __init__(self, catalogs=CATALOGS, max_projections: int = MAX_PROJECTIONS):
+        self.catalogs = catalogs
+        self.max_projections = max_projections
+        self._records: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+        self._bodies: Dict[Tuple[str, Optional[Tuple[str, ...]]], CatalogBody] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, name: str) -> Tuple[str, List[Dict[str, Any]]]:
+        cached = self._records.get(name)
+        if cached is None:
+            loader, _ = self.catalogs[name]
+            data = loader()
+            canonical = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+            version = f"{name}-{hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]}"
+            records = [{"id": key, **info} for key, info in data.items()]
+            cached = self._records[name] = (version, records)
+        return cached
+
+    def fields_of(self, name: str) -> List[str]:
+        """fields 파라미터로 고를 수 있는 필드 목록"""
+        _, records = self._load(name)
+        seen: Dict[str, None] = {}
+        for record in records:
+            seen.update(dict.fromkeys(record))
+        return list(seen)
+
+    def get(self, name: str, fields: Optional[Iterable[str]] = None) -> CatalogBody:
+        """
+        name 카탈로그의 직렬화된 응답. fields를 주면 그 필드만 (없는 필드는 ValueError)
+        """
+        if name not in self.catalogs:
+            raise KeyError(name)
+        projection = tuple(sorted(set(fields))) if fields else self.catalogs[name][1]
+        key = (name, projection)
+        body = self._bodies.get(key)
+        if body is not None:
+            return body
+
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                return body
+            version, records = self._load(name)
+            if projection is not None:
+                unknown = set(projection) - set(self.fields_of(name))
+                if unknown:
+                    raise ValueError(f"Unknown fields for {name}: {', '.join(sorted(unknown))}")
+                records = [{f: r[f] for f in projection if f in r} for r in records]
+                version += "-" + hashlib.sha256(",".join(projection).encode("utf-8")).hexdigest()[:8]
+            if len(self._bodies) >= self.max_projections:
+                self._bodies.clear()
+            payload = json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            body = self._bodies[key] = CatalogBody(payload, version)
+            return body
+
+    def invalidate(self):
+        """데이터 파일을 다시 읽은 뒤 호출 (다음 요청에서 새 버전으로 직렬화)"""
+        with self._lock:
+            self._records.clear()
+            self._bodies.clear()
@@ -0,0 +1,69 @@
+import asyncio
+import json
+from typing import Any, List, Tuple
+
+# 소켓당 송신 대기 메시지 상한 (틱당 최대 1건이므로 이만큼 밀리면 느린 클라이언트로 간주)
+MAX_PENDING = 32
+# 한 번에 구독할 수 있는 청크 수 상한
+MAX_SUBSCRIBED_CHUNKS = 256
+# 밀린 델타를 버렸으니 HTTP로 청크를 다시 받으라는 알림 (리비전 비교로 바뀐 청크만 재조회)
+RESYNC_MESSAGE = '{"type":"resync"}'
+
+
+def error_message(detail: str) -> str:
+    return json.dumps({"type": "error", "detail": detail}, ensure_ascii=False)
+
+
+class SocketOutbox:
+    """
+    WebSocket별 유한 송신 큐
+    - 큐가 가득 차면 밀린 델타를 모두 버리고 resync 한 건으로 합침 (메모리는 소켓당 MAX_PENDING건)
+    - put()은 이벤트 루프 스레드에서만 호출
+    """
+    def __init__(self, maxsize: int = MAX_PENDING):
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def put(self, message: str):
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self.dropped += 1
+            self.dropped += 1
+            self._queue.put_nowait(RESYNC_MESSAGE)
+
+    async def get(self) -> str:
+        return await self._queue.get()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+
+def parse_subscribe(text: str, chunks_x: int, chunks_y: int,
+                    max_chunks: int = MAX_SUBSCRIBED_CHUNKS) -> List[Tuple[int, int]]:
+    """
+    클라이언트 메시지 {"subscribe": [[cx, cy], ...]} 검증
+    형식이 잘못되면 ValueError (메시지는 클라이언트에 그대로 전달).
+    맵 밖 좌표는 뷰포트가 가장자리에 걸친 정상 요청이므로 오류 없이 제외
+    """
+    try:
+        message: Any = json.loads(text)
+    except ValueError:
+        raise ValueError("message is not valid JSON")
+    if not isinstance(message, dict) or not isinstance(message.get("subscribe"), list):
+        raise ValueError('expected {"subscribe": [[cx, cy], ...]}')
+
+    chunks = message["subscribe"]
+    if len(chunks) > max_chunks:
+        raise ValueError(f"at most {max_chunks} chunks per subscription")
+    result = []
+    for item in chunks:
+        if (not isinstance(item, list) or len(item) != 2
+                or not all(isinstance(v, int) and not isinstance(v, bool) for v in item)):
+            raise ValueError(f"invalid chunk coordinate: {item!r}")
+        cx, cy = item
+        if 0 <= cx < chunks_x and 0 <= cy < chunks_y:
+            result.append((cx, cy))
+    return result
@@ -1,25 +1,144 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
 import sys
 import os
+import time
 
 # Add the parent directory to sys.path to import existing classes
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.factories.champion_factory import create_champion, _load_champion_data
+from src.factories.champion_factory import create_champion
 from src.logic.battle.battle import Battle
 from src.models.champion import Champion
+from src.logic.map_manager import MapManager
+from src.logic.map_chunks import MapChunkIndex
+from src.logic.visibility import VisibilityIndex
+from src.logic.map_generator import generate_world
+from src.logic.map_deltas import MapDeltaTracker, ChunkSubscriptions
+from src.async_db_manager import AsyncDatabaseManager
+from src.battle_log_writer import BattleLogWriter
+from src.common.database import init_db
+from src.game.ranking import RankingService
+from src.common.metrics import REGISTRY, CONTENT_TYPE
+from src.api.battle_wire import COMPACT_MEDIA_TYPE, encode_compact
+from src.api.catalog import CatalogResponses, etag_matches
+from src.api.map_socket import SocketOutbox, error_message, parse_subscribe
+from src.api.admission import AdmissionController, ClientRateLimiter, Rejected, BudgetExceeded, check_deadline
+from src.battle_export import HISTORY_FORMATS, PAGE_SIZE, decode_cursor, fetch_page, to_ndjson
 
-app = FastAPI()
+# World map shared by the map endpoints
+WORLD_SIZE = int(os.getenv("WORLD_SIZE", "100"))
+WORLD_SEED = int(os.getenv("WORLD_SEED")) if os.getenv("WORLD_SEED") else None
+world_map = generate_world(WORLD_SIZE, WORLD_SIZE, WORLD_SEED)
+map_manager = MapManager(world_map)
+map_chunks = MapChunkIndex(world_map, map_manager)
+visibility = VisibilityIndex(world_map, map_manager)
+map_deltas = MapDeltaTracker(world_map, map_manager, map_chunks)
+map_subscriptions = ChunkSubscriptions()
+map_sockets = {}  # id(WebSocket) -> SocketOutbox
+MAP_TICK_SECONDS = float(os.getenv("MAP_TICK_SECONDS", "1.0"))
+# Ticks (march arrivals, guard battles) run off the event loop, one at a time
+map_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map")
 
-# Mount Static Files
-if not os.path.exists("static"):
-    # Fallback or strict check, but for now assuming running from root
-    pass
-app.mount("/", StaticFiles(directory="static", html=True), name="static")
+# Battle logs saved through database.save_battle_log are batched by a write-behind queue
+battle_log_writer = BattleLogWriter(
+    flush_interval=float(os.getenv("BATTLE_LOG_FLUSH_INTERVAL", "0.2")),
+    max_queue=int(os.getenv("BATTLE_LOG_MAX_QUEUE", "10000")),
+)
+# DB access from async handlers goes through a bounded worker pool, never the event loop
+database = AsyncDatabaseManager(
+    max_workers=int(os.getenv("DB_WORKERS", "4")),
+    max_in_flight=int(os.getenv("DB_MAX_IN_FLIGHT", "16")),
+    log_writer=battle_log_writer,
+)
+# Simulations run on their own bounded pool so a flood can't stall the event loop.
+# Admission: per-client token bucket -> bounded wait queue -> at most SIM_WORKERS running,
+# each with a wall-clock budget checked between turns.
+SIM_WORKERS = int(os.getenv("SIM_WORKERS", "2"))
+simulation_executor = ThreadPoolExecutor(max_workers=SIM_WORKERS, thread_name_prefix="sim")
+simulation_admission = AdmissionController(
+    max_concurrent=SIM_WORKERS,
+    max_queue=int(os.getenv("SIM_MAX_QUEUE", "16")),
+    queue_timeout=float(os.getenv("SIM_QUEUE_TIMEOUT", "2.0")),
+)
+simulation_limiter = ClientRateLimiter(
+    rate=float(os.getenv("SIM_RATE", "5")),
+    burst=float(os.getenv("SIM_BURST", "10")),
+)
+SIM_TIME_BUDGET = float(os.getenv("SIM_TIME_BUDGET", "1.0"))
+
+# Hot-path instrumentation, exported at /metrics. Label children are bound once here.
+SIMULATE_SECONDS = REGISTRY.histogram("leagueslg_simulate_request_seconds", "POST /simulate latency, including queue wait")
+SIMULATE_REJECTED = REGISTRY.counter("leagueslg_simulate_rejected_total", "Rejected /simulate requests", ["reason"])
+REJECTED_RATE_LIMIT = SIMULATE_REJECTED.labels("rate_limit")
+REJECTED_BUSY = SIMULATE_REJECTED.labels("busy")
+REJECTED_BUDGET = SIMULATE_REJECTED.labels("time_budget")
+BATTLE_TURNS = REGISTRY.histogram("leagueslg_battle_turns", "Turns per simulated battle",
+                                  buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 100))
+BATTLE_CPU_SECONDS = REGISTRY.histogram("leagueslg_battle_cpu_seconds", "CPU time per simulated battle (worker thread)")
+REGISTRY.gauge("leagueslg_simulations_running", "Simulations holding a worker slot").set_function(
+    lambda: simulation_admission.running)
+REGISTRY.gauge("leagueslg_simulations_waiting", "Simulations waiting for a worker slot").set_function(
+    lambda: simulation_admission.waiting)
+
+# Static catalogs are serialized and gzipped once per data version
+catalogs = CatalogResponses()
+
+# Leaderboard lookups are served from memory; ratings are loaded once at startup
+ranking = RankingService(database.sync)
+
+
+def advance_map():
+    """Advance marches once and serialize the tick's coalesced chunk deltas (map worker thread)"""
+    map_manager.update()
+    # Each chunk delta is serialized once, however many sockets subscribe to it
+    return {
+        key: json.dumps(delta, ensure_ascii=False, separators=(",", ":"))
+        for key, delta in map_deltas.flush().items()
+    }
+
+
+def publish_map_deltas(encoded):
+    """Queue each subscriber's deltas as one message (event loop only: outboxes aren't thread-safe)"""
+    for subscriber, chunk_deltas in map_subscriptions.route(encoded).items():
+        outbox = map_sockets.get(subscriber)
+        if outbox is not None:
+            outbox.put('{"type":"delta","chunks":[' + ",".join(chunk_deltas) + "]}")
+
+
+async def map_tick():
+    loop = asyncio.get_running_loop()
+    publish_map_deltas(await loop.run_in_executor(map_executor, advance_map))
+
+
+async def run_map_ticks():
+    while True:
+        await asyncio.sleep(MAP_TICK_SECONDS)
+        await map_tick()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await database.run(init_db)
+    await database.run(ranking.load)
+    task = asyncio.create_task(run_map_ticks())
+    yield
+    task.cancel()
+    map_executor.shutdown(wait=False, cancel_futures=True)
+    simulation_executor.shutdown(wait=False, cancel_futures=True)
+    # Commit queued battle logs before the DB pool goes away
+    battle_log_writer.close()
+    database.close()
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow CORS for frontend development
 app.add_middleware(
@@ -33,20 +152,31 @@ class BattleRequest(BaseModel):
     left_id: str
     right_id: str
 
+class RankedBattleRequest(BaseModel):
+    left_user_id: int
+    right_user_id: int
+    left_id: str
+    right_id: str
+
 class BattleLog(BaseModel):
     turn: int
+    side: str
     actor: str
     target: str
     action: str
     damage: Optional[float] = 0
     left_hp: float
     right_hp: float
-    message: str
+    message: Optional[str] = None
 
 class WebBattle(Battle):
-    def __init__(self, left: Champion, right: Champion):
+    def __init__(self, left: Champion, right: Champion, messages: bool = True):
         super().__init__(left, right)
         self.logs = []
+        # Rows carry every Battle.history field, so a ranked battle can be persisted as-is
+        self.history = self.logs
+        # The compact wire format renders messages client-side, so skip formatting them
+        self.messages = messages
 
     def _log(self, msg: str):
         # We'll override this to capture logs instead of just printing
@@ -56,6 +186,7 @@ class WebBattle(Battle):
     def _process_turn(self, actor: Champion, target: Champion):
         turn_data = {
             "turn": self.turn,
+            "side": "left" if actor is self.left else "right",
             "actor": actor.name,
             "target": target.name,
             "left_hp": self.left.current_hp,
@@ -84,16 +215,18 @@ class WebBattle(Battle):
         turn_data.update({
             "action": action_name,
             "damage": damage,
-            "message": f"{actor.name}의 {action_name}! ({damage:.1f} 데미지)",
             "left_hp": self.left.current_hp,
             "right_hp": self.right.current_hp
         })
-        
+        if self.messages:
+            turn_data["message"] = f"{actor.name}의 {action_name}! ({damage:.1f} 데미지)"
+
         self.logs.append(turn_data)
         actor.on_turn_end()
 
-    def run_to_end(self):
+    def run_to_end(self, deadline: Optional[float] = None):
         while self._both_alive() and self.turn < 100: # Safety cap
+            check_deadline(deadline)
             first, second = self._get_turn_order()
             self._process_turn(first, second)
             if not second.is_alive():
@@ -101,30 +234,247 @@ class WebBattle(Battle):
             self._process_turn(second, first)
             self.turn += 1
         
-        winner = self.left.name if self.left.is_alive() else self.right.name
+        self.winner = self.left if self.left.is_alive() else self.right
         return {
-            "winner": winner, 
+            "winner": self.winner.name, 
             "logs": self.logs,
             "left": {"name": self.left.name, "max_hp": self.left.max_hp},
             "right": {"name": self.right.name, "max_hp": self.right.max_hp}
         }
 
+@app.get("/metrics")
+async def get_metrics():
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+def _catalog_response(name: str, request: Request, fields: Optional[str]) -> Response:
+    try:
+        body = catalogs.get(name, fields.split(",") if fields else None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    content, etag, gzipped = body.select(request.headers.get("accept-encoding", ""))
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=content, media_type="application/json", headers=headers)
+
 @app.get("/champions")
-async def get_champions():
-    data = _load_champion_data()
-    return [{"id": k, "name": v["name"], "base_stat": v["base_stat"]} for k, v in data.items()]
+async def get_champions(request: Request, fields: Optional[str] = None):
+    return _catalog_response("champions", request, fields)
+
+@app.get("/catalog/{name}")
+async def get_catalog(name: str, request: Request, fields: Optional[str] = None):
+    if name not in catalogs.catalogs:
+        raise HTTPException(status_code=404, detail=f"Unknown catalog: {name}")
+    return _catalog_response(name, request, fields)
+
+def run_simulation(left_id: str, right_id: str, deadline: Optional[float] = None, compact: bool = False):
+    cpu_started = time.thread_time()
+    left = create_champion(left_id)
+    right = create_champion(right_id)
+    battle = WebBattle(left, right, messages=not compact)
+    result = battle.run_to_end(deadline)
+    if compact:
+        result = encode_compact(battle)
+    BATTLE_CPU_SECONDS.observe(time.thread_time() - cpu_started)
+    BATTLE_TURNS.observe(battle.turn)
+    return result
+
+def _client_key(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+def _rejection(e: Rejected) -> HTTPException:
+    return HTTPException(status_code=e.status, detail=e.detail,
+                         headers={"Retry-After": str(max(1, round(e.retry_after)))})
+
+def run_ranked_battle(left_id: str, right_id: str, deadline: Optional[float] = None) -> WebBattle:
+    cpu_started = time.thread_time()
+    battle = WebBattle(create_champion(left_id), create_champion(right_id), messages=False)
+    battle.run_to_end(deadline)
+    BATTLE_CPU_SECONDS.observe(time.thread_time() - cpu_started)
+    BATTLE_TURNS.observe(battle.turn)
+    return battle
+
+async def _run_admitted(http_request: Request, fn, *args):
+    """Rate limit -> admission slot -> fn(*args, deadline) on the simulation pool"""
+    try:
+        simulation_limiter.check(_client_key(http_request))
+        async with simulation_admission.slot():
+            # The budget starts once a worker is ours; queue wait is bounded separately
+            deadline = time.monotonic() + SIM_TIME_BUDGET
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(simulation_executor, fn, *args, deadline)
+    except Rejected as e:
+        (REJECTED_RATE_LIMIT if e.status == 429 else REJECTED_BUSY).inc()
+        raise _rejection(e)
+    except BudgetExceeded:
+        REJECTED_BUDGET.inc()
+        raise HTTPException(status_code=503, detail="simulation time budget exceeded")
 
 @app.post("/simulate")
-async def simulate_battle(request: BattleRequest):
+async def simulate_battle(request: BattleRequest, http_request: Request, format: Optional[str] = None):
+    started = time.perf_counter()
+    # Compact wire format via ?format=compact or Accept: application/vnd.leagueslg.battle+json
+    compact = format == "compact" or COMPACT_MEDIA_TYPE in http_request.headers.get("accept", "")
     try:
-        left = create_champion(request.left_id)
-        right = create_champion(request.right_id)
-        
-        battle = WebBattle(left, right)
-        result = battle.run_to_end()
-        return result
+        return await _run_admitted(
+            http_request, lambda deadline: run_simulation(request.left_id, request.right_id, deadline, compact)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        SIMULATE_SECONDS.observe(time.perf_counter() - started)
+
+@app.post("/ranked/battle")
+async def ranked_battle(request: RankedBattleRequest, http_request: Request):
+    if request.left_user_id == request.right_user_id:
+        raise HTTPException(status_code=400, detail="a user cannot battle themselves")
+    for user_id in (request.left_user_id, request.right_user_id):
+        if await database.get_user_info(user_id) is None:
+            raise HTTPException(status_code=404, detail=f"Unknown user: {user_id}")
+    try:
+        battle = await _run_admitted(http_request, run_ranked_battle, request.left_id, request.right_id)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    # Battle log and both ratings are committed together; the rank index follows the commit
+    left_rating, right_rating = await database.run(
+        ranking.save_battle, request.left_user_id, request.right_user_id, battle
+    )
+    return {
+        "winner": battle.winner.name,
+        "turns": battle.turn,
+        "ratings": {
+            str(request.left_user_id): round(left_rating, 1),
+            str(request.right_user_id): round(right_rating, 1),
+        },
+    }
+
+@app.get("/stats/champions/{champion}")
+async def get_champion_stats(champion: str, opponent: Optional[str] = None, days: int = 7):
+    # Reads the materialized daily matchup rows, never battle_logs
+    if not 1 <= days <= 365:
+        raise HTTPException(status_code=400, detail="days must be between 1 and 365")
+    return await database.get_matchup_stats(champion, opponent, days)
+
+@app.get("/stats/turns")
+async def get_turn_stats(days: int = 7):
+    if not 1 <= days <= 365:
+        raise HTTPException(status_code=400, detail="days must be between 1 and 365")
+    return {"days": days, "histogram": await database.get_turn_histogram(days)}
+
+@app.get("/battles/export")
+async def export_battles(user_id: Optional[int] = None, champion: Optional[str] = None,
+                         since: Optional[str] = None, until: Optional[str] = None,
+                         after: Optional[str] = None, limit: Optional[int] = None,
+                         history: str = "rows"):
+    # NDJSON stream; every line carries a cursor, so a dropped download resumes with ?after=<cursor>
+    if history not in HISTORY_FORMATS:
+        raise HTTPException(status_code=400, detail=f"history must be one of {HISTORY_FORMATS}")
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be positive")
+    if after:
+        try:
+            decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def lines():
+        # One page per DB call on the bounded DB pool; only a single page is held in memory
+        cursor, emitted = after, 0
+        while limit is None or emitted < limit:
+            size = PAGE_SIZE if limit is None else min(PAGE_SIZE, limit - emitted)
+            records, cursor = await database.run(
+                fetch_page, database.sync.session_factory, cursor, user_id, champion, since, until, history, size
+            )
+            if records:
+                yield "".join(to_ndjson(record) for record in records)
+            emitted += len(records)
+            if cursor is None:
+                break
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@app.get("/ranking/top")
+async def get_ranking_top(n: int = 100):
+    if not 1 <= n <= 1000:
+        raise HTTPException(status_code=400, detail="n must be between 1 and 1000")
+    return ranking.top(n)
+
+@app.get("/ranking/{user_id}")
+async def get_user_ranking(user_id: int):
+    rank = ranking.rank(user_id)
+    if rank is None:
+        raise HTTPException(status_code=404, detail="user not ranked")
+    return {"user_id": user_id, "rank": rank, "rating": round(ranking.rating(user_id), 1), "players": len(ranking.index)}
+
+@app.get("/map/meta")
+async def get_map_meta():
+    return map_chunks.meta()
+
+@app.get("/map/viewport")
+async def get_map_viewport(x: int, y: int, w: int, h: int, user: Optional[str] = None):
+    # Chunks overlapping the viewport with their current revisions
+    return {"chunks": map_chunks.chunks_in_view(x, y, w, h, visibility, user)}
+
+@app.get("/map/chunk/{cx}/{cy}")
+async def get_map_chunk(cx: int, cy: int, request: Request, user: Optional[str] = None):
+    # With ?user=..., tiles outside that user's vision are hidden (fog of war)
+    try:
+        if user:
+            body = map_chunks.visible_chunk_bytes(cx, cy, visibility, user)
+        else:
+            body = map_chunks.chunk_bytes(cx, cy)
+    except IndexError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    etag = map_chunks.etag(cx, cy, visibility, user)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.websocket("/map/ws")
+async def map_socket(websocket: WebSocket):
+    # Client sends {"subscribe": [[cx, cy], ...]} whenever its viewport changes
+    # and receives {"type": "delta", "chunks": [...]} once per tick for changed chunks.
+    # A client that falls behind gets {"type": "resync"} instead of an ever-growing backlog;
+    # a malformed message gets {"type": "error", "detail": ...} and the socket stays open.
+    await websocket.accept()
+    key = id(websocket)
+    outbox = SocketOutbox()
+    map_sockets[key] = outbox
+
+    async def sender():
+        while True:
+            await websocket.send_text(await outbox.get())
+
+    send_task = asyncio.create_task(sender())
+    try:
+        while True:
+            text = await websocket.receive_text()
+            try:
+                chunks = parse_subscribe(text, map_chunks.chunks_x, map_chunks.chunks_y)
+            except ValueError as e:
+                outbox.put(error_message(str(e)))
+                continue
+            map_subscriptions.subscribe(key, chunks)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        send_task.cancel()
+        map_subscriptions.unsubscribe(key)
+        map_sockets.pop(key, None)
+
+# Mount static files last so they don't shadow the API routes
+if not os.path.exists("static"):
+    # Fallback or strict check, but for now assuming running from root
+    pass
+app.mount("/", StaticFiles(directory="static", html=True), name="static")
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+from sqlalchemy.orm import scoped_session
+from src.common.database import SessionLocal
+from src.db_manager import DatabaseManager, UnitOfWork
+from src.battle_log_writer import BattleLogWriter
+
+T = TypeVar("T")
+
+
+class AsyncDatabaseManager:
+    """
+    DatabaseManager의 async 파사드 (FastAPI 핸들러용)
+    - 동기 SQLAlchemy 호출을 전용 스레드 풀(크기 고정)에서 실행하여 이벤트 루프를 막지 않음
+    - 세션은 scoped_session으로 워커 스레드마다 하나씩 재사용
+    - 세마포어로 동시에 대기/실행 중인 쿼리 수를 제한 (초과 요청은 루프에서 대기)
+    """
+    def __init__(self, session_factory=SessionLocal, max_workers: int = 4,
+                 max_in_flight: Optional[int] = None, log_writer: Optional[BattleLogWriter] = None):
+        self.sessions = scoped_session(session_factory)
+        self.sync = DatabaseManager(self.sessions, log_writer)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db")
+        self.max_in_flight = max_in_flight or max_workers * 2
+        self._limit = asyncio.Semaphore(self.max_in_flight)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """임의의 동기 DB 함수를 DB 스레드 풀에서 실행"""
+        async with self._limit:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self._call, fn, args)
+
+    def _call(self, fn: Callable[..., T], args) -> T:
+        try:
+            return fn(*args)
+        finally:
+            # 다음 작업이 이전 작업의 identity map을 보지 않도록 스레드 세션을 비움
+            self.sessions.remove()
+
+    # -------------------------
+    # DatabaseManager와 같은 연산
+    # -------------------------
+    async def get_or_create_user(self, username: str) -> int:
+        return await self.run(self.sync.get_or_create_user, username)
+
+    async def get_user_info(self, user_id: int) -> Dict[str, Any] | None:
+        return await self.run(self.sync.get_user_info, user_id)
+
+    async def add_champion_to_user(self, user_id: int, champion_key: str):
+        return await self.run(self.sync.add_champion_to_user, user_id, champion_key)
+
+    async def get_user_champions(self, user_id: int) -> List[Dict[str, Any]]:
+        return await self.run(self.sync.get_user_champions, user_id)
+
+    async def update_champion_data(self, champion_id: int, level: int, exp: int):
+        return await self.run(self.sync.update_champion_data, champion_id, level, exp)
+
+    async def update_champion_data_by_key(self, user_id: int, champion_key: str, level: int, exp: int):
+        return await self.run(self.sync.update_champion_data_by_key, user_id, champion_key, level, exp)
+
+    async def save_battle_log(self, user_id: int, battle):
+        # log_writer가 있으면 큐에 넣기만 함 (큐가 가득 차면 대기하므로 루프 밖에서 실행)
+        return await self.run(self.sync.save_battle_log, user_id, battle)
+
+    async def get_matchup_stats(self, champion: str, opponent: Optional[str] = None, days: int = 7):
+        return await self.run(self.sync.get_matchup_stats, champion, opponent, days)
+
+    async def get_turn_histogram(self, days: int = 7) -> Dict[int, int]:
+        return await self.run(self.sync.get_turn_histogram, days)
+
+    async def batch(self, work: Callable[[UnitOfWork], T]) -> T:
+        """work(uow)를 DB 스레드에서 한 트랜잭션으로 실행"""
+        def run_batch():
+            with self.sync.batch() as uow:
+                return work(uow)
+        return await self.run(run_batch)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,127 @@
+import base64
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import String, and_, or_, select, type_coerce
+from src.common.database import SessionLocal
+from src.common.battle_codec import encode_history, decode_history
+from src.models.battle_log import BattleLog
+
+# 한 번에 읽는 행 수 (메모리 사용량 = 페이지 하나)
+PAGE_SIZE = 500
+# history 출력 방식: rows = dict 리스트, blob = 압축 포맷 base64, none = 생략
+HISTORY_FORMATS = ("rows", "blob", "none")
+
+# created_at은 DB에 저장된 문자열 그대로 비교 (서버 기본값과 파이썬 datetime의 포맷이 달라도 순서가 어긋나지 않도록)
+_CREATED = type_coerce(BattleLog.__table__.c.created_at, String)
+
+
+def encode_cursor(created_at: str, log_id: int) -> str:
+    """(created_at, id) → URL에 넣을 수 있는 불투명 문자열"""
+    raw = json.dumps([created_at, log_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, log_id = json.loads(raw)
+        return str(created_at), int(log_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid export cursor: {cursor}") from e
+
+
+def _history(blob: Optional[bytes], legacy_json: Optional[str], history: str):
+    if history == "none":
+        return None
+    if blob is None:
+        # 구형(JSON) 행: 내보내기는 읽기 전용이므로 지연 마이그레이션하지 않음
+        rows = json.loads(legacy_json or "[]")
+        if history == "rows":
+            return rows
+        blob = encode_history(rows)
+    if history == "rows":
+        return decode_history(blob)
+    return base64.b64encode(blob).decode("ascii")
+
+
+def fetch_page(
+    session_factory=SessionLocal,
+    after: Optional[str] = None,
+    user_id: Optional[int] = None,
+    champion: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    history: str = "rows",
+    page_size: int = PAGE_SIZE,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    (created_at, id) 순서로 after 커서 다음의 page_size개를 읽음 (keyset 페이지네이션, OFFSET 없음)
+    since/until: created_at 문자열 비교 ('YYYY-MM-DD' 등), since 이상 until 미만
+    반환값: (레코드 리스트, 다음 커서 또는 None=끝)
+    """
+    if history not in HISTORY_FORMATS:
+        raise ValueError(f"history must be one of {HISTORY_FORMATS}")
+    table = BattleLog.__table__
+    c = table.c
+    stmt = select(
+        c.id, c.user_id, _CREATED, c.left_champion, c.right_champion, c.winner, c.turn_count,
+        *((c.history_blob, c.history_json) if history != "none" else ()),
+    )
+    if user_id is not None:
+        stmt = stmt.where(c.user_id == user_id)
+    if champion:
+        stmt = stmt.where(or_(c.left_champion == champion, c.right_champion == champion))
+    if since:
+        stmt = stmt.where(_CREATED >= since)
+    if until:
+        stmt = stmt.where(_CREATED < until)
+    if after:
+        created_at, log_id = decode_cursor(after)
+        stmt = stmt.where(or_(_CREATED > created_at, and_(_CREATED == created_at, c.id > log_id)))
+    stmt = stmt.order_by(_CREATED, c.id).limit(page_size)
+
+    db = session_factory()
+    try:
+        rows = db.execute(stmt).all()
+    finally:
+        db.close()
+
+    records = []
+    for row in rows:
+        record = {
+            "id": row[0],
+            "user_id": row[1],
+            "created_at": row[2],
+            "left_champion": row[3],
+            "right_champion": row[4],
+            "winner": row[5],
+            "turn_count": row[6],
+        }
+        if history != "none":
+            record["history"] = _history(row[7], row[8], history)
+        record["cursor"] = encode_cursor(row[2], row[0])
+        records.append(record)
+    next_cursor = records[-1]["cursor"] if len(records) == page_size else None
+    return records, next_cursor
+
+
+def iter_battle_logs(session_factory=SessionLocal, after: Optional[str] = None,
+                     limit: Optional[int] = None, page_size: int = PAGE_SIZE,
+                     **filters) -> Iterator[Dict[str, Any]]:
+    """
+    전투 로그를 한 건씩 생성 (페이지마다 새 세션, 메모리는 페이지 하나 분량)
+    각 레코드의 cursor를 after로 넘기면 그 다음부터 이어서 내보냄
+    filters: fetch_page의 user_id/champion/since/until/history
+    """
+    emitted = 0
+    while limit is None or emitted < limit:
+        size = page_size if limit is None else min(page_size, limit - emitted)
+        records, after = fetch_page(session_factory, after, page_size=size, **filters)
+        yield from records
+        emitted += len(records)
+        if after is None:
+            return
+
+
+def to_ndjson(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
@@ -0,0 +1,167 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+from src.common.database import SessionLocal
+from src.common.metrics import REGISTRY
+from src.db_manager import _battle_log_row, record_battle_stats
+from src.models.battle_log import BattleLog
+
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+# on_error 없이 보관할 수 있는 실패 행 수 (DB 장애가 길어져도 메모리는 이만큼만 사용)
+MAX_FAILED_ROWS = 1000
+
+BATTLE_LOGS_FAILED = REGISTRY.counter(
+    "leagueslg_battle_logs_failed_total", "재시도 후에도 저장하지 못한 전투 로그 수")
+BATTLE_LOGS_DROPPED = REGISTRY.counter(
+    "leagueslg_battle_logs_dropped_total", "failed_rows 상한을 넘어 버려진 전투 로그 수")
+
+
+class BattleLogWriter:
+    """
+    전투 로그 write-behind 큐
+    - submit()은 행을 만들어 큐에 넣고 바로 반환 (DB 커밋을 기다리지 않음)
+    - 백그라운드 스레드가 max_batch개가 모이거나 flush_interval초가 지나면 한 트랜잭션으로 저장
+    - 큐가 가득 차면 submit()이 대기 (timeout을 주면 queue.Full) → 생산 속도를 DB 속도에 맞춤
+    - close()는 남은 로그를 모두 저장한 뒤 종료. 비정상 종료 시 유실은 최대 flush_interval 분량
+    - 저장에 실패한 배치는 retries번까지 재시도하고, 그래도 실패하면 on_error(rows, 예외)로 넘김
+      (on_error가 없으면 최근 max_failed_rows건만 failed_rows에 보관, 넘친 건은 dropped로 집계)
+    """
+    def __init__(self, session_factory=SessionLocal, max_batch: int = 500,
+                 flush_interval: float = 0.2, max_queue: int = 10000, retries: int = 3,
+                 retry_delay: float = 0.05,
+                 on_error: Optional[Callable[[List[BattleLog], Exception], None]] = None,
+                 max_failed_rows: int = MAX_FAILED_ROWS):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.on_error = on_error
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+        self.dropped = 0
+        self.failed_rows: Deque[BattleLog] = deque(maxlen=max_failed_rows)
+        self._closed = False
+        # _closed 확인과 put을 묶어서, close()의 _STOP 뒤에 행이 들어가지 않도록 함
+        self._submit_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="battle-log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, user_id: int, battle, timeout: Optional[float] = None):
+        """
+        전투 결과를 저장 대기열에 추가.
+        전투 기록은 이 시점에 인코딩하므로 이후 battle 객체가 바뀌어도 영향 없음
+        """
+        row = _battle_log_row(user_id, battle)
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("BattleLogWriter is closed")
+            self._queue.put(row, timeout=timeout)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self):
+        """지금까지 submit된 로그가 모두 커밋될 때까지 대기"""
+        self._queue.join()
+
+    def close(self):
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def __enter__(self) -> "BattleLogWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # -------------------------
+    # 백그라운드 스레드
+    # -------------------------
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            batch: List[BattleLog] = []
+            stop = first is _STOP
+            if not stop:
+                batch.append(first)
+
+            # 첫 행 이후 flush_interval 동안 max_batch까지 모음
+            deadline = time.monotonic() + self.flush_interval
+            while not stop and len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            # 종료 요청이면 큐에 남은 것까지 모두 저장
+            if stop:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not _STOP:
+                        batch.append(item)
+                    else:
+                        self._queue.task_done()
+
+            for start in range(0, len(batch), self.max_batch):
+                self._write(batch[start:start + self.max_batch])
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, rows: List[BattleLog]):
+        for attempt in range(self.retries + 1):
+            db = self.session_factory()
+            try:
+                db.add_all(rows)
+                record_battle_stats(db, rows)
+                db.commit()
+                self.written += len(rows)
+                self.batches += 1
+                return
+            except Exception as e:
+                db.rollback()
+                error = e
+                logger.warning("battle log batch of %d failed (attempt %d/%d): %s",
+                               len(rows), attempt + 1, self.retries + 1, e)
+            finally:
+                db.close()
+            if attempt < self.retries:
+                time.sleep(self.retry_delay * (2 ** attempt))
+
+        self.failed += len(rows)
+        BATTLE_LOGS_FAILED.inc(len(rows))
+        logger.error("%d battle logs not saved after %d attempts", len(rows), self.retries + 1, exc_info=error)
+        if self.on_error is None:
+            overflow = max(0, len(self.failed_rows) + len(rows) - self.failed_rows.maxlen)
+            self.failed_rows.extend(rows)
+            if overflow:
+                self.dropped += overflow
+                BATTLE_LOGS_DROPPED.inc(overflow)
+                logger.error("dropped %d failed battle logs (failed_rows is full)", overflow)
+            return
+        try:
+            self.on_error(rows, error)
+        except Exception:
+            logger.exception("BattleLogWriter.on_error failed")
@@ -0,0 +1,112 @@
+import json
+import struct
+import zlib
+from typing import Dict, List
+import numpy as np
+
+# 버전 바이트 (포맷을 바꾸면 올리고 COLUMNS_BY_VERSION에 추가, 이전 버전도 계속 디코딩)
+CODEC_VERSION = 2
+TABLE_HEADER = struct.Struct("<HI")   # 문자열 테이블 JSON 길이, 행 수
+
+# 버전별 컬럼 순서와 dtype (행 수 n개씩 연속 저장)
+COLUMNS_BY_VERSION = {
+    # v1: 데미지/HP float32 (소수 값은 근삿값으로만 복원됨)
+    1: [
+        ("turn", np.uint16),
+        ("actor", np.uint8),
+        ("target", np.uint8),
+        ("action", np.uint16),
+        ("damage", np.float32),
+        ("left_hp", np.float32),
+        ("right_hp", np.float32),
+    ],
+    # v2: 데미지/HP float64 (파이썬 float 그대로 왕복)
+    2: [
+        ("turn", np.uint16),
+        ("actor", np.uint8),      # names 테이블 인덱스
+        ("target", np.uint8),     # names 테이블 인덱스
+        ("action", np.uint16),    # actions 테이블 인덱스
+        ("damage", np.float64),
+        ("left_hp", np.float64),
+        ("right_hp", np.float64),
+    ],
+}
+COLUMNS = COLUMNS_BY_VERSION[CODEC_VERSION]
+
+
+def encode_history(history: List[Dict]) -> bytes:
+    """
+    Battle.history(dict 리스트)를 컬럼형 바이너리로 인코딩
+    [버전 1B] + zlib([테이블 헤더][names/actions JSON][컬럼 배열들])
+    챔피언 이름과 행동 이름은 문자열 테이블 인덱스로 치환합니다.
+    """
+    names: List[str] = []
+    actions: List[str] = []
+    name_index: Dict[str, int] = {}
+    action_index: Dict[str, int] = {}
+
+    def index_of(table: List[str], index: Dict[str, int], value: str) -> int:
+        if value not in index:
+            index[value] = len(table)
+            table.append(value)
+        return index[value]
+
+    columns = {key: [] for key, _ in COLUMNS}
+    for row in history:
+        columns["turn"].append(row["turn"])
+        columns["actor"].append(index_of(names, name_index, row["actor"]))
+        columns["target"].append(index_of(names, name_index, row["target"]))
+        columns["action"].append(index_of(actions, action_index, row["action"]))
+        columns["damage"].append(row.get("damage") or 0)
+        columns["left_hp"].append(row["left_hp"])
+        columns["right_hp"].append(row["right_hp"])
+
+    tables = json.dumps({"names": names, "actions": actions}, ensure_ascii=False,
+                        separators=(",", ":")).encode("utf-8")
+    body = [TABLE_HEADER.pack(len(tables), len(history)), tables]
+    body.extend(np.asarray(columns[key], dtype=dtype).tobytes() for key, dtype in COLUMNS)
+    return bytes([CODEC_VERSION]) + zlib.compress(b"".join(body), 6)
+
+
+def decode_columns(blob: bytes) -> Dict[str, object]:
+    """
+    인코딩된 전투 기록을 컬럼 배열 그대로 반환 (전체 dict 변환 없이 집계할 때 사용)
+    {"names": [...], "actions": [...], "turn": ndarray, ...}
+    """
+    version = blob[0]
+    columns = COLUMNS_BY_VERSION.get(version)
+    if columns is None:
+        raise ValueError(f"Unsupported battle history version: {version}")
+
+    raw = zlib.decompress(blob[1:])
+    table_len, count = TABLE_HEADER.unpack_from(raw, 0)
+    offset = TABLE_HEADER.size
+    result = json.loads(raw[offset:offset + table_len].decode("utf-8"))
+    offset += table_len
+    for key, dtype in columns:
+        size = np.dtype(dtype).itemsize * count
+        result[key] = np.frombuffer(raw, dtype=dtype, count=count, offset=offset)
+        offset += size
+    return result
+
+
+def decode_history(blob: bytes) -> List[Dict]:
+    """encode_history의 역변환 (Battle.history와 같은 dict 리스트)"""
+    cols = decode_columns(blob)
+    names, actions = cols["names"], cols["actions"]
+    return [
+        {
+            "turn": int(turn),
+            "actor": names[actor],
+            "target": names[target],
+            "action": actions[action],
+            "damage": float(damage),
+            "left_hp": float(left_hp),
+            "right_hp": float(right_hp),
+        }
+        for turn, actor, target, action, damage, left_hp, right_hp in zip(
+            cols["turn"].tolist(), cols["actor"].tolist(), cols["target"].tolist(),
+            cols["action"].tolist(), cols["damage"].tolist(),
+            cols["left_hp"].tolist(), cols["right_hp"].tolist(),
+        )
+    ]
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 import os
 
@@ -6,12 +6,60 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 DB_DIR = os.path.join(BASE_DIR, "db")
 os.makedirs(DB_DIR, exist_ok=True)
 
-DATABASE_URL = f"sqlite:///{os.path.join(DB_DIR, 'game_data.db')}"
+# 프로젝트 전체가 공유하는 단일 DB 설정 (db/database.py는 이 모듈을 다시 내보냄)
+DATABASE_URL = os.getenv(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(DB_DIR, 'game_data.db')}"
+)
+
+# SQLite 연결 프로파일 (연결마다 적용)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",        # 읽기와 쓰기가 서로 막지 않음
+    "synchronous": "NORMAL",      # WAL에서는 체크포인트 시에만 fsync (크래시 시 DB 손상 없음)
+    "cache_size": -64000,         # 페이지 캐시 약 64MB (음수 = KB 단위)
+    "mmap_size": 268435456,       # 256MB 메모리 매핑 읽기
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,         # 잠금 대기 (ms)
+}
+
+
+def apply_sqlite_profile(bind, pragmas: dict = SQLITE_PRAGMAS):
+    """엔진의 새 연결마다 PRAGMA 프로파일 적용 (SQLite가 아니면 무시)"""
+    if bind.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(bind, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        for key, value in pragmas.items():
+            cursor.execute(f"PRAGMA {key}={value}")
+        cursor.close()
+
 
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False}
+    if DATABASE_URL.startswith("sqlite")
+    else {}
 )
+apply_sqlite_profile(engine)
 
 SessionLocal = sessionmaker(bind=engine)
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+
+def get_db():
+    """
+    FastAPI 의존성 주입용 DB 세션
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def init_db(bind=None):
+    """스키마를 최신 버전으로 마이그레이션 (src/common/migrations.py)"""
+    from src.common.migrations import migrate
+    return migrate(bind or engine)
@@ -112,7 +112,8 @@ MAP_HTML_TEMPLATE = """
 """
 
 def visualize_map(world_map, output_path="reports/world_map.html", my_id="Player1"):
-    tiles_html = ""
+    # 큰 맵에서도 선형 시간이 되도록 조각을 모아 한 번에 join
+    tile_parts = []
     res_icons = {"FOOD": "🌾", "WOOD": "🌲", "IRON": "⚒️", "STONE": "💎"}
     
     for y in range(world_map.height):
@@ -142,8 +143,9 @@ def visualize_map(world_map, output_path="reports/world_map.html", my_id="Player
             if tile.res_type.name != "NONE": title += f" - {tile.res_type.value} Lv.{tile.level}"
             if tile.owner_id: title += f" (소유: {tile.owner_id})"
 
-            tiles_html += f'<div class="{" ".join(classes)}" title="{title}">{content}</div>'
+            tile_parts.append(f'<div class="{" ".join(classes)}" title="{title}">{content}</div>')
 
+    tiles_html = "".join(tile_parts)
     html = MAP_HTML_TEMPLATE.format(width=world_map.width, height=world_map.height, tiles_html=tiles_html)
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
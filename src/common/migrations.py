@@ -0,0 +1,152 @@
+from datetime import datetime
+from typing import Callable, List, Tuple
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+# 적용 이력 테이블
+VERSION_TABLE = "schema_migrations"
+
+
+def _add_missing_columns(conn: Connection, table: str, columns: List[Tuple[str, str]]):
+    existing = {c["name"] for c in inspect(conn).get_columns(table)}
+    for name, col_type in columns:
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {col_type}"))
+
+
+# -------------------------
+# 마이그레이션 (버전 순서대로 한 번씩만 적용, 이미 배포된 항목은 수정 금지)
+# -------------------------
+# v1 시점의 스키마 그대로 고정 (모델이 바뀌어도 v1의 결과는 변하지 않도록, 변경은 새 마이그레이션으로)
+_BASELINE_DDL = [
+    "CREATE TABLE IF NOT EXISTS users ("
+    "id INTEGER NOT NULL, username VARCHAR NOT NULL, "
+    "PRIMARY KEY (id), UNIQUE (username))",
+    "CREATE TABLE IF NOT EXISTS user_champions ("
+    "id INTEGER NOT NULL, user_id INTEGER NOT NULL, champion_key VARCHAR NOT NULL, level INTEGER, exp INTEGER, "
+    "PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES users (id))",
+    "CREATE TABLE IF NOT EXISTS battle_logs ("
+    "id INTEGER NOT NULL, user_id INTEGER NOT NULL, left_champion VARCHAR NOT NULL, "
+    "right_champion VARCHAR NOT NULL, winner VARCHAR NOT NULL, turn_count INTEGER NOT NULL, "
+    "history_json TEXT, history_blob BLOB, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, "
+    "PRIMARY KEY (id))",
+    "CREATE TABLE IF NOT EXISTS battle_turns ("
+    "id INTEGER NOT NULL, battle_id INTEGER NOT NULL, seq INTEGER NOT NULL, turn INTEGER NOT NULL, "
+    "actor VARCHAR NOT NULL, target VARCHAR NOT NULL, action VARCHAR NOT NULL, damage FLOAT NOT NULL, "
+    "left_hp FLOAT NOT NULL, right_hp FLOAT NOT NULL, "
+    "PRIMARY KEY (id), FOREIGN KEY(battle_id) REFERENCES battle_logs (id))",
+    "CREATE INDEX IF NOT EXISTS ix_battle_turns_action ON battle_turns (action)",
+    "CREATE INDEX IF NOT EXISTS ix_battle_turns_battle_id ON battle_turns (battle_id)",
+]
+
+
+def _m001_baseline(conn: Connection):
+    """기존 테이블(users, user_champions 등)은 유지하고 없는 테이블만 생성"""
+    for statement in _BASELINE_DDL:
+        conn.execute(text(statement))
+
+
+def _m002_battle_history_blob(conn: Connection):
+    """battle_logs에 압축 전투 기록 컬럼 추가 (history_json만 있던 DB)"""
+    _add_missing_columns(conn, "battle_logs", [("history_blob", "BLOB")])
+
+
+def _m003_query_indexes(conn: Connection):
+    """get_user_champions/update_champion_data_by_key, 유저별 최근 전투 조회용 인덱스"""
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_user_champions_user_key "
+        "ON user_champions (user_id, champion_key)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_battle_logs_user_created "
+        "ON battle_logs (user_id, created_at)"
+    ))
+
+
+def _m004_battle_stats(conn: Connection):
+    """전적 집계 테이블 생성 후 기존 battle_logs로 채움 (승자/턴 수 컬럼만 사용, JSON 파싱 없음)"""
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS matchup_stats_daily ("
+        "day VARCHAR NOT NULL, champion VARCHAR NOT NULL, opponent VARCHAR NOT NULL, "
+        "wins INTEGER NOT NULL, losses INTEGER NOT NULL, draws INTEGER NOT NULL DEFAULT 0, "
+        "total_turns INTEGER NOT NULL, "
+        "PRIMARY KEY (day, champion, opponent))"
+    ))
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS turn_histogram_daily ("
+        "day VARCHAR NOT NULL, turns INTEGER NOT NULL, count INTEGER NOT NULL, "
+        "PRIMARY KEY (day, turns))"
+    ))
+
+    # 미러전은 1승 1패, 승자가 어느 쪽도 아닌 전투(무승부/누락)는 무승부로 집계
+    conn.execute(text(
+        "INSERT INTO matchup_stats_daily (day, champion, opponent, wins, losses, draws, total_turns) "
+        "SELECT day, champion, opponent, SUM(result = 1), SUM(result = -1), SUM(result = 0), SUM(turns) FROM ("
+        "  SELECT date(created_at) AS day, left_champion AS champion, right_champion AS opponent,"
+        "         CASE WHEN winner = left_champion THEN 1 WHEN winner = right_champion THEN -1 ELSE 0 END"
+        "         AS result, turn_count AS turns FROM battle_logs"
+        "  UNION ALL"
+        "  SELECT date(created_at), right_champion, left_champion,"
+        "         CASE WHEN winner = left_champion THEN -1 WHEN winner = right_champion THEN 1 ELSE 0 END,"
+        "         turn_count FROM battle_logs"
+        ") GROUP BY day, champion, opponent"
+    ))
+    conn.execute(text(
+        "INSERT INTO turn_histogram_daily (day, turns, count) "
+        "SELECT date(created_at), turn_count, COUNT(*) FROM battle_logs GROUP BY 1, 2"
+    ))
+
+
+def _m005_user_rating(conn: Connection):
+    """랭크전 레이팅 컬럼 (기존 유저는 기본값 1500)"""
+    _add_missing_columns(conn, "users", [("rating", "FLOAT NOT NULL DEFAULT 1500")])
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_rating ON users (rating)"))
+
+
+def _m006_export_index(conn: Connection):
+    """전체 전투 로그 내보내기의 (created_at, id) keyset 순회용 인덱스"""
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_battle_logs_created ON battle_logs (created_at, id)"))
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "baseline", _m001_baseline),
+    (2, "battle_history_blob", _m002_battle_history_blob),
+    (3, "query_indexes", _m003_query_indexes),
+    (4, "battle_stats", _m004_battle_stats),
+    (5, "user_rating", _m005_user_rating),
+    (6, "export_index", _m006_export_index),
+]
+
+
+def current_version(bind) -> int:
+    with bind.connect() as conn:
+        if not inspect(conn).has_table(VERSION_TABLE):
+            return 0
+        return conn.execute(text(f"SELECT COALESCE(MAX(version), 0) FROM {VERSION_TABLE}")).scalar()
+
+
+def migrate(bind, target: int = None) -> List[int]:
+    """
+    bind(엔진)의 스키마를 target 버전(기본: 최신)까지 올림.
+    마이그레이션마다 별도 트랜잭션으로 적용하고 schema_migrations에 기록합니다.
+    반환값: 이번에 적용된 버전 목록
+    """
+    with bind.begin() as conn:
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} ("
+            "version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at TEXT NOT NULL)"
+        ))
+
+    version = current_version(bind)
+    applied = []
+    for number, name, step in MIGRATIONS:
+        if number <= version or (target is not None and number > target):
+            continue
+        with bind.begin() as conn:
+            step(conn)
+            conn.execute(
+                text(f"INSERT INTO {VERSION_TABLE} (version, name, applied_at) VALUES (:v, :n, :t)"),
+                {"v": number, "n": name, "t": datetime.now().isoformat()},
+            )
+        applied.append(number)
+    return applied
@@ -0,0 +1,321 @@
+import json
+import os
+import struct
+from datetime import datetime
+from typing import Optional, Tuple
+import numpy as np
+from src.models.world_map import WorldMap, WorldMapListener
+from src.models.tile import Tile
+from src.models.building import Building, BuildingType
+from src.models.army import Army
+from src.models.march import March, MarchStatus
+from src.logic.map_manager import MapManager, MapManagerListener
+from src.factories.champion_factory import create_champion
+
+SNAPSHOT_VERSION = 1
+LOG_MAGIC = b"LSLGLOG"
+LOG_HEADER = struct.Struct("<7sBQ")      # magic, version, generation
+RECORD_HEADER = struct.Struct("<BI")      # 레코드 종류, 페이로드 길이
+TILE_OWNER = struct.Struct("<iii")        # x, y, 내구도 (+ 소유주 utf-8)
+BUILDING_ROOT = struct.Struct("<Bii")     # 건물 종류 인덱스, 루트 x, y (+ 소유주 utf-8)
+
+# 델타 레코드 종류
+REC_TILE_OWNER = 1
+REC_BUILDING = 2
+REC_ARMY = 3
+REC_MARCH_START = 4
+REC_MARCH_END = 5
+
+BUILDING_TYPES = list(BuildingType)
+
+
+def _army_to_dict(army: Army) -> dict:
+    champ = army.champion
+    return {
+        "id": army.id,
+        "owner": army.owner_id,
+        "champion": champ.name,
+        "level": champ.level,
+        "exp": champ.exp,
+        "max_hp": champ.max_hp,
+        "hp": champ.current_hp,
+        "home": list(army.home_pos),
+        "pos": [army.pos_x, army.pos_y],
+        "status": army.status,
+    }
+
+
+def _march_to_dict(march: March) -> dict:
+    return {
+        "id": march.id,
+        "army": march.army.id,
+        "user": march.user_id,
+        "start": list(march.start_pos),
+        "target": list(march.target_pos),
+        "status": march.status.name,
+        "start_time": march.start_time.timestamp(),
+        "arrival_time": march.arrival_time.timestamp(),
+    }
+
+
+class WorldStore(WorldMapListener, MapManagerListener):
+    """
+    월드 상태 영속화
+    - 스냅샷: 그리드 배열(npz 압축) + 건물/부대/행군 메타데이터(JSON)
+    - 델타 로그: 스냅샷 이후의 타일 소유권, 건물, 부대, 행군 변경을 추가 전용 바이너리 레코드로 기록
+    재시작 시 load()가 스냅샷을 읽고 같은 세대(generation)의 로그만 재생합니다.
+    """
+    def __init__(self, directory: str = "db/world"):
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, "world.snapshot")
+        self.log_path = os.path.join(directory, "world.delta.log")
+        os.makedirs(directory, exist_ok=True)
+
+        self.world_map: Optional[WorldMap] = None
+        self.map_manager: Optional[MapManager] = None
+        self.generation = 0
+        self._log = None
+
+    # -------------------------
+    # 연결 / 해제
+    # -------------------------
+    def attach(self, world_map: WorldMap, map_manager: MapManager, resume_log: bool = False):
+        """
+        변경 알림을 구독하고 델타 로그 기록 시작.
+        resume_log가 아니면 기준점이 되는 스냅샷을 먼저 저장합니다.
+        """
+        self.world_map = world_map
+        self.map_manager = map_manager
+        world_map.add_listener(self)
+        map_manager.add_listener(self)
+        if resume_log:
+            self._open_log(truncate=False)
+        else:
+            self.save_snapshot()
+
+    def close(self):
+        if self._log:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._log.close()
+            self._log = None
+        if self.world_map:
+            self.world_map.remove_listener(self)
+        if self.map_manager:
+            self.map_manager.remove_listener(self)
+
+    def _open_log(self, truncate: bool):
+        if truncate:
+            self._log = open(self.log_path, "wb")
+            self._log.write(LOG_HEADER.pack(LOG_MAGIC, SNAPSHOT_VERSION, self.generation))
+            self._log.flush()
+        else:
+            self._log = open(self.log_path, "ab")
+
+    # -------------------------
+    # 스냅샷
+    # -------------------------
+    def save_snapshot(self):
+        """현재 상태를 새 세대의 스냅샷으로 저장하고 델타 로그를 비움"""
+        world_map, manager = self.world_map, self.map_manager
+        arrays, owners = world_map.to_arrays()
+        durability = np.array(
+            [[t.current_durability for t in row] for row in world_map.grid], dtype=np.int32
+        )
+
+        buildings, stationed = [], []
+        for row in world_map.grid:
+            for tile in row:
+                if tile.is_building_root:
+                    b = tile.building
+                    buildings.append({
+                        "id": b.id, "type": b.type.name, "owner": b.owner_id,
+                        "root": list(b.root_pos), "level": b.level, "hp": b.current_hp,
+                    })
+                if tile.occupying_army and tile.occupying_army.id in manager.armies:
+                    stationed.append([tile.x, tile.y, tile.occupying_army.id])
+
+        self.generation += 1
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "generation": self.generation,
+            "saved_at": datetime.now().timestamp(),
+            "owners": owners,
+            "buildings": buildings,
+            "armies": [_army_to_dict(a) for a in manager.armies.values()],
+            "marches": [_march_to_dict(m) for m in manager.active_marches],
+            "stationed": stationed,
+        }
+        meta_bytes = np.frombuffer(json.dumps(meta, ensure_ascii=False).encode("utf-8"), dtype=np.uint8)
+
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, durability=durability, meta=meta_bytes, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # 스냅샷에 반영된 로그는 폐기하고 새 세대 로그 시작
+        if self._log:
+            self._log.close()
+        self._open_log(truncate=True)
+
+    def load(self) -> Optional[Tuple[WorldMap, MapManager]]:
+        """스냅샷 + 로그 재생으로 월드를 복원하고 이후 변경을 기록하도록 연결. 스냅샷이 없으면 None"""
+        if not os.path.exists(self.snapshot_path):
+            return None
+        if self._log:
+            self._log.close()
+            self._log = None
+
+        with np.load(self.snapshot_path) as data:
+            meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            arrays = {k: data[k] for k in ("category", "res_type", "level", "owner")}
+            durability = data["durability"]
+
+        world_map = WorldMap.from_arrays(arrays, meta["owners"])
+        for y, row in enumerate(world_map.grid):
+            for tile, value in zip(row, durability[y].tolist()):
+                tile.current_durability = value
+
+        for b in meta["buildings"]:
+            building = Building(b["id"], BuildingType[b["type"]], b["owner"], tuple(b["root"]))
+            building.level = b["level"]
+            building.current_hp = b["hp"]
+            for x, y in building.occupied_tiles:
+                world_map.get_tile(x, y).building = building
+            world_map.get_tile(*building.root_pos).is_building_root = True
+
+        manager = MapManager(world_map)
+        for record in meta["armies"]:
+            self._apply_army(manager, record)
+        for x, y, army_id in meta["stationed"]:
+            world_map.get_tile(x, y).occupying_army = manager.armies[army_id]
+        for record in meta["marches"]:
+            self._apply_march_start(manager, record)
+
+        self.generation = meta["generation"]
+        resume_log = self._replay_log(world_map, manager)
+        self.attach(world_map, manager, resume_log=resume_log)
+        return world_map, manager
+
+    # -------------------------
+    # 델타 로그
+    # -------------------------
+    def _append(self, kind: int, payload: bytes):
+        if self._log is None:
+            return
+        self._log.write(RECORD_HEADER.pack(kind, len(payload)))
+        self._log.write(payload)
+        self._log.flush()
+
+    def on_tile_owner_changed(self, tile: Tile, old_owner: Optional[str]):
+        owner = (tile.owner_id or "").encode("utf-8")
+        self._append(REC_TILE_OWNER, TILE_OWNER.pack(tile.x, tile.y, tile.current_durability) + owner)
+
+    def on_building_placed(self, building: Building):
+        root_x, root_y = building.root_pos
+        payload = BUILDING_ROOT.pack(BUILDING_TYPES.index(building.type), root_x, root_y)
+        self._append(REC_BUILDING, payload + building.owner_id.encode("utf-8"))
+
+    def on_army_changed(self, army: Army):
+        self._append(REC_ARMY, json.dumps(_army_to_dict(army), ensure_ascii=False).encode("utf-8"))
+
+    def on_march_started(self, march: March):
+        self._append(REC_MARCH_START, json.dumps(_march_to_dict(march)).encode("utf-8"))
+
+    def on_march_finished(self, march: March):
+        self._append(REC_MARCH_END, march.id.encode("utf-8"))
+
+    def _replay_log(self, world_map: WorldMap, manager: MapManager) -> bool:
+        """현재 세대의 로그를 재생. 로그를 이어서 기록해도 되면 True"""
+        if not os.path.exists(self.log_path):
+            return False
+        with open(self.log_path, "rb") as f:
+            data = f.read()
+        if len(data) < LOG_HEADER.size:
+            return False
+        magic, _, generation = LOG_HEADER.unpack_from(data, 0)
+        if magic != LOG_MAGIC or generation != self.generation:
+            return False  # 이미 스냅샷에 반영된 이전 세대의 로그
+
+        offset = LOG_HEADER.size
+        end = len(data)
+        while offset + RECORD_HEADER.size <= end:
+            kind, length = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            if start + length > end:
+                break  # 기록 도중 중단된 마지막 레코드는 버림
+            self._apply_record(world_map, manager, kind, data[start:start + length])
+            offset = start + length
+
+        # 잘린 꼬리가 있으면 잘라내어 이후 레코드가 올바르게 이어지도록 함
+        if offset != end:
+            with open(self.log_path, "r+b") as f:
+                f.truncate(offset)
+        return True
+
+    def _apply_record(self, world_map: WorldMap, manager: MapManager, kind: int, payload: bytes):
+        if kind == REC_TILE_OWNER:
+            x, y, durability = TILE_OWNER.unpack_from(payload)
+            owner = payload[TILE_OWNER.size:].decode("utf-8") or None
+            tile = world_map.get_tile(x, y)
+            tile.set_owner(owner)
+            tile.current_durability = durability
+            tile.guard_army = None
+        elif kind == REC_BUILDING:
+            type_index, root_x, root_y = BUILDING_ROOT.unpack_from(payload)
+            owner = payload[BUILDING_ROOT.size:].decode("utf-8")
+            world_map.place_building(BUILDING_TYPES[type_index], owner, (root_x, root_y))
+        elif kind == REC_ARMY:
+            self._apply_army(manager, json.loads(payload))
+        elif kind == REC_MARCH_START:
+            self._apply_march_start(manager, json.loads(payload))
+        elif kind == REC_MARCH_END:
+            march_id = payload.decode("utf-8")
+            manager.active_marches = [m for m in manager.active_marches if m.id != march_id]
+
+    @staticmethod
+    def _apply_army(manager: MapManager, record: dict):
+        army = manager.armies.get(record["id"])
+        if army is None:
+            champ = create_champion(record["champion"])
+            army = Army(record["id"], record["owner"], champ)
+            manager.register_army(army)
+
+        champ = army.champion
+        champ.level = record["level"]
+        champ.exp = record["exp"]
+        champ.recalculate_stats()
+        champ.max_hp = record["max_hp"]
+        champ.current_hp = record["hp"]
+        army.home_pos = tuple(record["home"])
+
+        # 주둔 정보는 MapManager 동작과 동일하게 위치/상태로부터 갱신
+        old_tile = None
+        if army.pos_x is not None:
+            old_tile = manager.world_map.get_tile(army.pos_x, army.pos_y)
+        if old_tile and old_tile.occupying_army is army:
+            old_tile.occupying_army = None
+
+        pos_x, pos_y = record["pos"]
+        if pos_x is not None:
+            army.set_position(pos_x, pos_y)
+        army.status = record["status"]
+        if army.status == "STATIONED" and pos_x is not None:
+            manager.world_map.get_tile(pos_x, pos_y).occupying_army = army
+
+    @staticmethod
+    def _apply_march_start(manager: MapManager, record: dict):
+        army = manager.armies[record["army"]]
+        status = army.status
+        march = March(record["user"], army, tuple(record["start"]), tuple(record["target"]))
+        army.status = status  # 부대 상태는 부대 레코드를 따름
+        march.id = record["id"]
+        march.status = MarchStatus[record["status"]]
+        march.start_time = datetime.fromtimestamp(record["start_time"])
+        march.arrival_time = datetime.fromtimestamp(record["arrival_time"])
+        manager.active_marches.append(march)
+
+    def __repr__(self):
+        return f"WorldStore({self.directory}, generation={self.generation})"
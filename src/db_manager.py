@@ -1,9 +1,234 @@
-from typing import List, Dict, Any
+from collections import Counter
+from datetime import datetime, timezone, timedelta
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from sqlalchemy import update, insert, bindparam, func
+from sqlalchemy.dialects import postgresql, sqlite
 from src.common.database import SessionLocal
+from src.common.battle_codec import encode_history, decode_history
+from src.common.metrics import REGISTRY
 from src.models.user import User
 from src.models.user_champion import UserChampion
 from src.models.battle_log import BattleLog
+from src.models.battle_turn import BattleTurn
+from src.models.battle_stat import MatchupDailyStat, TurnHistogramDaily
+import functools
 import json
+import time
+
+DB_OPERATION_SECONDS = REGISTRY.histogram(
+    "leagueslg_db_operation_seconds", "DatabaseManager 연산(세션 열기~닫기) 소요 시간", ["op"]
+)
+
+
+def _timed(fn):
+    """DatabaseManager 메서드 소요 시간을 op 라벨로 기록 (라벨 자식은 데코레이트 시 한 번만 생성)"""
+    histogram = DB_OPERATION_SECONDS.labels(fn.__name__)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+    return wrapper
+
+
+def _battle_log_row(user_id: int, battle) -> BattleLog:
+    return BattleLog(
+        # 집계 일자가 저장(플러시) 시각이 아니라 전투 시각을 따르도록 행을 만들 때 찍음 (UTC, CURRENT_TIMESTAMP와 같은 기준)
+        created_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        user_id=user_id,
+        left_champion=battle.left.name,
+        right_champion=battle.right.name,
+        # 승자 없음(무승부)은 빈 문자열 (winner 컬럼은 NOT NULL)
+        winner=battle.winner.name if battle.winner is not None else "",
+        turn_count=battle.turn,
+        history_blob=encode_history(battle.history),
+    )
+
+
+def _utc_day(moment: Optional[datetime] = None) -> str:
+    return (moment or datetime.now(timezone.utc)).strftime("%Y-%m-%d")
+
+
+# ON CONFLICT DO UPDATE를 지원하는 방언별 insert 구문
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _upsert_insert(db, table):
+    dialect = db.get_bind().dialect.name
+    try:
+        return _UPSERT_INSERTS[dialect](table)
+    except KeyError:
+        raise NotImplementedError(f"battle stats UPSERT is not supported on {dialect!r}") from None
+
+
+def record_battle_stats(db, logs: Iterable[BattleLog]):
+    """
+    전적 집계 테이블 갱신 (호출한 세션의 트랜잭션에 포함됨)
+    여러 로그를 먼저 메모리에서 합친 뒤 키별 UPSERT 한 번씩 실행
+    집계 일자는 각 로그의 created_at 기준 (자정을 넘겨 플러시된 배치도 전투한 날짜로 집계)
+    """
+    matchups: Counter = Counter()
+    turns: Counter = Counter()
+    for log in logs:
+        day = _utc_day(log.created_at)
+        # 미러전은 왼쪽 승리로 1승 1패, 승자가 어느 쪽도 아니면(무승부/누락) 양쪽 무승부
+        if log.winner == log.left_champion:
+            left_result, right_result = "wins", "losses"
+        elif log.winner == log.right_champion:
+            left_result, right_result = "losses", "wins"
+        else:
+            left_result = right_result = "draws"
+        matchups[(day, log.left_champion, log.right_champion, left_result)] += 1
+        matchups[(day, log.right_champion, log.left_champion, right_result)] += 1
+        matchups[(day, log.left_champion, log.right_champion, "total_turns")] += log.turn_count
+        matchups[(day, log.right_champion, log.left_champion, "total_turns")] += log.turn_count
+        turns[(day, log.turn_count)] += 1
+    if not turns:
+        return
+
+    rows: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    for (d, champion, opponent, field), value in matchups.items():
+        row = rows.setdefault((d, champion, opponent), {
+            "day": d, "champion": champion, "opponent": opponent,
+            "wins": 0, "losses": 0, "draws": 0, "total_turns": 0,
+        })
+        row[field] += value
+
+    stmt = _upsert_insert(db, MatchupDailyStat.__table__)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["day", "champion", "opponent"],
+        set_={
+            "wins": MatchupDailyStat.__table__.c.wins + stmt.excluded.wins,
+            "losses": MatchupDailyStat.__table__.c.losses + stmt.excluded.losses,
+            "draws": MatchupDailyStat.__table__.c.draws + stmt.excluded.draws,
+            "total_turns": MatchupDailyStat.__table__.c.total_turns + stmt.excluded.total_turns,
+        },
+    ), list(rows.values()))
+
+    stmt = _upsert_insert(db, TurnHistogramDaily.__table__)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["day", "turns"],
+        set_={"count": TurnHistogramDaily.__table__.c.count + stmt.excluded.count},
+    ), [{"day": d, "turns": t, "count": c} for (d, t), c in turns.items()])
+
+
+def _add_battle_log(db, user_id: int, battle, normalize: bool = False) -> BattleLog:
+    """전투 로그 추가 (+ 전적 집계 갱신). normalize=True면 battle_turns 테이블에도 행 단위로 저장"""
+    log = _battle_log_row(user_id, battle)
+    db.add(log)
+    record_battle_stats(db, [log])
+    if normalize and battle.history:
+        db.flush()  # log.id 확보
+        db.execute(insert(BattleTurn.__table__), [
+            {
+                "battle_id": log.id,
+                "seq": seq,
+                "turn": row["turn"],
+                "actor": row["actor"],
+                "target": row["target"],
+                "action": row["action"],
+                "damage": row.get("damage") or 0,
+                "left_hp": row["left_hp"],
+                "right_hp": row["right_hp"],
+            }
+            for seq, row in enumerate(battle.history)
+        ])
+    return log
+
+
+def _read_history(log: BattleLog) -> List[Dict[str, Any]]:
+    """
+    전투 기록 디코딩. 구형(JSON) 행이면 압축 포맷으로 변환해 두고(지연 마이그레이션) JSON은 비움.
+    변경 사항은 호출한 세션이 커밋해야 반영됩니다.
+    """
+    if log.history_blob is None:
+        history = json.loads(log.history_json or "[]")
+        log.history_blob = encode_history(history)
+        log.history_json = None
+        return history
+    return decode_history(log.history_blob)
+
+
+_BATCH_SECONDS = DB_OPERATION_SECONDS.labels("batch")
+
+
+class UnitOfWork:
+    """
+    하나의 세션으로 여러 작업을 모아 한 번에 커밋하는 작업 단위
+    - with 블록이 정상 종료되면 commit, 예외가 나면 rollback
+    - 챔피언 일괄 갱신은 executemany 형태의 UPDATE 한 번으로 처리
+    """
+
+    # (user_id, champion_key)로 찾아 level/exp 갱신
+    _UPDATE_BY_KEY = (
+        update(UserChampion.__table__)
+        .where(
+            UserChampion.__table__.c.user_id == bindparam("b_user_id"),
+            UserChampion.__table__.c.champion_key == bindparam("b_key"),
+        )
+        .values(level=bindparam("b_level"), exp=bindparam("b_exp"))
+    )
+    _UPDATE_BY_ID = (
+        update(UserChampion.__table__)
+        .where(UserChampion.__table__.c.id == bindparam("b_id"))
+        .values(level=bindparam("b_level"), exp=bindparam("b_exp"))
+    )
+
+    _UPDATE_RATING = (
+        update(User.__table__)
+        .where(User.__table__.c.id == bindparam("b_id"))
+        .values(rating=bindparam("b_rating"))
+    )
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self.session = None
+
+    def __enter__(self) -> "UnitOfWork":
+        self._started = time.perf_counter()
+        self.session = self.session_factory()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.session.commit()
+            else:
+                self.session.rollback()
+        finally:
+            self.session.close()
+            self.session = None
+            _BATCH_SECONDS.observe(time.perf_counter() - self._started)
+
+    def update_champions_by_key(self, user_id: int, rows: Iterable[Tuple[str, int, int]]):
+        """rows: (champion_key, level, exp)"""
+        params = [
+            {"b_user_id": user_id, "b_key": key, "b_level": level, "b_exp": exp}
+            for key, level, exp in rows
+        ]
+        if params:
+            self.session.execute(self._UPDATE_BY_KEY, params)
+
+    def update_champions(self, rows: Iterable[Tuple[int, int, int]]):
+        """rows: (champion_id, level, exp)"""
+        params = [
+            {"b_id": champion_id, "b_level": level, "b_exp": exp}
+            for champion_id, level, exp in rows
+        ]
+        if params:
+            self.session.execute(self._UPDATE_BY_ID, params)
+
+    def add_battle_log(self, user_id: int, battle, normalize: bool = False):
+        _add_battle_log(self.session, user_id, battle, normalize)
+
+    def update_ratings(self, rows: Iterable[Tuple[int, float]]):
+        """rows: (user_id, rating)"""
+        params = [{"b_id": user_id, "b_rating": rating} for user_id, rating in rows]
+        if params:
+            self.session.execute(self._UPDATE_RATING, params)
 
 
 class DatabaseManager:
@@ -12,11 +237,27 @@ class DatabaseManager:
     SQLAlchemy 기반 어댑터
     """
 
+    def __init__(self, session_factory=SessionLocal, log_writer=None):
+        self.session_factory = session_factory
+        # BattleLogWriter를 주면 save_battle_log는 write-behind 큐에 넣고 바로 반환 (배치 커밋)
+        self.log_writer = log_writer
+
+    def batch(self) -> UnitOfWork:
+        """
+        여러 작업을 한 세션/한 커밋으로 묶음
+
+        with db.batch() as uow:
+            uow.update_champions_by_key(user_id, [(key, level, exp), ...])
+            uow.add_battle_log(user_id, battle)
+        """
+        return UnitOfWork(self.session_factory)
+
     # -------------------------
     # User
     # -------------------------
+    @_timed
     def get_or_create_user(self, username: str) -> int:
-        db = SessionLocal()
+        db = self.session_factory()
         try:
             user = db.query(User).filter(User.username == username).first()
             if user:
@@ -30,8 +271,9 @@ class DatabaseManager:
         finally:
             db.close()
 
+    @_timed
     def get_user_info(self, user_id: int) -> Dict[str, Any] | None:
-        db = SessionLocal()
+        db = self.session_factory()
         try:
             user = db.query(User).filter(User.id == user_id).first()
             if not user:
@@ -41,15 +283,27 @@ class DatabaseManager:
                 "id": user.id,
                 "username": user.username,
                 "gold": getattr(user, "gold", 1000),
+                "rating": user.rating,
             }
         finally:
             db.close()
 
+    @_timed
+    def get_ratings(self) -> List[Tuple[int, float]]:
+        """전체 유저 (id, rating) - 순위 인덱스 적재용"""
+        db = self.session_factory()
+        try:
+            return [tuple(row) for row in db.query(User.id, User.rating).all()]
+        finally:
+            db.close()
+
     # -------------------------
     # Champion
     # -------------------------
-    def add_champion_to_user(self, user_id: int, champion_key: str):
-        db = SessionLocal()
+    @_timed
+    def add_champion_to_user(self, user_id: int, champion_key: str) -> int:
+        """새 챔피언 지급 후 생성된 user_champions.id 반환"""
+        db = self.session_factory()
         try:
             champ = UserChampion(
                 user_id=user_id,
@@ -58,12 +312,16 @@ class DatabaseManager:
                 exp=0,
             )
             db.add(champ)
+            db.flush()
+            champion_id = champ.id
             db.commit()
+            return champion_id
         finally:
             db.close()
 
+    @_timed
     def get_user_champions(self, user_id: int) -> List[Dict[str, Any]]:
-        db = SessionLocal()
+        db = self.session_factory()
         try:
             champs = (
                 db.query(UserChampion)
@@ -84,8 +342,9 @@ class DatabaseManager:
         finally:
             db.close()
 
+    @_timed
     def update_champion_data(self, champion_id: int, level: int, exp: int):
-        db = SessionLocal()
+        db = self.session_factory()
         try:
             champ = db.query(UserChampion).filter(
                 UserChampion.id == champion_id
@@ -101,6 +360,7 @@ class DatabaseManager:
             db.close()
 
 
+    @_timed
     def update_champion_data_by_key(
         self,
         user_id: int,
@@ -108,7 +368,7 @@ class DatabaseManager:
         level: int,
         exp: int,
     ):
-        db = SessionLocal()
+        db = self.session_factory()
         try:
             champ = (
                 db.query(UserChampion)
@@ -127,28 +387,135 @@ class DatabaseManager:
         finally:
             db.close()
 
+    @_timed
     def save_battle_log(
         self,
         user_id: int,
         battle,
+        normalize: bool = False,
     ):
         """
         battle: Battle 인스턴스
+        normalize: True면 행동별 SQL 집계용 battle_turns 행도 함께 저장 (log_writer를 거치지 않음)
         """
-        db = SessionLocal()
+        if self.log_writer is not None and not normalize:
+            self.log_writer.submit(user_id, battle)
+            return
+        db = self.session_factory()
         try:
-            log = BattleLog(
-                user_id=user_id,
-                left_champion=battle.left.name,
-                right_champion=battle.right.name,
-                winner=battle.winner.name,
-                turn_count=battle.turn,
-                history_json=json.dumps(
-                    battle.history,
-                    ensure_ascii=False
-                ),
-            )
-            db.add(log)
+            _add_battle_log(db, user_id, battle, normalize)
             db.commit()
+        finally:
+            db.close()
+
+    @_timed
+    def get_battle_log(self, log_id: int) -> Dict[str, Any] | None:
+        """전투 로그 조회 (구형 JSON 행은 이때 압축 포맷으로 변환되어 저장됨)"""
+        db = self.session_factory()
+        try:
+            log = db.query(BattleLog).filter(BattleLog.id == log_id).first()
+            if not log:
+                return None
+
+            migrated = log.history_blob is None
+            history = _read_history(log)
+            if migrated:
+                db.commit()
+
+            return {
+                "id": log.id,
+                "user_id": log.user_id,
+                "left_champion": log.left_champion,
+                "right_champion": log.right_champion,
+                "winner": log.winner,
+                "turn_count": log.turn_count,
+                "history": history,
+            }
+        finally:
+            db.close()
+
+    @_timed
+    def get_matchup_stats(
+        self,
+        champion: str,
+        opponent: Optional[str] = None,
+        days: int = 7,
+    ) -> Dict[str, Any]:
+        """
+        최근 days일(UTC, 오늘 포함) 챔피언 전적. opponent를 주면 해당 매치업만.
+        집계 테이블만 읽음 (battle_logs 스캔 없음)
+        """
+        since = _utc_day(datetime.now(timezone.utc) - timedelta(days=days - 1))
+        db = self.session_factory()
+        try:
+            query = db.query(
+                MatchupDailyStat.day,
+                func.sum(MatchupDailyStat.wins),
+                func.sum(MatchupDailyStat.losses),
+                func.sum(MatchupDailyStat.draws),
+                func.sum(MatchupDailyStat.total_turns),
+            ).filter(MatchupDailyStat.champion == champion, MatchupDailyStat.day >= since)
+            if opponent:
+                query = query.filter(MatchupDailyStat.opponent == opponent)
+            by_day = [
+                {"day": day, "wins": wins, "losses": losses, "draws": draws, "total_turns": total_turns}
+                for day, wins, losses, draws, total_turns in query.group_by(MatchupDailyStat.day)
+                .order_by(MatchupDailyStat.day).all()
+            ]
+        finally:
+            db.close()
+
+        wins = sum(d["wins"] for d in by_day)
+        losses = sum(d["losses"] for d in by_day)
+        draws = sum(d["draws"] for d in by_day)
+        battles = wins + losses + draws
+        return {
+            "champion": champion,
+            "opponent": opponent,
+            "since": since,
+            "wins": wins,
+            "losses": losses,
+            "draws": draws,
+            "win_rate": wins / battles if battles else None,
+            "avg_turns": sum(d["total_turns"] for d in by_day) / battles if battles else None,
+            "by_day": by_day,
+        }
+
+    @_timed
+    def get_turn_histogram(self, days: int = 7) -> Dict[int, int]:
+        """최근 days일 전투의 {턴 수: 전투 수}"""
+        since = _utc_day(datetime.now(timezone.utc) - timedelta(days=days - 1))
+        db = self.session_factory()
+        try:
+            rows = (
+                db.query(TurnHistogramDaily.turns, func.sum(TurnHistogramDaily.count))
+                .filter(TurnHistogramDaily.day >= since)
+                .group_by(TurnHistogramDaily.turns)
+                .order_by(TurnHistogramDaily.turns)
+                .all()
+            )
+            return {turns: count for turns, count in rows}
+        finally:
+            db.close()
+
+    @_timed
+    def get_action_stats(self) -> List[Dict[str, Any]]:
+        """battle_turns 기반 행동별 사용 횟수/총 데미지 (normalize=True로 저장된 전투만 포함)"""
+        db = self.session_factory()
+        try:
+            rows = (
+                db.query(
+                    BattleTurn.actor,
+                    BattleTurn.action,
+                    func.count(BattleTurn.id),
+                    func.sum(BattleTurn.damage),
+                )
+                .group_by(BattleTurn.actor, BattleTurn.action)
+                .all()
+            )
+            return [
+                {"actor": actor, "action": action, "count": count, "total_damage": total or 0}
+                for actor, action, count, total in rows
+            ]
         finally:
             db.close()
\ No newline at end of file
@@ -1,10 +1,17 @@
 import json
 import importlib
+import time
+from src.common.metrics import REGISTRY
 from src.models.champion import Champion
 from src.factories.skill_factory import create_skill
 
 _CHAMPION_DATA = None
 
+CHAMPION_BUILD_SECONDS = REGISTRY.histogram(
+    "leagueslg_champion_build_seconds", "create_champion 소요 시간",
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05),
+)
+
 
 def _load_champion_data():
     global _CHAMPION_DATA
@@ -15,6 +22,14 @@ def _load_champion_data():
 
 
 def create_champion(champion_id: str) -> Champion:
+    started = time.perf_counter()
+    try:
+        return _build_champion(champion_id)
+    finally:
+        CHAMPION_BUILD_SECONDS.observe(time.perf_counter() - started)
+
+
+def _build_champion(champion_id: str) -> Champion:
     data = _load_champion_data()
 
     if champion_id not in data:
@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from src.db_manager import DatabaseManager
+from src.models.champion import Champion
+from src.logic.champion_mapper import row_to_champion
+
+
+class _Roster:
+    __slots__ = ("champions", "last_used")
+
+    def __init__(self, champions: Dict[int, Champion], now: float):
+        self.champions = champions
+        self.last_used = now
+
+
+class ChampionIdentityMap:
+    """
+    유저별 챔피언 identity map (user_champions.id → Champion)
+    - 로스터는 유저당 한 번만 DB에서 읽고, 이후 같은 id는 항상 같은 Champion 객체를 반환
+    - 지급(add)/갱신(update)은 DB에 바로 쓰고(write-through) 캐시도 제자리에서 수정 (로스터 재조회 없음)
+    - 새 로스터를 읽어 max_users를 넘으면 가장 오래 쓰지 않은 유저부터 제거,
+      idle_seconds 동안 쓰지 않은 유저는 evict_idle()을 명시적으로 호출할 때만 제거 (조회 경로에서는 만료 처리 없음)
+    - 제거 전 save()로 전투 중 바뀐 레벨/경험치를 저장 (flush_on_evict)
+    - pin()된 로스터(살아 있는 User가 참조 중)는 제거 대상에서 제외 → 그동안은 max_users를 넘을 수 있음
+    - 여러 스레드에서 공유하므로 로스터 조작은 모두 _lock 안에서 수행
+    """
+    def __init__(self, db_manager: DatabaseManager, max_users: int = 1024, idle_seconds: float = 900.0,
+                 flush_on_evict: bool = True, clock: Callable[[], float] = time.monotonic):
+        self.db = db_manager
+        self.max_users = max_users
+        self.idle_seconds = idle_seconds
+        self.flush_on_evict = flush_on_evict
+        self.clock = clock
+        self._rosters: "OrderedDict[int, _Roster]" = OrderedDict()
+        self._pins: Dict[int, int] = {}
+        # 제거 시 save()가 다시 잡으므로 재진입 가능한 락
+        self._lock = threading.RLock()
+        self.loads = 0
+        self.hits = 0
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def get(self, user_id: int) -> Dict[int, Champion]:
+        """유저 로스터 {id: Champion} (캐시에 없을 때만 DB 조회)"""
+        with self._lock:
+            now = self.clock()
+            roster = self._rosters.get(user_id)
+            if roster is not None:
+                self.hits += 1
+                roster.last_used = now
+                self._rosters.move_to_end(user_id)
+                return roster.champions
+
+            self.loads += 1
+            champions = {
+                row["id"]: row_to_champion(row["champion_key"], row["level"], row["exp"])
+                for row in self.db.get_user_champions(user_id)
+            }
+            self._rosters[user_id] = _Roster(champions, now)
+            self._evict_overflow()
+            return champions
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._rosters
+
+    def __len__(self):
+        return len(self._rosters)
+
+    # -------------------------
+    # 고정 (살아 있는 User가 Champion 객체를 들고 있는 동안 제거 금지)
+    # -------------------------
+    def pin(self, user_id: int):
+        with self._lock:
+            self._pins[user_id] = self._pins.get(user_id, 0) + 1
+
+    def unpin(self, user_id: int):
+        with self._lock:
+            count = self._pins.get(user_id, 0) - 1
+            if count > 0:
+                self._pins[user_id] = count
+            else:
+                self._pins.pop(user_id, None)
+
+    def is_pinned(self, user_id: int) -> bool:
+        return user_id in self._pins
+
+    # -------------------------
+    # write-through 변경
+    # -------------------------
+    def add(self, user_id: int, champion_key: str) -> Champion:
+        """챔피언 지급: DB insert 후 캐시된 로스터에 새 객체만 추가"""
+        with self._lock:
+            champions = self.get(user_id)
+            champion_id = self.db.add_champion_to_user(user_id, champion_key)
+            champ = row_to_champion(champion_key, 1, 0)
+            champions[champion_id] = champ
+            return champ
+
+    def update(self, user_id: int, champion_id: int, level: int, exp: int):
+        with self._lock:
+            champ = self.get(user_id).get(champion_id)
+            if champ is None:
+                return
+            self.db.update_champion_data(champion_id, level, exp)
+            champ.level, champ.exp = level, exp
+
+    def save(self, user_id: int, battle=None):
+        """
+        캐시된 로스터의 현재 레벨/경험치를 한 트랜잭션으로 저장
+        battle을 넘기면 전투 로그도 같은 커밋에 포함
+        """
+        with self._lock:
+            roster = self._rosters.get(user_id)
+            with self.db.batch() as uow:
+                if roster is not None:
+                    uow.update_champions(
+                        [(cid, champ.level, champ.exp) for cid, champ in roster.champions.items()]
+                    )
+                if battle is not None:
+                    uow.add_battle_log(user_id, battle)
+
+    # -------------------------
+    # 제거
+    # -------------------------
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """idle_seconds 넘게 쓰지 않은 (고정되지 않은) 로스터를 저장 후 제거. 주기 작업에서 호출"""
+        with self._lock:
+            now = self.clock() if now is None else now
+            # _rosters는 마지막 사용 순서이므로 만료되지 않은 유저를 만나면 뒤는 볼 필요 없음
+            evicted = 0
+            for user_id, roster in list(self._rosters.items()):
+                if now - roster.last_used <= self.idle_seconds:
+                    break
+                if user_id in self._pins:
+                    continue
+                self._evict(user_id)
+                evicted += 1
+            return evicted
+
+    def invalidate(self, user_id: int):
+        """저장 없이 캐시에서 제거 (DB가 외부에서 바뀐 경우, 고정된 User도 다음 조회 때 새 객체를 받음)"""
+        with self._lock:
+            self._rosters.pop(user_id, None)
+
+    def _evict_overflow(self):
+        # 오래 쓰지 않은 순서로 고정되지 않은 로스터만 제거 (방금 읽은 마지막 로스터는 제외)
+        for user_id in list(self._rosters)[:-1]:
+            if len(self._rosters) <= self.max_users:
+                break
+            if user_id not in self._pins:
+                self._evict(user_id)
+
+    def _evict(self, user_id: int):
+        if self.flush_on_evict:
+            self.save(user_id)
+        self._rosters.pop(user_id, None)
+
+    def __repr__(self):
+        return f"ChampionIdentityMap(users={len(self._rosters)}, loads={self.loads}, hits={self.hits})"
+
+
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_cache(db_manager: DatabaseManager) -> ChampionIdentityMap:
+    """
+    db_manager별 공용 identity map (캐시를 따로 넘기지 않은 User들이 같은 로스터 객체를 공유)
+    db_manager 인스턴스에 붙여 두므로 수명도 db_manager와 같음
+    """
+    with _SHARED_LOCK:
+        cache = db_manager.__dict__.get("_shared_champion_cache")
+        if cache is None:
+            cache = db_manager._shared_champion_cache = ChampionIdentityMap(db_manager)
+        return cache
@@ -0,0 +1,85 @@
+import threading
+from typing import Callable, List, Optional, Tuple
+from src.db_manager import DatabaseManager, UnitOfWork
+from src.logic.rating import RankIndex, elo_update, DEFAULT_RATING, K_FACTOR
+
+
+def battle_score(battle) -> float:
+    """왼쪽 챔피언 기준 결과 (승자가 없으면 무승부)"""
+    if battle.winner is None:
+        return 0.5
+    return 1.0 if battle.winner is battle.left else 0.0
+
+
+class RankingService:
+    """
+    랭크전 레이팅/순위
+    - 전투가 끝나면 양쪽 유저의 Elo를 갱신하여 DB(users.rating)에 저장하고 순위 인덱스도 갱신
+    - top/rank 조회는 메모리 인덱스만 사용 (DB 조회 없음)
+    - 서버 시작 시 load()로 전체 레이팅을 한 번 적재
+    """
+    def __init__(self, db_manager: DatabaseManager, k: float = K_FACTOR, index: Optional[RankIndex] = None):
+        self.db = db_manager
+        self.k = k
+        self.index = index if index is not None else RankIndex()
+        self._lock = threading.Lock()
+
+    def load(self):
+        ratings = self.db.get_ratings()
+        with self._lock:
+            for user_id, rating in ratings:
+                self.index.set(user_id, rating)
+
+    def rating(self, user_id: int) -> float:
+        rating = self.index.rating(user_id)
+        return DEFAULT_RATING if rating is None else rating
+
+    def _apply(self, left_user_id: int, right_user_id: int, left_score: float,
+               write: Callable[[List[Tuple[int, float]]], None]) -> Tuple[float, float]:
+        with self._lock:
+            new_left, new_right = elo_update(self.rating(left_user_id), self.rating(right_user_id),
+                                             left_score, self.k)
+            write([(left_user_id, new_left), (right_user_id, new_right)])
+            # DB 쓰기가 성공한 뒤에 인덱스 갱신 (예외 시 메모리와 DB가 어긋나지 않도록)
+            self.index.set(left_user_id, new_left)
+            self.index.set(right_user_id, new_right)
+        return new_left, new_right
+
+    def record_result(self, left_user_id: int, right_user_id: int, left_score: float,
+                      uow: Optional[UnitOfWork] = None) -> Tuple[float, float]:
+        """
+        left_score: 왼쪽 유저 결과 (승 1, 무 0.5, 패 0)
+        uow를 넘기면 그 트랜잭션에 포함 (전투 로그와 함께 커밋), 아니면 별도 커밋
+        """
+        if uow is not None:
+            return self._apply(left_user_id, right_user_id, left_score, uow.update_ratings)
+
+        def write(rows):
+            with self.db.batch() as own:
+                own.update_ratings(rows)
+        return self._apply(left_user_id, right_user_id, left_score, write)
+
+    def record_battle(self, left_user_id: int, right_user_id: int, battle,
+                      uow: Optional[UnitOfWork] = None) -> Tuple[float, float]:
+        """Battle(left = left_user의 챔피언) 결과로 레이팅 갱신"""
+        return self.record_result(left_user_id, right_user_id, battle_score(battle), uow)
+
+    def save_battle(self, left_user_id: int, right_user_id: int, battle) -> Tuple[float, float]:
+        """
+        끝난 랭크전 반영: 전투 로그(왼쪽 유저 기준) 저장과 양쪽 레이팅 갱신을 한 트랜잭션으로 커밋
+        커밋이 끝난 뒤에만 순위 인덱스를 갱신
+        """
+        def write(rows):
+            with self.db.batch() as uow:
+                uow.add_battle_log(left_user_id, battle)
+                uow.update_ratings(rows)
+        return self._apply(left_user_id, right_user_id, battle_score(battle), write)
+
+    def rank(self, user_id: int) -> Optional[int]:
+        with self._lock:
+            return self.index.rank(user_id)
+
+    def top(self, n: int = 100) -> List[dict]:
+        with self._lock:
+            entries = self.index.top(n)
+        return [{"rank": rank, "user_id": user_id, "rating": round(rating, 1)} for rank, user_id, rating in entries]
@@ -1,8 +1,8 @@
-from typing import List
+import weakref
+from typing import List, Optional
 from src.db_manager import DatabaseManager
 from src.models.champion import Champion
-from src.logic.champion_mapper import orm_to_champion, champion_to_orm
-from src.logic.champion_mapper import orm_dict_to_champion
+from src.game.champion_cache import ChampionIdentityMap, shared_cache
 
 
 class User:
@@ -10,39 +10,44 @@ class User:
     게임 로직용 User
     - main.py가 기대하는 인터페이스 제공
     - 내부적으로 DatabaseManager 사용
+    - 챔피언은 ChampionIdentityMap을 통해 로드 (지정하지 않으면 db_manager의 공용 캐시를 공유)
+    - User가 살아 있는 동안 로스터를 pin해 두므로 꺼내 둔 Champion 객체가 제거/재로드로 낡지 않음
+      (close() 또는 가비지 컬렉션 시 해제)
     """
 
-    def __init__(self, username: str, db_manager: DatabaseManager):
+    def __init__(self, username: str, db_manager: DatabaseManager,
+                 champion_cache: Optional[ChampionIdentityMap] = None):
         self.username = username
         self.db = db_manager
+        self.cache = champion_cache if champion_cache is not None else shared_cache(db_manager)
 
         # DB에서 유저 및 챔피언 로드
         self.user_id = self.db.get_or_create_user(username)
-        self.champions: List[Champion] = []
+        self.cache.pin(self.user_id)
+        self._release = weakref.finalize(self, self.cache.unpin, self.user_id)
         self._load_champions()
 
 
     def _load_champions(self):
-        champ_rows = self.db.get_user_champions(self.user_id)
+        # 캐시된 로스터가 있으면 DB 조회 없이 재사용
+        self.cache.get(self.user_id)
 
-        self.champions = [
-            orm_dict_to_champion(row)
-            for row in champ_rows
-    ]
+    @property
+    def champions(self) -> List[Champion]:
+        """보유 챔피언 (identity map의 객체 그대로이므로 수정 사항이 save_data에 반영됨)"""
+        return list(self.cache.get(self.user_id).values())
 
 
     def add_champion(self, champion_key: str):
-        self.db.add_champion_to_user(self.user_id, champion_key)
-        self._load_champions()
+        self.cache.add(self.user_id, champion_key)
 
-    def save_data(self):
+    def save_data(self, battle=None):
         """
         현재 챔피언 상태를 DB에 저장
+        battle을 넘기면 전투 로그도 같은 트랜잭션에서 함께 저장 (세션 1개, 커밋 1번)
         """
-        for champ in self.champions:
-            self.db.update_champion_data_by_key(
-                self.user_id,
-                champ.name,
-                champ.level,
-                champ.exp,
-            )
+        self.cache.save(self.user_id, battle)
+
+    def close(self):
+        """로스터 고정 해제 (이후 캐시가 제거할 수 있음)"""
+        self._release()
@@ -0,0 +1,112 @@
+import contextlib
+import hashlib
+import io
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from src.models.champion import Champion
+from src.models.march import March
+from src.logic.battle.battle import Battle
+if TYPE_CHECKING:
+    from src.logic.map_manager import MapManager
+
+
+def battle_seed(tick: int, *army_ids: str) -> int:
+    """틱 번호와 부대 ID로 정하는 전투별 난수 시드 (실행 위치/순서와 무관하게 같은 값)"""
+    key = ":".join((str(tick),) + army_ids).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+
+
+@contextlib.contextmanager
+def seeded_random(seed: int):
+    """
+    전투 코드가 쓰는 전역 random을 seed로 고정하고, 끝나면 이전 상태로 복원
+    (fork된 워커가 물려받은 난수 상태나 앞선 전투의 소비량에 결과가 좌우되지 않도록)
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+def _fight(attacker: Champion, defender: Champion, seed: int) -> Tuple[Champion, Champion]:
+    """워커 프로세스에서 실행되는 전투 (콘솔 로그는 버림)"""
+    with contextlib.redirect_stdout(io.StringIO()), seeded_random(seed):
+        Battle(attacker, defender).start()
+    return attacker, defender
+
+
+def _copy_battle_state(src: Champion, dst: Champion):
+    """워커에서 돌아온 챔피언 사본의 전투 후 상태를 원본에 반영"""
+    dst.current_hp = src.current_hp
+    dst.max_hp = src.max_hp
+    dst.level = src.level
+    dst.exp = src.exp
+    dst.buffs = src.buffs
+    dst.stat = src.stat
+
+
+def arrival_order(march: March):
+    """같은 틱 도착의 결정적 처리 순서: 도착 시각 → 소유주 → 부대 ID"""
+    return (march.arrival_time, march.user_id, march.army.id)
+
+
+class ArrivalResolver:
+    """
+    같은 틱(MapManager.update 한 번)에 도착한 행군을 일괄 처리
+
+    충돌 규칙: 같은 타일에 여러 부대가 도착하면 arrival_order 순으로 한 부대씩 처리하며,
+    뒤 부대는 앞 부대의 결과(점령/후퇴)가 반영된 타일을 상대합니다 (순차 처리와 동일한 결과).
+    이를 위해 타일마다 k번째 도착을 모은 '라운드' 단위로 진행하고,
+    한 라운드 안의 수비군 전투는 서로 다른 타일/부대이므로 워커 풀에서 병렬로 실행합니다.
+    전투 난수는 battle_seed(틱, 부대 ID)로 고정하므로 순차 처리(MapManager)와 결과가 같습니다.
+    결과 반영은 항상 arrival_order 순서로 메인 스레드에서 수행합니다.
+    """
+    def __init__(self, executor: Optional[Executor] = None, max_workers: Optional[int] = None,
+                 min_parallel: int = 4):
+        self._own_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+        # 전투 수가 이보다 적으면 프로세스 간 전송 비용이 더 크므로 메인 스레드에서 실행
+        self.min_parallel = min_parallel
+
+    def resolve(self, manager: 'MapManager', marches: List[March]):
+        by_tile: Dict[Tuple[int, int], List[March]] = {}
+        for march in sorted(marches, key=arrival_order):
+            by_tile.setdefault(march.target_pos, []).append(march)
+
+        rounds = max((len(group) for group in by_tile.values()), default=0)
+        for k in range(rounds):
+            current = sorted(
+                (group[k] for group in by_tile.values() if len(group) > k),
+                key=arrival_order,
+            )
+            self._resolve_round(manager, current)
+
+    def _resolve_round(self, manager: 'MapManager', marches: List[March]):
+        fights = [m for m in marches if manager.needs_guard_battle(m)]
+        fought = set()
+
+        if len(fights) >= self.min_parallel:
+            roster = manager.guard_roster
+            guards = [roster.acquire(manager.world_map.get_tile(*m.target_pos).level) for m in fights]
+            futures = [
+                self.executor.submit(_fight, m.army.champion, guard, battle_seed(manager.tick, m.army.id))
+                for m, guard in zip(fights, guards)
+            ]
+            for march, guard, future in zip(fights, guards, futures):
+                attacker, _ = future.result()
+                _copy_battle_state(attacker, march.army.champion)
+                roster.release(guard)
+                fought.add(march.id)
+
+        for march in marches:
+            manager._handle_arrival(march, fought=march.id in fought)
+
+    def shutdown(self):
+        if self._own_executor:
+            self.executor.shutdown(wait=True)
+
+    def __repr__(self):
+        return f"ArrivalResolver(executor={type(self.executor).__name__}, min_parallel={self.min_parallel})"
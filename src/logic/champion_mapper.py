@@ -7,30 +7,26 @@ def orm_dict_to_champion(row: dict):
     """
     DatabaseManager(dict) → Champion
     """
-    orm = UserChampion(
-        id=row["id"],
-        user_id=row["user_id"],
-        champion_key=row["champion_key"],
-        level=row["level"],
-        exp=row["exp"],
-    )
-    return orm_to_champion(orm)
+    return row_to_champion(row["champion_key"], row["level"], row["exp"])
 
 def orm_to_champion(orm: UserChampion) -> Champion:
-    champions = load_champions()
-
     # DB에 저장된 champion_key 사용
-    data = champions.get(orm.champion_key)
+    return row_to_champion(orm.champion_key, orm.level, orm.exp)
+
+def row_to_champion(champion_key: str, level: int, exp: int) -> Champion:
+    """챔피언 키/레벨/경험치 → Champion (ORM 객체를 거치지 않음)"""
+    champions = load_champions()
+    data = champions.get(champion_key)
 
     if not data:
-        raise ValueError(f"Unknown champion key: {orm.champion_key}")
+        raise ValueError(f"Unknown champion key: {champion_key}")
 
     champ = Champion(
         name=data["name"],
         base_stat=data["base_stat"],
         stat_growth=data["stat_growth"],
-        level=orm.level,
-        exp=orm.exp,
+        level=level,
+        exp=exp,
         minions=tuple(data.get("minions", ("", 0))),
         image=data.get("images", {}),
     )
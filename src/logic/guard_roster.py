@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from src.models.champion import Champion
+from src.factories.champion_factory import create_champion
+
+GUARD_JSON_PATH = Path(__file__).resolve().parents[2] / "data" / "guards.json"
+
+
+class GuardTemplate:
+    """타일 레벨(및 지역)별 수비군의 초기 상태"""
+    def __init__(self, champion_key: str, level: int, max_hp: Optional[float] = None):
+        self.champion_key = champion_key
+        self.level = level
+
+        # 템플릿 생성 시 한 번만 스탯 계산
+        proto = self.build()
+        self.stat = dict(proto.stat)
+        self.max_hp = max_hp if max_hp is not None else proto.max_hp
+
+    def build(self) -> Champion:
+        champ = create_champion(self.champion_key)
+        champ.level = self.level
+        champ.recalculate_stats()
+        return champ
+
+    def reset(self, champ: Champion):
+        """풀에서 꺼낸 인스턴스를 템플릿 상태로 되돌림 (전투 중 레벨업/버프 포함)"""
+        champ.level = self.level
+        champ.exp = 0
+        champ.buffs = []
+        champ.stat = dict(self.stat)
+        champ.max_hp = self.max_hp
+        champ.current_hp = self.max_hp
+
+
+class GuardRoster:
+    """
+    중립 수비군 풀
+    - data/guards.json 에서 타일 레벨별(지역별) 수비군 구성을 읽어 템플릿을 미리 생성
+    - acquire()는 풀에 남은 인스턴스를 리셋하여 반환하고, 없을 때만 새로 생성
+    - 전투가 끝나면 release()로 반납
+    """
+    def __init__(self, config: Optional[dict] = None):
+        if config is None:
+            with open(GUARD_JSON_PATH, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        self.config = config
+        self._templates: Dict[Tuple[Optional[str], int], GuardTemplate] = {}
+        self._free: Dict[Tuple[Optional[str], int], List[Champion]] = {}
+        self._owner_key: Dict[int, Tuple[Optional[str], int]] = {}
+
+    def _entry(self, tile_level: int, region: Optional[str]) -> dict:
+        if region:
+            region_levels = self.config.get("regions", {}).get(region, {})
+            if str(tile_level) in region_levels:
+                return region_levels[str(tile_level)]
+        return self.config.get("levels", {}).get(str(tile_level), self.config.get("default", {}))
+
+    def get_template(self, tile_level: int, region: Optional[str] = None) -> GuardTemplate:
+        key = (region, tile_level)
+        template = self._templates.get(key)
+        if template is None:
+            entry = self._entry(tile_level, region)
+            template = GuardTemplate(
+                entry.get("champion", "Darius"),
+                entry.get("level", tile_level),
+                entry.get("max_hp"),
+            )
+            self._templates[key] = template
+        return template
+
+    def prewarm(self, tile_levels, region: Optional[str] = None, count: int = 1):
+        """서버 시작 시 템플릿과 인스턴스를 미리 생성"""
+        for level in tile_levels:
+            guards = [self.acquire(level, region) for _ in range(count)]
+            for guard in guards:
+                self.release(guard)
+
+    def acquire(self, tile_level: int, region: Optional[str] = None) -> Champion:
+        key = (region, tile_level)
+        template = self.get_template(tile_level, region)
+        free = self._free.get(key)
+        champ = free.pop() if free else template.build()
+        template.reset(champ)
+        self._owner_key[id(champ)] = key
+        return champ
+
+    def release(self, champ: Champion):
+        key = self._owner_key.pop(id(champ), None)
+        if key is not None:
+            self._free.setdefault(key, []).append(champ)
+
+    def __repr__(self):
+        pooled = sum(len(v) for v in self._free.values())
+        return f"GuardRoster(templates={len(self._templates)}, pooled={pooled})"
@@ -0,0 +1,158 @@
+import heapq
+import math
+import itertools
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+from src.models.march import March, MarchStatus
+from src.logic.map_manager import MapManagerListener
+if TYPE_CHECKING:
+    from src.logic.map_manager import MapManager
+
+# 두 행군이 이 거리(타일) 이내로 스치면 조우로 판정
+ENCOUNTER_RADIUS = 1.0
+# 시공간 버킷 크기: 공간 셀(타일) x 시간 구간(초)
+CELL_SIZE = 16
+TIME_BUCKET = 600.0
+
+BucketKey = Tuple[int, int, int]
+# 예약된 조우: (시각, 순번, 행군A ID, 행군B ID, 조우 지점)
+Encounter = Tuple[float, int, str, str, Tuple[float, float]]
+
+
+def _seconds(moment: datetime) -> float:
+    return moment.timestamp()
+
+
+class _Segment:
+    """행군을 시간에 따른 직선 이동 p(t) = p0 + v * (t - t0) 으로 표현"""
+    __slots__ = ("march", "t0", "t1", "x0", "y0", "vx", "vy")
+
+    def __init__(self, march: March):
+        self.march = march
+        self.t0 = _seconds(march.start_time)
+        self.t1 = _seconds(march.arrival_time)
+        self.x0, self.y0 = march.start_pos
+        duration = self.t1 - self.t0
+        self.vx = (march.target_pos[0] - self.x0) / duration
+        self.vy = (march.target_pos[1] - self.y0) / duration
+
+    def position(self, t: float) -> Tuple[float, float]:
+        dt = t - self.t0
+        return self.x0 + self.vx * dt, self.y0 + self.vy * dt
+
+
+def closest_approach(a: _Segment, b: _Segment) -> Optional[Tuple[float, float]]:
+    """두 이동 구간이 동시에 존재하는 시간 내 최근접 (시각, 거리). 겹치는 시간이 없으면 None"""
+    lo, hi = max(a.t0, b.t0), min(a.t1, b.t1)
+    if lo > hi:
+        return None
+    ax, ay = a.position(lo)
+    bx, by = b.position(lo)
+    dx, dy = ax - bx, ay - by
+    dvx, dvy = a.vx - b.vx, a.vy - b.vy
+    speed2 = dvx * dvx + dvy * dvy
+    # |d + dv * s|^2 최소화 (s = t - lo, 0 <= s <= hi - lo)
+    s = 0.0 if speed2 == 0 else min(max(-(dx * dvx + dy * dvy) / speed2, 0.0), hi - lo)
+    return lo + s, math.hypot(dx + dvx * s, dy + dvy * s)
+
+
+class InterceptionDetector(MapManagerListener):
+    """
+    행군 경로 교차(야전 조우) 탐지기
+    - 진행 중(GOING)인 행군을 시간에 따른 선분으로 보고, 지나는 시공간 버킷(셀 x 시간 구간)에 등록
+    - 새 행군이 시작되면 같은 버킷에 있는 다른 소유주의 행군하고만 최근접 거리를 계산 (전체 O(n^2) 비교 없음)
+    - 조우는 시각 순 힙에 예약하고, MapManager.update가 pop_next로 꺼내 야전을 치름
+    - 끝난 행군은 버킷에서 제거하며, 이미 예약된 조우는 꺼낼 때 유효성을 다시 확인
+    """
+    def __init__(self, map_manager: Optional['MapManager'] = None, radius: float = ENCOUNTER_RADIUS,
+                 cell_size: int = CELL_SIZE, time_bucket: float = TIME_BUCKET):
+        self.radius = radius
+        self.cell_size = cell_size
+        self.time_bucket = time_bucket
+        self._segments: Dict[str, _Segment] = {}
+        self._buckets: Dict[BucketKey, Set[str]] = {}
+        self._keys: Dict[str, List[BucketKey]] = {}
+        self._queue: List[Encounter] = []
+        self._seq = itertools.count()
+
+        if map_manager:
+            for march in map_manager.active_marches:
+                self.on_march_started(march)
+            map_manager.add_listener(self)
+            map_manager.interceptor = self
+
+    # -------------------------
+    # 버킷 관리
+    # -------------------------
+    def _bucket_keys(self, seg: _Segment) -> List[BucketKey]:
+        """선분이 지나는 (cx, cy, 시간 구간) 목록. 구간별 bbox를 조우 반경만큼 넓혀 셀에 등록"""
+        cs, tb, r = self.cell_size, self.time_bucket, self.radius
+        keys = []
+        for b in range(int(seg.t0 // tb), int(seg.t1 // tb) + 1):
+            ax, ay = seg.position(max(seg.t0, b * tb))
+            bx, by = seg.position(min(seg.t1, (b + 1) * tb))
+            for cy in range(int((min(ay, by) - r) // cs), int((max(ay, by) + r) // cs) + 1):
+                for cx in range(int((min(ax, bx) - r) // cs), int((max(ax, bx) + r) // cs) + 1):
+                    keys.append((cx, cy, b))
+        return keys
+
+    def _candidates(self, keys: List[BucketKey]) -> Set[str]:
+        found: Set[str] = set()
+        for key in keys:
+            found.update(self._buckets.get(key, ()))
+        return found
+
+    def on_march_started(self, march: March):
+        # 후퇴 행군과 제자리 행군은 조우 대상이 아님
+        if march.status != MarchStatus.GOING or march.arrival_time <= march.start_time:
+            return
+        seg = _Segment(march)
+        keys = self._bucket_keys(seg)
+
+        for other_id in self._candidates(keys):
+            other = self._segments[other_id]
+            if other.march.user_id == march.user_id:
+                continue
+            approach = closest_approach(seg, other)
+            if approach and approach[1] <= self.radius:
+                t = approach[0]
+                ax, ay = seg.position(t)
+                bx, by = other.position(t)
+                pos = ((ax + bx) / 2, (ay + by) / 2)
+                heapq.heappush(self._queue, (t, next(self._seq), other_id, march.id, pos))
+
+        self._segments[march.id] = seg
+        self._keys[march.id] = keys
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(march.id)
+
+    def on_march_finished(self, march: March):
+        if self._segments.pop(march.id, None) is None:
+            return
+        for key in self._keys.pop(march.id):
+            bucket = self._buckets[key]
+            bucket.discard(march.id)
+            if not bucket:
+                del self._buckets[key]
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def pop_next(self, now: Optional[datetime] = None) -> Optional[Tuple[March, March, Tuple[float, float]]]:
+        """
+        now 시각까지 발생한 가장 이른 유효 조우 (행군A, 행군B, 조우 지점).
+        조우 결과로 행군이 끝날 수 있으므로 한 번에 하나씩 꺼내 처리해야 합니다.
+        """
+        limit = _seconds(now or March.clock())
+        while self._queue and self._queue[0][0] <= limit:
+            _, _, a_id, b_id, pos = heapq.heappop(self._queue)
+            a, b = self._segments.get(a_id), self._segments.get(b_id)
+            if a and b and a.march.status == MarchStatus.GOING and b.march.status == MarchStatus.GOING:
+                return a.march, b.march, pos
+        return None
+
+    def pending_count(self) -> int:
+        return len(self._queue)
+
+    def __repr__(self):
+        return f"InterceptionDetector(marches={len(self._segments)}, buckets={len(self._buckets)}, pending={len(self._queue)})"
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import uuid
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+from src.models.world_map import WorldMap, WorldMapListener, CATEGORY_CODES, RESOURCE_CODES
+from src.models.building import Building
+from src.models.tile import Tile
+from src.models.army import Army
+from src.logic.map_manager import MapManager, MapManagerListener
+if TYPE_CHECKING:
+    from src.logic.visibility import VisibilityIndex
+
+CHUNK_SIZE = 32
+
+
+class MapChunkIndex(WorldMapListener, MapManagerListener):
+    """
+    맵 클라이언트용 청크 단위 타일 데이터
+    - 청크(CHUNK_SIZE x CHUNK_SIZE)마다 리비전 번호를 유지하고, 변경 알림이 오면 해당 청크만 증가
+    - 청크 JSON은 리비전별로 한 번만 직렬화하여 캐시
+    - ETag = 월드 epoch + 청크 좌표 + 리비전
+    """
+    def __init__(self, world_map: WorldMap, map_manager: Optional[MapManager] = None,
+                 chunk_size: int = CHUNK_SIZE):
+        self.world_map = world_map
+        self.chunk_size = chunk_size
+        self.chunks_x = (world_map.width + chunk_size - 1) // chunk_size
+        self.chunks_y = (world_map.height + chunk_size - 1) // chunk_size
+        self.revisions = np.zeros((self.chunks_y, self.chunks_x), dtype=np.int64)
+        # 서버 재시작/맵 재생성 시 이전 ETag가 재사용되지 않도록 하는 식별자
+        self.epoch = uuid.uuid4().hex[:8]
+
+        self._cache: Dict[Tuple[int, int], Tuple[int, bytes, dict]] = {}
+        self._army_pos: Dict[str, Tuple[int, int]] = {}
+
+        world_map.add_listener(self)
+        if map_manager:
+            map_manager.add_listener(self)
+
+    # -------------------------
+    # 변경 추적
+    # -------------------------
+    def invalidate(self, x: int, y: int):
+        """(x, y) 타일이 속한 청크의 리비전 증가"""
+        if 0 <= x < self.world_map.width and 0 <= y < self.world_map.height:
+            self.revisions[y // self.chunk_size, x // self.chunk_size] += 1
+
+    def invalidate_all(self):
+        """타일을 직접 수정한 경우 등 전체 무효화"""
+        self.revisions += 1
+
+    def on_tile_owner_changed(self, tile: Tile, old_owner: Optional[str]):
+        self.invalidate(tile.x, tile.y)
+
+    def on_building_placed(self, building: Building):
+        for x, y in building.occupied_tiles:
+            self.invalidate(x, y)
+
+    def on_army_changed(self, army: Army):
+        old = self._army_pos.pop(army.id, None)
+        if old:
+            self.invalidate(*old)
+        if army.pos_x is not None:
+            self._army_pos[army.id] = (army.pos_x, army.pos_y)
+            self.invalidate(army.pos_x, army.pos_y)
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def meta(self) -> dict:
+        return {
+            "width": self.world_map.width,
+            "height": self.world_map.height,
+            "chunk_size": self.chunk_size,
+            "epoch": self.epoch,
+            "categories": list(c.name for c in CATEGORY_CODES),
+            "resources": list(r.name for r in RESOURCE_CODES),
+        }
+
+    def chunks_in_view(self, x: int, y: int, w: int, h: int,
+                       visibility: Optional['VisibilityIndex'] = None,
+                       user_id: Optional[str] = None) -> List[List[int]]:
+        """
+        뷰포트 [x, x+w) x [y, y+h)와 겹치는 청크들의 [cx, cy, rev].
+        시야 필터를 쓰면 rev에 시야 리비전을 더함 (둘 다 단조 증가하므로 변경 감지에 충분)
+        """
+        cs = self.chunk_size
+        cx0, cy0 = max(0, x // cs), max(0, y // cs)
+        cx1 = min(self.chunks_x - 1, (x + w - 1) // cs)
+        cy1 = min(self.chunks_y - 1, (y + h - 1) // cs)
+        result = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                rev = int(self.revisions[cy, cx])
+                if visibility and user_id:
+                    rev += visibility.chunk_revision(user_id, cx, cy)
+                result.append([cx, cy, rev])
+        return result
+
+    def etag(self, cx: int, cy: int, visibility: Optional['VisibilityIndex'] = None,
+             user_id: Optional[str] = None) -> str:
+        tag = f"{self.epoch}-{cx}-{cy}-{int(self.revisions[cy, cx])}"
+        if visibility and user_id:
+            # 헤더 값은 latin-1만 허용되므로 유저 id는 해시로 구분
+            user_tag = hashlib.sha1(user_id.encode("utf-8")).hexdigest()[:12]
+            tag += f"-{user_tag}-{visibility.chunk_revision(user_id, cx, cy)}"
+        return f'"{tag}"'
+
+    def _get_chunk(self, cx: int, cy: int) -> Tuple[int, bytes, dict]:
+        """(리비전, JSON 바이트, 청크 dict) - 리비전이 바뀌지 않았으면 캐시 반환"""
+        if not (0 <= cx < self.chunks_x and 0 <= cy < self.chunks_y):
+            raise IndexError(f"Chunk ({cx}, {cy}) out of range")
+        rev = int(self.revisions[cy, cx])
+        cached = self._cache.get((cx, cy))
+        if cached and cached[0] == rev:
+            return cached
+
+        chunk = self._build_chunk(cx, cy, rev)
+        data = json.dumps(chunk, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._cache[(cx, cy)] = (rev, data, chunk)
+        return self._cache[(cx, cy)]
+
+    def chunk_bytes(self, cx: int, cy: int) -> bytes:
+        """청크 JSON (리비전이 바뀌지 않았으면 캐시된 바이트 반환)"""
+        return self._get_chunk(cx, cy)[1]
+
+    def visible_chunk_bytes(self, cx: int, cy: int, visibility: 'VisibilityIndex', user_id: str) -> bytes:
+        """
+        유저 시야로 걸러낸 청크 JSON.
+        보이지 않는 타일은 category/res/owner = -1, level = 0 이며 부대 마커도 제외
+        """
+        _, _, chunk = self._get_chunk(cx, cy)
+        mask = visibility.chunk_mask(user_id, cx, cy).ravel().tolist()
+
+        owners: List[str] = []
+        owner_index: Dict[int, int] = {}
+
+        def remap(i: int) -> int:
+            if i not in owner_index:
+                owner_index[i] = len(owners)
+                owners.append(chunk["owners"][i])
+            return owner_index[i]
+
+        category, res, level, owner = [], [], [], []
+        for i, seen in enumerate(mask):
+            if seen:
+                category.append(chunk["category"][i])
+                res.append(chunk["res"][i])
+                level.append(chunk["level"][i])
+                owner.append(remap(chunk["owner"][i]) if chunk["owner"][i] >= 0 else -1)
+            else:
+                category.append(-1)
+                res.append(-1)
+                level.append(0)
+                owner.append(-1)
+        armies = [[i, remap(o), name, troops] for i, o, name, troops in chunk["armies"] if mask[i]]
+
+        filtered = dict(chunk, category=category, res=res, level=level, owner=owner, owners=owners,
+                        armies=armies, vis=visibility.chunk_revision(user_id, cx, cy))
+        return json.dumps(filtered, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _build_chunk(self, cx: int, cy: int, rev: int) -> dict:
+        """
+        타일 배열은 청크 내부 행 우선(row-major) 순서로 평탄화.
+        owner는 청크 owners 테이블의 인덱스(-1 = 중립),
+        armies는 주둔 부대 마커 [타일 인덱스, 소유주 인덱스, 챔피언 이름, 병력]
+        """
+        cs = self.chunk_size
+        x0, y0 = cx * cs, cy * cs
+        x1 = min(x0 + cs, self.world_map.width)
+        y1 = min(y0 + cs, self.world_map.height)
+
+        category, res, level, owner = [], [], [], []
+        owners: List[str] = []
+        owner_index: Dict[str, int] = {}
+        armies = []
+
+        def index_of(owner_id: str) -> int:
+            if owner_id not in owner_index:
+                owner_index[owner_id] = len(owners)
+                owners.append(owner_id)
+            return owner_index[owner_id]
+
+        for y in range(y0, y1):
+            for tile in self.world_map.grid[y][x0:x1]:
+                category.append(CATEGORY_CODES[tile.category])
+                res.append(RESOURCE_CODES[tile.res_type])
+                level.append(tile.level)
+                owner.append(index_of(tile.owner_id) if tile.owner_id else -1)
+                army = tile.occupying_army
+                if army:
+                    armies.append([len(category) - 1, index_of(army.owner_id), army.champion.name, army.troop_count])
+
+        return {
+            "cx": cx, "cy": cy, "x": x0, "y": y0, "w": x1 - x0, "h": y1 - y0, "rev": rev,
+            "category": category, "res": res, "level": level,
+            "owner": owner, "owners": owners, "armies": armies,
+        }
+
+    def __repr__(self):
+        return f"MapChunkIndex({self.chunks_x}x{self.chunks_y} chunks of {self.chunk_size})"
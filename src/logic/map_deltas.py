@@ -0,0 +1,146 @@
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from src.models.world_map import WorldMap, WorldMapListener, CATEGORY_CODES, RESOURCE_CODES
+from src.models.building import Building
+from src.models.tile import Tile
+from src.models.army import Army
+from src.logic.map_manager import MapManager, MapManagerListener
+from src.logic.map_chunks import MapChunkIndex, CHUNK_SIZE
+
+Pos = Tuple[int, int]
+
+
+class MapDeltaTracker(WorldMapListener, MapManagerListener):
+    """
+    틱 단위 타일 변경 추적기
+    - 점령/건물 배치/부대 위치·상태 변경 알림이 오면 해당 타일만 dirty로 표시
+    - 한 틱 안에서 같은 타일이 여러 번 바뀌어도 flush 시 최종 상태 한 번만 전송 (dirty 집합으로 병합)
+    - flush()는 청크별 압축 델타를 만들어 반환하고 dirty 집합을 비움
+    """
+    def __init__(self, world_map: WorldMap, map_manager: Optional[MapManager] = None,
+                 map_chunks: Optional[MapChunkIndex] = None):
+        self.world_map = world_map
+        self.map_chunks = map_chunks
+        self.chunk_size = map_chunks.chunk_size if map_chunks else CHUNK_SIZE
+        self._dirty: Set[Pos] = set()
+        self._army_pos: Dict[str, Pos] = {}
+
+        world_map.add_listener(self)
+        if map_manager:
+            for army in map_manager.armies.values():
+                if army.pos_x is not None:
+                    self._army_pos[army.id] = (army.pos_x, army.pos_y)
+            map_manager.add_listener(self)
+
+    # -------------------------
+    # 변경 추적
+    # -------------------------
+    def mark(self, x: int, y: int):
+        if 0 <= x < self.world_map.width and 0 <= y < self.world_map.height:
+            self._dirty.add((x, y))
+
+    def on_tile_owner_changed(self, tile: Tile, old_owner: Optional[str]):
+        self.mark(tile.x, tile.y)
+
+    def on_building_placed(self, building: Building):
+        for x, y in building.occupied_tiles:
+            self.mark(x, y)
+
+    def on_army_changed(self, army: Army):
+        old = self._army_pos.pop(army.id, None)
+        if old:
+            self.mark(*old)
+        if army.pos_x is not None:
+            self._army_pos[army.id] = (army.pos_x, army.pos_y)
+            self.mark(army.pos_x, army.pos_y)
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    # -------------------------
+    # 델타 생성
+    # -------------------------
+    def flush(self) -> Dict[Pos, dict]:
+        """
+        {(cx, cy): 델타} 반환. 델타 형식 (청크 JSON과 같은 인덱스 체계):
+        - tiles: [타일 인덱스, category, res, level, owner 인덱스(-1 = 중립), 부대 마커 또는 null]
+        - 부대 마커: [owner 인덱스, 챔피언 이름, 병력]
+        - owners: 이 델타 안에서만 쓰는 소유주 테이블
+        - rev: 반영 후 청크 리비전 (MapChunkIndex가 있으면)
+        """
+        if not self._dirty:
+            return {}
+        cs = self.chunk_size
+        by_chunk: Dict[Pos, List[Pos]] = {}
+        for x, y in self._dirty:
+            by_chunk.setdefault((x // cs, y // cs), []).append((x, y))
+        self._dirty.clear()
+
+        return {key: self._build_delta(key, positions) for key, positions in by_chunk.items()}
+
+    def _build_delta(self, key: Pos, positions: List[Pos]) -> dict:
+        cx, cy = key
+        cs = self.chunk_size
+        w = min(cs, self.world_map.width - cx * cs)
+        owners: List[str] = []
+        owner_index: Dict[str, int] = {}
+
+        def index_of(owner_id: str) -> int:
+            if owner_id not in owner_index:
+                owner_index[owner_id] = len(owners)
+                owners.append(owner_id)
+            return owner_index[owner_id]
+
+        tiles = []
+        for x, y in sorted(positions, key=lambda p: (p[1], p[0])):
+            tile = self.world_map.grid[y][x]
+            army = tile.occupying_army
+            tiles.append([
+                (y - cy * cs) * w + (x - cx * cs),
+                CATEGORY_CODES[tile.category],
+                RESOURCE_CODES[tile.res_type],
+                tile.level,
+                index_of(tile.owner_id) if tile.owner_id else -1,
+                [index_of(army.owner_id), army.champion.name, army.troop_count] if army else None,
+            ])
+
+        delta = {"cx": cx, "cy": cy, "tiles": tiles, "owners": owners}
+        if self.map_chunks:
+            delta["rev"] = int(self.map_chunks.revisions[cy, cx])
+        return delta
+
+
+class ChunkSubscriptions:
+    """
+    구독자(WebSocket 연결 등)별 관심 청크 관리
+    - 청크 → 구독자 역색인으로 델타가 있는 청크의 구독자만 찾아 전달 (맵 크기와 무관)
+    """
+    def __init__(self):
+        self._by_chunk: Dict[Pos, Set[Hashable]] = {}
+        self._by_subscriber: Dict[Hashable, Set[Pos]] = {}
+
+    def subscribe(self, subscriber: Hashable, chunks: Iterable[Pos]):
+        """구독 청크 목록을 통째로 교체 (뷰포트 이동 시 다시 호출)"""
+        self.unsubscribe(subscriber)
+        wanted = {(int(cx), int(cy)) for cx, cy in chunks}
+        self._by_subscriber[subscriber] = wanted
+        for key in wanted:
+            self._by_chunk.setdefault(key, set()).add(subscriber)
+
+    def unsubscribe(self, subscriber: Hashable):
+        for key in self._by_subscriber.pop(subscriber, ()):
+            subscribers = self._by_chunk[key]
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._by_chunk[key]
+
+    def route(self, deltas: Dict[Pos, Any]) -> Dict[Hashable, List[Any]]:
+        """구독자별로 받을 델타 목록 (델타 값은 dict든 직렬화된 문자열이든 그대로 전달)"""
+        result: Dict[Hashable, List[Any]] = {}
+        for key, delta in deltas.items():
+            for subscriber in self._by_chunk.get(key, ()):
+                result.setdefault(subscriber, []).append(delta)
+        return result
+
+    def __len__(self):
+        return len(self._by_subscriber)
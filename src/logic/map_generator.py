@@ -0,0 +1,107 @@
+from typing import Dict, Optional
+import numpy as np
+from src.models.world_map import WorldMap, CATEGORY_CODES, RESOURCE_CODES
+from src.models.tile import TileCategory, ResourceType
+
+# 장애물 임계값 (노이즈 값은 0~1로 정규화)
+MOUNTAIN_THRESHOLD = 0.68   # 고도 노이즈가 이보다 높으면 산맥
+RIVER_WIDTH = 0.012         # 강 노이즈의 0.5 등고선 주변 폭
+MAX_LEVEL = 8
+
+RESOURCES = [ResourceType.FOOD, ResourceType.WOOD, ResourceType.IRON, ResourceType.STONE]
+
+
+def _interp_matrix(n: int, cell: int, grid_n: int) -> np.ndarray:
+    """길이 n 좌표를 격자점 grid_n개에서 smoothstep 보간하는 (n, grid_n) 가중치 행렬"""
+    pos = np.arange(n, dtype=np.float32) / cell
+    i0 = pos.astype(np.int32)
+    t = pos - i0
+    t = t * t * (3 - 2 * t)
+    m = np.zeros((n, grid_n), dtype=np.float32)
+    rows = np.arange(n)
+    m[rows, i0] = 1 - t
+    m[rows, i0 + 1] = t
+    return m
+
+
+def _value_noise(rng: np.random.Generator, width: int, height: int, cell: int) -> np.ndarray:
+    """
+    격자 간격 cell의 값 노이즈 (0~1).
+    보간이 x, y로 분리되므로 (Wy @ 격자 @ Wx^T) 두 번의 행렬곱으로 맵 전체를 한 번에 계산합니다.
+    """
+    lattice = rng.random((height // cell + 2, width // cell + 2), dtype=np.float32)
+    wy = _interp_matrix(height, cell, lattice.shape[0])
+    wx = _interp_matrix(width, cell, lattice.shape[1])
+    return (wy @ lattice) @ wx.T
+
+
+def _fractal_noise(rng: np.random.Generator, width: int, height: int, cell: int, octaves: int) -> np.ndarray:
+    """옥타브를 겹친 fBm 노이즈를 0~1로 정규화"""
+    total = np.zeros((height, width), dtype=np.float32)
+    amplitude, norm = 1.0, 0.0
+    for _ in range(octaves):
+        noise = _value_noise(rng, width, height, max(1, cell))
+        noise *= amplitude
+        total += noise
+        norm += amplitude
+        amplitude *= 0.5
+        cell //= 2
+    # 옥타브 합은 0.5 근처로 몰리므로 범위를 다시 펼침
+    lo, hi = total.min(), total.max()
+    total -= lo
+    total /= max(hi - lo, 1e-6)
+    return total
+
+
+def generate_map_arrays(width: int, height: int, seed: int) -> Dict[str, np.ndarray]:
+    """
+    시드 기반 절차적 맵 배열 생성 (WorldMap.to_arrays 형식)
+    - 산맥: 저주파 고도 노이즈의 높은 구간
+    - 강: 별도 노이즈의 0.5 등고선을 따라 이어지는 띠
+    - 자원: 자원별 노이즈 중 가장 큰 값의 종류를 택해 군집 형성
+    - 레벨: 맵 중앙으로 갈수록 높아지는 기울기 + 약간의 노이즈
+    같은 (width, height, seed)는 항상 같은 결과를 냅니다.
+    """
+    # 결과는 난수 호출 순서에 의존하므로 아래 노이즈 생성 순서를 바꾸면 기존 시드의 맵이 달라집니다
+    rng = np.random.default_rng(seed)
+    scale = max(8, min(width, height) // 8)
+
+    elevation = _fractal_noise(rng, width, height, scale, 4)
+    river = _fractal_noise(rng, width, height, scale * 2, 3)
+    obstacle = (elevation > MOUNTAIN_THRESHOLD) | (np.abs(river - 0.5) < RIVER_WIDTH)
+
+    # 자원 군집: 자원별 노이즈의 argmax
+    best = _fractal_noise(rng, width, height, max(4, scale // 2), 2)
+    res_index = np.zeros((height, width), dtype=np.int8)
+    for i in range(1, len(RESOURCES)):
+        field = _fractal_noise(rng, width, height, max(4, scale // 2), 2)
+        higher = field > best
+        res_index[higher] = i
+        best = np.maximum(best, field)
+    res_codes = np.array([RESOURCE_CODES[r] for r in RESOURCES], dtype=np.int8)
+
+    # 레벨: 중앙까지의 정규화 거리(0~1)에 반비례 + 노이즈 흔들림
+    xs = (np.arange(width, dtype=np.float32) - (width - 1) / 2) / max(width / 2, 1)
+    ys = (np.arange(height, dtype=np.float32) - (height - 1) / 2) / max(height / 2, 1)
+    dist = np.sqrt(xs[None, :] ** 2 + ys[:, None] ** 2) / np.sqrt(2)
+    jitter = _fractal_noise(rng, width, height, max(2, scale // 4), 2) * 2 - 1
+    level = np.clip(np.rint(1 + (1 - dist) * (MAX_LEVEL - 1) + jitter), 1, MAX_LEVEL).astype(np.int16)
+
+    category = np.where(obstacle, CATEGORY_CODES[TileCategory.OBSTACLE],
+                        CATEGORY_CODES[TileCategory.RESOURCE]).astype(np.int8)
+    res_type = np.where(obstacle, RESOURCE_CODES[ResourceType.NONE], res_codes[res_index]).astype(np.int8)
+    level[obstacle] = 1
+
+    return {
+        "category": category,
+        "res_type": res_type,
+        "level": level,
+        "owner": np.full((height, width), -1, dtype=np.int32),
+    }
+
+
+def generate_world(width: int, height: int, seed: Optional[int] = None) -> WorldMap:
+    """시드 기반 절차적 WorldMap 생성 (seed가 None이면 무작위 시드)"""
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % (2 ** 32))
+    return WorldMap.from_arrays(generate_map_arrays(width, height, seed))
@@ -1,27 +1,80 @@
-from typing import List, Dict, Optional
+import time
+from typing import List, Dict, Optional, TYPE_CHECKING
+from src.common.metrics import REGISTRY
 from src.models.world_map import WorldMap
 from src.models.march import March, MarchStatus
 from src.models.tile import Tile, TileCategory
 from src.models.army import Army
 from src.models.champion import Champion
-from src.factories.champion_factory import create_champion
 from src.logic.battle.battle import Battle
+from src.logic.guard_roster import GuardRoster
+from src.logic.arrival_resolver import battle_seed, seeded_random
+if TYPE_CHECKING:
+    from src.logic.arrival_resolver import ArrivalResolver
+    from src.logic.interception import InterceptionDetector
+
+MAP_TICK_SECONDS = REGISTRY.histogram("leagueslg_map_tick_seconds", "MapManager.update 1회 소요 시간")
+ACTIVE_MARCHES = REGISTRY.gauge("leagueslg_active_marches", "마지막 틱 이후 진행 중인 행군 수")
+
+
+class MapManagerListener:
+    """
+    부대/행군 변경 알림을 받는 서브시스템의 베이스 클래스.
+    필요한 메서드만 오버라이드하면 됩니다.
+    """
+    def on_army_changed(self, army: Army):
+        pass
+
+    def on_march_started(self, march: March):
+        pass
+
+    def on_march_finished(self, march: March):
+        pass
+
 
 class MapManager:
     """
     월드 맵과 행군 부대들을 총괄 관리하는 클래스
     """
-    def __init__(self, world_map: WorldMap):
+    def __init__(self, world_map: WorldMap, guard_roster: Optional[GuardRoster] = None):
         self.world_map = world_map
         self.active_marches: List[March] = []
         self.armies: Dict[str, Army] = {}
+        self._listeners: List[MapManagerListener] = []
+        # 중립 수비군 풀 (data/guards.json 기반)
+        self.guard_roster = guard_roster or GuardRoster()
+        # 같은 틱 도착 일괄 처리기 (None이면 기존처럼 순차 처리)
+        self.resolver: Optional['ArrivalResolver'] = None
+        # 행군 경로 조우 탐지기 (None이면 목적지에서만 판정)
+        self.interceptor: Optional['InterceptionDetector'] = None
+        # 누적 전투 횟수 (벤치마크/모니터링용)
+        self.battle_count = 0
+        # update 호출 횟수 (전투 난수 시드에 사용)
+        self.tick = 0
+
+    def add_listener(self, listener: MapManagerListener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: MapManagerListener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify_army_change(self, army: Army):
+        for listener in self._listeners:
+            listener.on_army_changed(army)
 
     def create_army(self, user_id: str, champion: Champion) -> Army:
         army_id = f"army_{user_id}_{champion.name}"
         army = Army(army_id, user_id, champion)
-        self.armies[army_id] = army
+        self.register_army(army)
         return army
 
+    def register_army(self, army: Army):
+        """외부에서 생성(또는 복원)된 부대를 관리 대상으로 등록"""
+        self.armies[army.id] = army
+        army.on_change = self._notify_army_change
+        self._notify_army_change(army)
+
     def send_march(self, army: Army, target_pos: tuple, is_retreat: bool = False):
         """부대를 파견 (일반 행군 또는 후퇴)"""
         x, y = target_pos
@@ -47,17 +100,88 @@ class MapManager:
             print(f"[{army.owner_id}] {army.champion.name} 부대가 {target_pos}로 이동을 시작했습니다.")
             
         self.active_marches.append(march)
+        for listener in self._listeners:
+            listener.on_march_started(march)
         return march
 
     def update(self):
         """행군 상태 체크"""
+        started = time.perf_counter()
+        try:
+            self._update()
+        finally:
+            MAP_TICK_SECONDS.observe(time.perf_counter() - started)
+            ACTIVE_MARCHES.set(len(self.active_marches))
+
+    def _update(self):
+        self.tick += 1
+        if self.interceptor:
+            self._resolve_interceptions()
+
         arrived_marches = [m for m in self.active_marches if m.is_arrived()]
+        if self.resolver and arrived_marches:
+            # 같은 틱의 도착을 묶어 병렬 전투 후 결정적 순서로 반영
+            self.resolver.resolve(self, arrived_marches)
+            for march in arrived_marches:
+                self._finish_march(march)
+            return
+
         for march in arrived_marches:
             self._handle_arrival(march)
-            self.active_marches.remove(march)
+            self._finish_march(march)
+
+    def _finish_march(self, march: March):
+        self.active_marches.remove(march)
+        for listener in self._listeners:
+            listener.on_march_finished(march)
+
+    def _resolve_interceptions(self):
+        """이번 틱까지 발생한 행군 간 조우를 시각 순으로 처리"""
+        while True:
+            encounter = self.interceptor.pop_next()
+            if encounter is None:
+                break
+            self._handle_interception(*encounter)
+
+    def _handle_interception(self, march_a: March, march_b: March, pos: tuple):
+        """
+        적대 행군 간 야전: 조우 지점에서 전투 후 패자는 행군을 멈추고 본진으로 후퇴,
+        승자는 원래 목적지로 계속 행군
+        """
+        x, y = int(round(pos[0])), int(round(pos[1]))
+        print(f"\n>>> [{march_a.user_id}] vs [{march_b.user_id}] 부대가 ({x}, {y})에서 조우! 야전 발생")
+        self.battle_count += 1
+        with seeded_random(battle_seed(self.tick, march_a.army.id, march_b.army.id)):
+            battle = Battle(march_a.army.champion, march_b.army.champion)
+            battle.start()
+
+        loser = march_b if march_a.army.champion.is_alive() else march_a
+        army = loser.army
+        print(f"결과: [{loser.user_id}] 부대 패배. 본진으로 후퇴합니다.")
+        loser.status = MarchStatus.COMPLETED
+        self._finish_march(loser)
+        army.champion.current_hp = max(army.champion.current_hp, 1)
+        # 전투로 바뀐 양쪽 병력(HP)을 구독자(영속화/청크 등)에 알림
+        march_a.army.notify_changed()
+        march_b.army.notify_changed()
+        army.set_position(x, y)
+        self.send_march(army, army.home_pos, is_retreat=True)
 
-    def _handle_arrival(self, march: March):
-        """목적지 도착 시 처리 (전투 및 점령)"""
+    def needs_guard_battle(self, march: March) -> bool:
+        """도착 시 중립 수비군과 전투가 필요한지 (현재 타일 상태 기준)"""
+        tile = self.world_map.get_tile(*march.target_pos)
+        return (
+            tile is not None
+            and march.status != MarchStatus.RETURNING
+            and tile.category == TileCategory.RESOURCE
+            and not tile.owner_id
+        )
+
+    def _handle_arrival(self, march: March, fought: bool = False):
+        """
+        목적지 도착 시 처리 (전투 및 점령)
+        fought: 수비군 전투를 외부(병렬 해결 단계)에서 이미 치르고 결과가 챔피언에 반영된 경우
+        """
         x, y = march.target_pos
         tile = self.world_map.get_tile(x, y)
         army = march.army
@@ -77,16 +201,17 @@ class MapManager:
         # 1. 자원 타일의 수비군(NPC) 전투 체크
         if tile.category == TileCategory.RESOURCE and not tile.owner_id:
             print(f"--- [Lv.{tile.level} {tile.res_type.value}] 수비군 대치! ---")
+            self.battle_count += 1
             
-            # 수비군 생성: Lv.N 다리우스 (유저 요청대로 기본 stat에 따른 HP 사용)
-            npc_champ = create_champion("Darius")
-            npc_champ.level = tile.level
-            npc_champ.recalculate_stats()
-            npc_champ.reset_status() # HP 풀로 채우기
-            
-            # 교전 시작
-            battle = Battle(army.champion, npc_champ)
-            battle.start()
+            if not fought:
+                # 수비군: 타일 레벨별 템플릿 풀에서 꺼내 사용 (구성은 data/guards.json)
+                npc_champ = self.guard_roster.acquire(tile.level)
+                
+                # 교전 시작 (병렬 처리와 같은 시드)
+                with seeded_random(battle_seed(self.tick, army.id)):
+                    battle = Battle(army.champion, npc_champ)
+                    battle.start()
+                self.guard_roster.release(npc_champ)
             
             if army.champion.is_alive():
                 print(f"결과: 점령 성공! 이제 ({x}, {y})는 {army.owner_id}의 영토입니다.")
@@ -97,6 +222,8 @@ class MapManager:
                 # 전투 중 사망했더라도 시스템 상 부대를 유지하기 위해 HP 1로 부활(후퇴 편의상)
                 army.champion.current_hp = 1 
                 self.send_march(army, army.home_pos, is_retreat=True)
+            # 수비군 전투로 바뀐 병력(HP) 알림
+            army.notify_changed()
             
         # 2. 타인의 건물지 공격 (생략 가능, 현재는 자동 승리/점령으로 임시 처리)
         elif tile.owner_id and tile.owner_id != army.owner_id:
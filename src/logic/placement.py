@@ -0,0 +1,89 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from src.models.world_map import WorldMap, WorldMapListener, CATEGORY_CODES
+from src.models.building import Building, BuildingType
+from src.models.tile import TileCategory
+
+Pos = Tuple[int, int]
+
+
+class PlacementIndex(WorldMapListener):
+    """
+    건물 배치 가능 여부 인덱스
+    - blocked: 장애물/건물 타일 비트맵 (height, width)
+    - 누적합 테이블(SAT): 임의 사각형 안의 막힌 칸 수를 O(1)로 계산
+    건물 배치 시 비트맵만 즉시 갱신하고, SAT는 다음 조회 때 변경된 행부터 다시 누적
+    """
+    def __init__(self, world_map: WorldMap):
+        self.world_map = world_map
+        self.rebuild()
+        world_map.add_listener(self)
+
+    def rebuild(self):
+        """그리드 전체에서 비트맵과 SAT를 다시 생성 (타일 카테고리를 직접 바꾼 경우 호출)"""
+        arrays, _ = self.world_map.to_arrays()
+        category = arrays["category"]
+        self.blocked = (category == CATEGORY_CODES[TileCategory.OBSTACLE]) | \
+                       (category == CATEGORY_CODES[TileCategory.BUILDING])
+        self._sat = np.zeros((self.world_map.height + 1, self.world_map.width + 1), dtype=np.int32)
+        self._dirty_row: Optional[int] = 0
+
+    def on_building_placed(self, building: Building):
+        for x, y in building.occupied_tiles:
+            self.blocked[y, x] = True
+        row = building.root_pos[1]
+        self._dirty_row = row if self._dirty_row is None else min(self._dirty_row, row)
+
+    def _refresh(self):
+        """dirty 행부터 SAT를 다시 누적: S[r+1:] = S[r] + 누적합"""
+        r = self._dirty_row
+        if r is None:
+            return
+        part = np.cumsum(np.cumsum(self.blocked[r:], axis=1, dtype=np.int32), axis=0, dtype=np.int32)
+        self._sat[r + 1:, 1:] = self._sat[r, 1:] + part
+        self._dirty_row = None
+
+    def blocked_count(self, x0: int, y0: int, x1: int, y1: int) -> int:
+        """[x0, x1) x [y0, y1) 사각형 안의 막힌 칸 수"""
+        self._refresh()
+        s = self._sat
+        return int(s[y1, x1] - s[y0, x1] - s[y1, x0] + s[y0, x0])
+
+    def can_place(self, b_type: BuildingType, root_pos: Pos) -> bool:
+        """WorldMap.can_place_building 과 같은 판정을 O(1)로 수행"""
+        size = b_type.value[1]
+        rx, ry = root_pos
+        if rx < 0 or ry < 0 or rx + size > self.world_map.width or ry + size > self.world_map.height:
+            return False
+        return self.blocked_count(rx, ry, rx + size, ry + size) == 0
+
+    def valid_root_mask(self, b_type: BuildingType) -> np.ndarray:
+        """
+        모든 루트 좌표의 배치 가능 여부를 한 번에 계산.
+        반환 배열의 [y, x]가 루트 (x, y)에 대응 (크기: height-size+1, width-size+1)
+        """
+        self._refresh()
+        size = b_type.value[1]
+        s = self._sat
+        if size > self.world_map.width or size > self.world_map.height:
+            return np.zeros((0, 0), dtype=bool)
+        counts = s[size:, size:] - s[:-size, size:] - s[size:, :-size] + s[:-size, :-size]
+        return counts == 0
+
+    def valid_roots(self, b_type: BuildingType) -> List[Pos]:
+        ys, xs = np.nonzero(self.valid_root_mask(b_type))
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def find_nearest(self, b_type: BuildingType, pos: Pos) -> Optional[Pos]:
+        """pos에 가장 가까운(건물 중심 기준 유클리드 거리) 배치 가능 루트 좌표"""
+        mask = self.valid_root_mask(b_type)
+        ys, xs = np.nonzero(mask)
+        if len(xs) == 0:
+            return None
+        half = (b_type.value[1] - 1) / 2
+        dist = (xs + half - pos[0]) ** 2 + (ys + half - pos[1]) ** 2
+        i = int(np.argmin(dist))
+        return int(xs[i]), int(ys[i])
+
+    def __repr__(self):
+        return f"PlacementIndex({self.world_map.width}x{self.world_map.height}, blocked={int(self.blocked.sum())})"
@@ -0,0 +1,122 @@
+from typing import Dict, List, Optional
+import numpy as np
+from src.models.world_map import WorldMap, WorldMapListener, CATEGORY_CODES
+from src.models.tile import Tile, TileCategory, ResourceType, PRODUCTION_PER_LEVEL
+
+# 자원 코드 → ResourceType (WorldMap.to_arrays 의 코드와 동일한 순서)
+RESOURCE_TYPES: List[ResourceType] = list(ResourceType)
+
+
+class ProductionEngine(WorldMapListener):
+    """
+    소유주별 자원 생산량 집계 엔진
+    - rebuild(): 그리드 배열을 한 번에 집계 (O(타일), 초기화/재동기화용)
+    - 타일 점령/상실 시 해당 타일의 기여분만 증감
+    - tick(): 누적된 소유주별 합계만 사용 (O(소유주))
+    """
+    def __init__(self, world_map: WorldMap):
+        self.world_map = world_map
+        self.owners: List[str] = []
+        self._owner_index: Dict[str, int] = {}
+        self._totals = np.zeros((0, len(RESOURCE_TYPES)), dtype=np.int64)
+        self._stockpile = np.zeros((0, len(RESOURCE_TYPES)), dtype=np.int64)
+        self.rebuild()
+        world_map.add_listener(self)
+
+    def rebuild(self):
+        """그리드 전체를 배열로 변환하여 소유주 x 자원 생산량을 한 번에 집계"""
+        arrays, owners = self.world_map.to_arrays()
+        res_count = len(RESOURCE_TYPES)
+
+        # 기존 비축량은 소유주 이름 기준으로 보존
+        old_stockpile = {o: self._stockpile[i] for i, o in enumerate(self.owners)}
+        for owner_id in old_stockpile:
+            if owner_id not in owners:
+                owners.append(owner_id)
+
+        self.owners = owners
+        self._owner_index = {o: i for i, o in enumerate(owners)}
+
+        # 타일별로 현재 반영된 기여분 (소유주, 자원, 생산량)
+        is_resource = arrays["category"] == CATEGORY_CODES[TileCategory.RESOURCE]
+        self._owner = arrays["owner"]
+        self._res = arrays["res_type"]
+        self._amount = np.where(is_resource, arrays["level"].astype(np.int64) * PRODUCTION_PER_LEVEL, 0)
+
+        owned = self._owner >= 0
+        keys = self._owner[owned].astype(np.int64) * res_count + self._res[owned]
+        totals = np.bincount(keys, weights=self._amount[owned], minlength=len(owners) * res_count)
+        self._totals = totals.astype(np.int64).reshape(len(owners), res_count)
+
+        self._stockpile = np.zeros_like(self._totals)
+        for owner_id, stock in old_stockpile.items():
+            self._stockpile[self._owner_index[owner_id]] = stock
+
+    def _get_owner_index(self, owner_id: str) -> int:
+        idx = self._owner_index.get(owner_id)
+        if idx is None:
+            idx = self._owner_index[owner_id] = len(self.owners)
+            self.owners.append(owner_id)
+            empty = np.zeros((1, len(RESOURCE_TYPES)), dtype=np.int64)
+            self._totals = np.vstack([self._totals, empty])
+            self._stockpile = np.vstack([self._stockpile, empty])
+        return idx
+
+    def on_tile_owner_changed(self, tile: Tile, old_owner: Optional[str]):
+        self._refresh_tile(tile)
+
+    def on_building_placed(self, building):
+        """
+        이미 소유한 타일에 건물을 지으면 소유주 변경 알림 없이 카테고리만 바뀌므로
+        건물이 차지한 타일의 기여분을 다시 계산
+        """
+        for x, y in building.occupied_tiles:
+            self._refresh_tile(self.world_map.get_tile(x, y))
+
+    def _refresh_tile(self, tile: Tile):
+        """반영돼 있던 기여분을 빼고 현재 타일 상태(소유주/카테고리/레벨) 기준으로 다시 더함"""
+        x, y = tile.x, tile.y
+        old_idx = self._owner[y, x]
+        if old_idx >= 0:
+            self._totals[old_idx, self._res[y, x]] -= self._amount[y, x]
+
+        self._res[y, x] = RESOURCE_TYPES.index(tile.res_type)
+        self._amount[y, x] = tile.level * PRODUCTION_PER_LEVEL if tile.category == TileCategory.RESOURCE else 0
+
+        if tile.owner_id is None:
+            self._owner[y, x] = -1
+            return
+
+        new_idx = self._get_owner_index(tile.owner_id)
+        self._owner[y, x] = new_idx
+        self._totals[new_idx, self._res[y, x]] += self._amount[y, x]
+
+    def get_income(self, owner_id: str) -> Dict[str, int]:
+        """소유주의 틱당 자원 생산량 (Tile.get_production 합계와 동일)"""
+        idx = self._owner_index.get(owner_id)
+        if idx is None:
+            return {}
+        return self._to_dict(self._totals[idx])
+
+    def get_stockpile(self, owner_id: str) -> Dict[str, int]:
+        idx = self._owner_index.get(owner_id)
+        if idx is None:
+            return {}
+        return self._to_dict(self._stockpile[idx])
+
+    def tick(self, ticks: int = 1) -> Dict[str, Dict[str, int]]:
+        """생산 틱: 소유주별 생산량을 비축량에 더하고 이번 틱의 생산량을 반환"""
+        produced = self._totals * ticks
+        self._stockpile += produced
+        return {
+            owner_id: self._to_dict(produced[idx])
+            for idx, owner_id in enumerate(self.owners)
+            if produced[idx].any()
+        }
+
+    @staticmethod
+    def _to_dict(row: np.ndarray) -> Dict[str, int]:
+        return {RESOURCE_TYPES[i].name: int(v) for i, v in enumerate(row) if v}
+
+    def __repr__(self):
+        return f"ProductionEngine(owners={len(self.owners)})"
@@ -0,0 +1,115 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+DEFAULT_RATING = 1500.0
+K_FACTOR = 32.0
+# 순위 인덱스 버킷 범위 (레이팅 1점 = 버킷 1개, 범위 밖은 양 끝 버킷으로)
+MIN_RATING = 0
+MAX_RATING = 4000
+
+
+def expected_score(rating_a: float, rating_b: float) -> float:
+    """Elo 기대 승률 (a 기준)"""
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400.0))
+
+
+def elo_update(rating_a: float, rating_b: float, score_a: float, k: float = K_FACTOR) -> Tuple[float, float]:
+    """
+    Elo 갱신. score_a: a의 결과 (승 1, 무 0.5, 패 0)
+    두 선수의 변동량 합은 항상 0
+    """
+    delta = k * (score_a - expected_score(rating_a, rating_b))
+    return rating_a + delta, rating_b - delta
+
+
+class RankIndex:
+    """
+    레이팅 순위 인덱스 (메모리)
+    - 정수 레이팅 버킷 위의 펜윅 트리로 '나보다 높은 유저 수'를 O(log B)에 계산
+    - 버킷마다 소속 유저 집합을 두고, 상위 N은 k번째 원소 탐색으로 빈 버킷을 건너뛰며 수집
+    - 같은 버킷(정수 레이팅이 같은 유저)은 같은 순위
+    """
+    def __init__(self, min_rating: int = MIN_RATING, max_rating: int = MAX_RATING):
+        self.min_rating = min_rating
+        self.size = max_rating - min_rating + 1
+        self._tree = [0] * (self.size + 1)
+        self._members: Dict[int, Set[int]] = {}
+        self._ratings: Dict[int, float] = {}
+        self._log = 1 << (self.size.bit_length() - 1)
+
+    def _bucket(self, rating: float) -> int:
+        return min(max(int(rating) - self.min_rating, 0), self.size - 1)
+
+    def _add(self, bucket: int, delta: int):
+        i = bucket + 1
+        while i <= self.size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, bucket: int) -> int:
+        """버킷 0..bucket의 유저 수"""
+        total, i = 0, bucket + 1
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _kth(self, k: int) -> int:
+        """누적 유저 수가 k 이상이 되는 첫 버킷 (1 <= k <= len)"""
+        pos, step = 0, self._log
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self._tree[nxt] < k:
+                pos = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        return pos
+
+    # -------------------------
+    # 갱신
+    # -------------------------
+    def set(self, user_id: int, rating: float):
+        self.remove(user_id)
+        bucket = self._bucket(rating)
+        self._ratings[user_id] = rating
+        self._members.setdefault(bucket, set()).add(user_id)
+        self._add(bucket, 1)
+
+    def remove(self, user_id: int):
+        rating = self._ratings.pop(user_id, None)
+        if rating is None:
+            return
+        bucket = self._bucket(rating)
+        members = self._members[bucket]
+        members.discard(user_id)
+        if not members:
+            del self._members[bucket]
+        self._add(bucket, -1)
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def rating(self, user_id: int) -> Optional[float]:
+        return self._ratings.get(user_id)
+
+    def rank(self, user_id: int) -> Optional[int]:
+        """1위부터의 순위 (나보다 높은 버킷의 유저 수 + 1)"""
+        rating = self._ratings.get(user_id)
+        if rating is None:
+            return None
+        return len(self._ratings) - self._prefix(self._bucket(rating)) + 1
+
+    def top(self, n: int = 100) -> List[Tuple[int, int, float]]:
+        """상위 n명 [(순위, user_id, rating)] - 같은 버킷 안에서는 레이팅 → user_id 순"""
+        result = []
+        remaining = len(self._ratings)
+        while remaining > 0 and len(result) < n:
+            bucket = self._kth(remaining)
+            members = sorted(self._members[bucket], key=lambda uid: (-self._ratings[uid], uid))
+            rank = len(self._ratings) - remaining + 1
+            for user_id in members[:n - len(result)]:
+                result.append((rank, user_id, self._ratings[user_id]))
+            remaining -= len(members)
+        return result
+
+    def __len__(self):
+        return len(self._ratings)
@@ -0,0 +1,177 @@
+import contextlib
+import io
+import random
+import resource
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from src.models.army import Army
+from src.models.building import BuildingType
+from src.models.march import March
+from src.models.tile import TileCategory
+from src.logic.map_manager import MapManager, MapManagerListener
+from src.logic.map_generator import generate_world
+from src.logic.placement import PlacementIndex
+from src.logic.arrival_resolver import ArrivalResolver
+from src.logic.interception import InterceptionDetector
+from src.factories.champion_factory import create_champion, _load_champion_data
+
+
+class VirtualClock:
+    """March.clock 대신 사용하는 가상 시계 (틱마다 수동으로 전진)"""
+    def __init__(self, start: Optional[datetime] = None):
+        self.current = start or datetime(2025, 1, 1)
+
+    def now(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: float):
+        self.current += timedelta(seconds=seconds)
+
+
+class _ArrivalRecorder(MapManagerListener):
+    """도착 처리 지연(가상 시각 기준)을 기록"""
+    def __init__(self, clock: VirtualClock):
+        self.clock = clock
+        self.arrivals = 0
+        self.total_lag = 0.0
+
+    def on_march_finished(self, march: March):
+        if self.clock.now() < march.arrival_time:
+            return  # 도착 전에 중단된 행군 (야전 패배 등)
+        self.arrivals += 1
+        self.total_lag += (self.clock.now() - march.arrival_time).total_seconds()
+
+
+class BotPlayer:
+    """
+    스크립트 봇: 매 틱 확률적으로
+    - 대기/주둔 중인 부대를 본진 주변 자원 타일로 파견 (점령 시도)
+    - 주둔 중인 부대를 본진으로 후퇴
+    """
+    def __init__(self, user_id: str, castle_pos, armies: List[Army], rng: random.Random,
+                 action_rate: float = 0.2, retreat_rate: float = 0.1, radius: int = 12):
+        self.user_id = user_id
+        self.castle_pos = castle_pos
+        self.armies = armies
+        self.rng = rng
+        self.action_rate = action_rate
+        self.retreat_rate = retreat_rate
+        self.radius = radius
+
+    def act(self, manager: MapManager):
+        world_map = manager.world_map
+        for army in self.armies:
+            if army.status == "MARCHING" or self.rng.random() >= self.action_rate:
+                continue
+            if army.status == "STATIONED" and self.rng.random() < self.retreat_rate:
+                manager.send_march(army, army.home_pos, is_retreat=True)
+                continue
+
+            # 체력이 너무 낮으면 본진에서 회복 후 재출격
+            if army.troop_count < army.max_troop_count * 0.3:
+                army.recover_troops(army.max_troop_count)
+                continue
+
+            x = self.castle_pos[0] + self.rng.randint(-self.radius, self.radius)
+            y = self.castle_pos[1] + self.rng.randint(-self.radius, self.radius)
+            tile = world_map.get_tile(x, y)
+            if tile and tile.category == TileCategory.RESOURCE and tile.owner_id != self.user_id:
+                manager.send_march(army, (x, y))
+
+
+class WorldSimulation:
+    """
+    맵 레이어 확장성 벤치마크용 헤드리스 월드 시뮬레이션
+    - 시드 기반 맵 생성, 봇마다 주성 배치(place_building) 및 부대 생성
+    - 가상 시계로 틱을 진행하며 봇의 행군/점령/후퇴를 처리
+    - ticks/sec, 도착 지연, battles/sec, 메모리 증가량을 보고
+    """
+    def __init__(self, size: int = 200, bots: int = 50, armies_per_bot: int = 3, seed: int = 0,
+                 tick_seconds: float = 10.0, workers: int = 0, intercept: bool = False):
+        self.rng = random.Random(seed)
+        random.seed(seed)  # 전투 내부의 확률 판정도 재현 가능하게
+        self.tick_seconds = tick_seconds
+
+        self.clock = VirtualClock()
+        self._saved_clock = March.__dict__["clock"]
+        March.clock = self.clock.now
+
+        self.world_map = generate_world(size, size, seed)
+        self.manager = MapManager(self.world_map)
+        self.manager.guard_roster.prewarm(range(1, 9))
+        if workers:
+            self.manager.resolver = ArrivalResolver(max_workers=workers, min_parallel=2)
+        if intercept:
+            InterceptionDetector(self.manager)
+
+        self.recorder = _ArrivalRecorder(self.clock)
+        self.manager.add_listener(self.recorder)
+        self.bots = self._spawn_bots(bots, armies_per_bot)
+
+    def _spawn_bots(self, count: int, armies_per_bot: int) -> List[BotPlayer]:
+        placement = PlacementIndex(self.world_map)
+        champion_keys = list(_load_champion_data().keys())
+        bots = []
+        for i in range(count):
+            user_id = f"Bot{i}"
+            target = (self.rng.randrange(self.world_map.width), self.rng.randrange(self.world_map.height))
+            root = placement.find_nearest(BuildingType.MAIN_CASTLE, target)
+            if root is None or not self.world_map.place_building(BuildingType.MAIN_CASTLE, user_id, root):
+                break
+
+            armies = []
+            for j in range(armies_per_bot):
+                champ = create_champion(self.rng.choice(champion_keys))
+                army = Army(f"army_{user_id}_{j}", user_id, champ)
+                army.home_pos = root
+                army.set_position(*root)
+                self.manager.register_army(army)
+                armies.append(army)
+            bots.append(BotPlayer(user_id, root, armies, random.Random(self.rng.random())))
+        return bots
+
+    def run(self, ticks: int = 500, quiet: bool = True) -> Dict[str, float]:
+        rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        battles_start = self.manager.battle_count
+        tick_times = []
+
+        out = io.StringIO() if quiet else None
+        with contextlib.redirect_stdout(out) if quiet else contextlib.nullcontext():
+            started = time.perf_counter()
+            for _ in range(ticks):
+                t0 = time.perf_counter()
+                self.clock.advance(self.tick_seconds)
+                for bot in self.bots:
+                    bot.act(self.manager)
+                self.manager.update()
+                tick_times.append(time.perf_counter() - t0)
+                if out is not None:
+                    out.seek(0)
+                    out.truncate()
+            elapsed = time.perf_counter() - started
+
+        tick_times.sort()
+        battles = self.manager.battle_count - battles_start
+        arrivals = self.recorder.arrivals
+        return {
+            "ticks": ticks,
+            "bots": len(self.bots),
+            "armies": len(self.manager.armies),
+            "elapsed_sec": elapsed,
+            "ticks_per_sec": ticks / elapsed if elapsed else 0.0,
+            "tick_p50_ms": tick_times[len(tick_times) // 2] * 1000 if tick_times else 0.0,
+            "tick_p99_ms": tick_times[int(len(tick_times) * 0.99)] * 1000 if tick_times else 0.0,
+            "arrivals": arrivals,
+            "avg_arrival_lag_sec": self.recorder.total_lag / arrivals if arrivals else 0.0,
+            "battles": battles,
+            "battles_per_sec": battles / elapsed if elapsed else 0.0,
+            "active_marches": len(self.manager.active_marches),
+            # ru_maxrss: Linux는 KB 단위
+            "peak_rss_growth_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_start) / 1024,
+        }
+
+    def close(self):
+        March.clock = self._saved_clock
+        if self.manager.resolver:
+            self.manager.resolver.shutdown()
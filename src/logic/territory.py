@@ -0,0 +1,161 @@
+from typing import Dict, List, Optional, Set, Tuple
+from src.models.world_map import WorldMap, WorldMapListener
+from src.models.building import Building, BuildingType
+from src.models.tile import Tile
+
+Pos = Tuple[int, int]
+
+# 상하좌우 인접 (대각선은 연결로 보지 않음)
+NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class TerritoryIndex(WorldMapListener):
+    """
+    소유주별 영토 인덱스
+    - 소유주 → 타일 좌표 집합
+    - 소유주별 연결 요소(Union-Find): 점령 시 인접 타일과 즉시 합침
+    - 타일 상실 시에는 요소가 쪼개질 수 있으므로 해당 소유주만 다음 조회 때 재구성
+    """
+    def __init__(self, world_map: WorldMap):
+        self.world_map = world_map
+        self.tiles: Dict[str, Set[Pos]] = {}
+        self.castles: Dict[str, List[Pos]] = {}
+        self._parent: Dict[str, Dict[Pos, Pos]] = {}
+        self._size: Dict[str, Dict[Pos, int]] = {}
+        self._dirty: Set[str] = set()
+
+        for row in world_map.grid:
+            for tile in row:
+                if tile.owner_id is not None:
+                    self.tiles.setdefault(tile.owner_id, set()).add((tile.x, tile.y))
+                if tile.is_building_root and tile.building.type == BuildingType.MAIN_CASTLE:
+                    self.castles.setdefault(tile.building.owner_id, []).append((tile.x, tile.y))
+        self._dirty.update(self.tiles)
+
+        world_map.add_listener(self)
+
+    # -------------------------
+    # WorldMap 알림
+    # -------------------------
+    def on_tile_owner_changed(self, tile: Tile, old_owner: Optional[str]):
+        pos = (tile.x, tile.y)
+        if old_owner is not None:
+            self.tiles[old_owner].discard(pos)
+            self._dirty.add(old_owner)
+        if tile.owner_id is not None:
+            self._add(tile.owner_id, pos)
+
+    def on_building_placed(self, building: Building):
+        if building.type == BuildingType.MAIN_CASTLE:
+            self.castles.setdefault(building.owner_id, []).append(building.root_pos)
+
+    # -------------------------
+    # Union-Find
+    # -------------------------
+    def _add(self, owner_id: str, pos: Pos):
+        owned = self.tiles.setdefault(owner_id, set())
+        owned.add(pos)
+        if owner_id in self._dirty:
+            return  # 재구성 시 함께 처리됨
+
+        parent = self._parent.setdefault(owner_id, {})
+        self._size.setdefault(owner_id, {})
+        parent[pos] = pos
+        self._size[owner_id][pos] = 1
+        for dx, dy in NEIGHBOR_OFFSETS:
+            neighbor = (pos[0] + dx, pos[1] + dy)
+            if neighbor in owned:
+                self._union(owner_id, pos, neighbor)
+
+    def _rebuild(self, owner_id: str):
+        owned = self.tiles.get(owner_id, set())
+        self._parent[owner_id] = {p: p for p in owned}
+        self._size[owner_id] = {p: 1 for p in owned}
+        self._dirty.discard(owner_id)
+        for x, y in owned:
+            # 오른쪽/아래쪽만 보면 모든 인접 쌍을 한 번씩 처리
+            for neighbor in ((x + 1, y), (x, y + 1)):
+                if neighbor in owned:
+                    self._union(owner_id, (x, y), neighbor)
+
+    def _find(self, owner_id: str, pos: Pos) -> Pos:
+        parent = self._parent[owner_id]
+        root = pos
+        while parent[root] != root:
+            root = parent[root]
+        # 경로 압축
+        while parent[pos] != root:
+            parent[pos], pos = root, parent[pos]
+        return root
+
+    def _union(self, owner_id: str, a: Pos, b: Pos):
+        ra, rb = self._find(owner_id, a), self._find(owner_id, b)
+        if ra == rb:
+            return
+        size = self._size[owner_id]
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self._parent[owner_id][rb] = ra
+        size[ra] += size[rb]
+
+    def _ensure_clean(self, owner_id: str):
+        if owner_id in self._dirty:
+            self._rebuild(owner_id)
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def get_tiles(self, owner_id: str) -> Set[Pos]:
+        """소유주의 모든 타일 좌표 (읽기 전용으로 사용)"""
+        return self.tiles.get(owner_id, set())
+
+    def tile_count(self, owner_id: str) -> int:
+        return len(self.tiles.get(owner_id, ()))
+
+    def is_adjacent(self, owner_id: str, pos: Pos) -> bool:
+        """pos가 소유주의 영토와 상하좌우로 맞닿아 있는지"""
+        owned = self.tiles.get(owner_id)
+        if not owned:
+            return False
+        return any((pos[0] + dx, pos[1] + dy) in owned for dx, dy in NEIGHBOR_OFFSETS)
+
+    def component_of(self, owner_id: str, pos: Pos) -> Optional[Pos]:
+        """pos가 속한 연결 요소의 대표 좌표 (소유하지 않은 타일이면 None)"""
+        if pos not in self.tiles.get(owner_id, ()):
+            return None
+        self._ensure_clean(owner_id)
+        return self._find(owner_id, pos)
+
+    def component_size(self, owner_id: str, pos: Pos) -> int:
+        root = self.component_of(owner_id, pos)
+        return self._size[owner_id][root] if root else 0
+
+    def is_connected(self, owner_id: str, a: Pos, b: Pos) -> bool:
+        root = self.component_of(owner_id, a)
+        return root is not None and root == self.component_of(owner_id, b)
+
+    def is_connected_to_castle(self, owner_id: str, pos: Pos) -> bool:
+        """pos가 소유주의 주성과 끊기지 않은 영토로 이어져 있는지"""
+        root = self.component_of(owner_id, pos)
+        if root is None:
+            return False
+        return any(self.component_of(owner_id, c) == root for c in self.castles.get(owner_id, ()))
+
+    def can_attack(self, owner_id: str, pos: Pos, require_castle_link: bool = False) -> bool:
+        """
+        SLG 규칙: 자신의 영토와 맞닿은 타일만 공격 가능.
+        require_castle_link 이면 맞닿은 영토가 주성과 연결되어 있어야 함.
+        """
+        tile = self.world_map.get_tile(*pos)
+        if not tile or tile.owner_id == owner_id:
+            return False
+        for dx, dy in NEIGHBOR_OFFSETS:
+            neighbor = (pos[0] + dx, pos[1] + dy)
+            if neighbor not in self.tiles.get(owner_id, ()):
+                continue
+            if not require_castle_link or self.is_connected_to_castle(owner_id, neighbor):
+                return True
+        return False
+
+    def __repr__(self):
+        return f"TerritoryIndex(owners={len(self.tiles)})"
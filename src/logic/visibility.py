@@ -0,0 +1,153 @@
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from src.models.world_map import WorldMap, WorldMapListener
+from src.models.building import Building
+from src.models.tile import Tile
+from src.models.army import Army
+from src.models.march import March
+from src.logic.map_manager import MapManager, MapManagerListener
+from src.logic.map_chunks import CHUNK_SIZE
+
+# 시야 반경 (체비셰프 거리, 타일 수)
+TILE_VISION = 2
+BUILDING_VISION = 4
+ARMY_VISION = 3
+MARCH_TARGET_VISION = 1
+
+Pos = Tuple[int, int]
+
+
+class VisibilityIndex(WorldMapListener, MapManagerListener):
+    """
+    유저별 전장의 안개(시야) 인덱스
+    - 유저마다 청크 단위로 지연 할당되는 참조 카운트 배열을 유지 (count > 0 이면 보임)
+    - 시야 제공원: 소유 타일, 건물 footprint, 부대 위치, 행군 목적지
+    - 변경 알림이 오면 해당 제공원의 반경만 빼고 더함 (그리드 전체 스캔 없음)
+    - 청크별 리비전으로 맵 API 응답의 ETag를 구분
+    """
+    def __init__(self, world_map: WorldMap, map_manager: Optional[MapManager] = None,
+                 chunk_size: int = CHUNK_SIZE):
+        self.world_map = world_map
+        self.chunk_size = chunk_size
+        self._counts: Dict[str, Dict[Pos, np.ndarray]] = {}
+        self._revisions: Dict[str, Dict[Pos, int]] = {}
+        self._army_sources: Dict[str, Tuple[str, Pos]] = {}
+        self._march_sources: Dict[str, Tuple[str, Pos]] = {}
+        # 건물 id → (시야를 받은 소유주, 중심, 반경, footprint), footprint 타일 → 건물 id
+        self._building_sources: Dict[str, Tuple[str, Pos, int, List[Pos]]] = {}
+        self._building_tiles: Dict[Pos, str] = {}
+
+        for row in world_map.grid:
+            for tile in row:
+                if tile.owner_id:
+                    self._stamp(tile.owner_id, tile.x, tile.y, TILE_VISION, 1)
+                if tile.is_building_root:
+                    self.on_building_placed(tile.building)
+
+        world_map.add_listener(self)
+        if map_manager:
+            for army in map_manager.armies.values():
+                self.on_army_changed(army)
+            for march in map_manager.active_marches:
+                self.on_march_started(march)
+            map_manager.add_listener(self)
+
+    # -------------------------
+    # 참조 카운트 갱신
+    # -------------------------
+    def _stamp(self, user_id: str, x: int, y: int, radius: int, delta: int):
+        """(x, y) 중심 반경 radius 정사각형의 카운트를 delta만큼 변경"""
+        cs = self.chunk_size
+        x0, x1 = max(0, x - radius), min(self.world_map.width, x + radius + 1)
+        y0, y1 = max(0, y - radius), min(self.world_map.height, y + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        chunks = self._counts.setdefault(user_id, {})
+        revisions = self._revisions.setdefault(user_id, {})
+        for cy in range(y0 // cs, (y1 - 1) // cs + 1):
+            for cx in range(x0 // cs, (x1 - 1) // cs + 1):
+                counts = chunks.get((cx, cy))
+                if counts is None:
+                    counts = chunks[(cx, cy)] = np.zeros((cs, cs), dtype=np.uint16)
+                lx0, lx1 = max(x0, cx * cs) - cx * cs, min(x1, (cx + 1) * cs) - cx * cs
+                ly0, ly1 = max(y0, cy * cs) - cy * cs, min(y1, (cy + 1) * cs) - cy * cs
+                if delta > 0:
+                    counts[ly0:ly1, lx0:lx1] += delta
+                else:
+                    counts[ly0:ly1, lx0:lx1] -= -delta
+                revisions[(cx, cy)] = revisions.get((cx, cy), 0) + 1
+
+    def on_tile_owner_changed(self, tile: Tile, old_owner: Optional[str]):
+        if old_owner:
+            self._stamp(old_owner, tile.x, tile.y, TILE_VISION, -1)
+        if tile.owner_id:
+            self._stamp(tile.owner_id, tile.x, tile.y, TILE_VISION, 1)
+
+        # 건물 footprint 타일을 빼앗기거나 건물이 사라지면 건물 시야 회수
+        building_id = self._building_tiles.get((tile.x, tile.y))
+        if building_id is not None:
+            owner_id = self._building_sources[building_id][0]
+            if tile.building is None or tile.building.id != building_id or tile.owner_id != owner_id:
+                self._remove_building(building_id)
+
+    def on_building_placed(self, building: Building):
+        if building.id in self._building_sources:
+            self._remove_building(building.id)
+        center = building.root_pos[0] + building.size // 2, building.root_pos[1] + building.size // 2
+        radius = BUILDING_VISION + building.size // 2
+        self._building_sources[building.id] = (building.owner_id, center, radius, list(building.occupied_tiles))
+        for pos in building.occupied_tiles:
+            self._building_tiles[pos] = building.id
+        self._stamp(building.owner_id, center[0], center[1], radius, 1)
+
+    def _remove_building(self, building_id: str):
+        owner_id, center, radius, footprint = self._building_sources.pop(building_id)
+        for pos in footprint:
+            if self._building_tiles.get(pos) == building_id:
+                del self._building_tiles[pos]
+        self._stamp(owner_id, center[0], center[1], radius, -1)
+
+    def on_army_changed(self, army: Army):
+        old = self._army_sources.pop(army.id, None)
+        if old:
+            self._stamp(old[0], old[1][0], old[1][1], ARMY_VISION, -1)
+        if army.pos_x is not None:
+            self._army_sources[army.id] = (army.owner_id, (army.pos_x, army.pos_y))
+            self._stamp(army.owner_id, army.pos_x, army.pos_y, ARMY_VISION, 1)
+
+    def on_march_started(self, march: March):
+        self._march_sources[march.id] = (march.user_id, march.target_pos)
+        self._stamp(march.user_id, march.target_pos[0], march.target_pos[1], MARCH_TARGET_VISION, 1)
+
+    def on_march_finished(self, march: March):
+        source = self._march_sources.pop(march.id, None)
+        if source:
+            self._stamp(source[0], source[1][0], source[1][1], MARCH_TARGET_VISION, -1)
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def is_visible(self, user_id: str, x: int, y: int) -> bool:
+        cs = self.chunk_size
+        counts = self._counts.get(user_id, {}).get((x // cs, y // cs))
+        return counts is not None and counts[y % cs, x % cs] > 0
+
+    def chunk_mask(self, user_id: str, cx: int, cy: int) -> np.ndarray:
+        """청크의 가시 여부 (h, w) - 맵 가장자리 청크는 실제 크기로 잘라 반환"""
+        cs = self.chunk_size
+        w = min(cs, self.world_map.width - cx * cs)
+        h = min(cs, self.world_map.height - cy * cs)
+        counts = self._counts.get(user_id, {}).get((cx, cy))
+        if counts is None:
+            return np.zeros((h, w), dtype=bool)
+        return counts[:h, :w] > 0
+
+    def chunk_revision(self, user_id: str, cx: int, cy: int) -> int:
+        return self._revisions.get(user_id, {}).get((cx, cy), 0)
+
+    def visible_count(self, user_id: str) -> int:
+        return int(sum(np.count_nonzero(c) for c in self._counts.get(user_id, {}).values()))
+
+    def __repr__(self):
+        return f"VisibilityIndex(users={len(self._counts)})"
@@ -1,4 +1,4 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Callable, TYPE_CHECKING
 if TYPE_CHECKING:
     from src.models.champion import Champion
 
@@ -17,7 +17,20 @@ class Army:
         self.pos_x: Optional[int] = None
         self.pos_y: Optional[int] = None
         
-        self.status = "IDLE"  # IDLE, MARCHING, STATIONED
+        # 위치/상태 변경 알림 콜백 (MapManager가 연결)
+        self.on_change: Optional[Callable[['Army'], None]] = None
+        self._status = "IDLE"  # IDLE, MARCHING, STATIONED
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str):
+        changed = value != self._status
+        self._status = value
+        if changed and self.on_change:
+            self.on_change(self)
 
     @property
     def troop_count(self) -> int:
@@ -30,20 +43,34 @@ class Army:
         return int(self.champion.max_hp)
 
     def set_position(self, x: int, y: int):
+        changed = (x, y) != (self.pos_x, self.pos_y)
         self.pos_x = x
         self.pos_y = y
+        if changed and self.on_change:
+            self.on_change(self)
 
     def is_alive(self) -> bool:
         """챔피언의 생존 여부가 곧 부대의 생존 여부"""
         return self.champion.is_alive()
 
+    def notify_changed(self):
+        """위치/상태 외의 변경(병력 등)을 구독자에게 알림"""
+        if self.on_change:
+            self.on_change(self)
+
     def take_losses(self, amount: int):
         """병력 손실 처리 (HP 감소)"""
+        before = self.champion.current_hp
         self.champion.take_damage(amount)
+        if self.champion.current_hp != before:
+            self.notify_changed()
 
     def recover_troops(self, amount: int):
         """병력 보충 (HP 회복)"""
+        before = self.champion.current_hp
         self.champion.current_hp = min(self.champion.max_hp, self.champion.current_hp + amount)
+        if self.champion.current_hp != before:
+            self.notify_changed()
 
     def __repr__(self):
         return f"Army({self.champion.name}, Troops: {self.troop_count}/{self.max_troop_count}, Status: {self.status})"
@@ -1,11 +1,15 @@
 # src/models/battle_log.py
 
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, LargeBinary, Index
 from sqlalchemy.sql import func
 from src.common.database import Base
 
 class BattleLog(Base):
     __tablename__ = "battle_logs"
+    __table_args__ = (
+        Index("ix_battle_logs_user_created", "user_id", "created_at"),
+        Index("ix_battle_logs_created", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, nullable=False)
@@ -15,6 +19,9 @@ class BattleLog(Base):
     winner = Column(String, nullable=False)
 
     turn_count = Column(Integer, nullable=False)
-    history_json = Column(Text, nullable=False)
+    # 구형 포맷 (JSON dict 리스트). 읽을 때 history_blob으로 지연 마이그레이션됨
+    history_json = Column(Text, nullable=True)
+    # 컬럼형 압축 포맷 (src/common/battle_codec.py)
+    history_blob = Column(LargeBinary, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
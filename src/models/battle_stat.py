@@ -0,0 +1,29 @@
+# src/models/battle_stat.py
+
+from sqlalchemy import Column, Integer, String
+from src.common.database import Base
+
+class MatchupDailyStat(Base):
+    """
+    일별 매치업 전적 (전투 저장 시 같은 트랜잭션에서 갱신되는 집계 테이블)
+    전투 1건당 양쪽 시점으로 2행 (champion 기준 wins/losses, 승자가 없으면 양쪽 draws)
+    챔피언별 합계는 opponent에 대해 SUM
+    """
+    __tablename__ = "matchup_stats_daily"
+
+    day = Column(String, primary_key=True)          # YYYY-MM-DD (UTC)
+    champion = Column(String, primary_key=True)
+    opponent = Column(String, primary_key=True)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+    total_turns = Column(Integer, nullable=False, default=0)
+
+
+class TurnHistogramDaily(Base):
+    """일별 전투 턴 수 분포"""
+    __tablename__ = "turn_histogram_daily"
+
+    day = Column(String, primary_key=True)
+    turns = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,23 @@
+# src/models/battle_turn.py
+
+from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from src.common.database import Base
+
+class BattleTurn(Base):
+    """
+    전투 기록의 정규화 테이블 (선택 사항)
+    행동별 집계를 SQL로 하고 싶을 때만 저장 (save_battle_log(..., normalize=True))
+    """
+    __tablename__ = "battle_turns"
+
+    id = Column(Integer, primary_key=True)
+    battle_id = Column(Integer, ForeignKey("battle_logs.id"), nullable=False, index=True)
+    seq = Column(Integer, nullable=False)
+
+    turn = Column(Integer, nullable=False)
+    actor = Column(String, nullable=False)
+    target = Column(String, nullable=False)
+    action = Column(String, nullable=False, index=True)
+    damage = Column(Float, nullable=False, default=0)
+    left_hp = Column(Float, nullable=False)
+    right_hp = Column(Float, nullable=False)
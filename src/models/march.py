@@ -3,6 +3,7 @@ from enum import Enum
 from typing import Tuple, List, Optional
 from src.models.army import Army
 import math
+import uuid
 
 class MarchStatus(Enum):
     GOING = "행군 중"
@@ -14,6 +15,9 @@ class March:
     """
     부대의 이동 및 임무(행군)를 관리하는 클래스
     """
+    # 현재 시각 함수 (시뮬레이션에서는 가상 시계로 교체)
+    clock = staticmethod(datetime.now)
+
     def __init__(
         self, 
         user_id: str, 
@@ -22,6 +26,7 @@ class March:
         target_pos: Tuple[int, int],
         move_speed: float = 1.0  # 초당 이동 거리 (타일 수)
     ):
+        self.id = uuid.uuid4().hex
         self.user_id = user_id
         self.army = army
         self.start_pos = start_pos
@@ -37,18 +42,18 @@ class March:
         # 소요 시간 계산 (초 단위)
         self.travel_time_seconds = self.distance / move_speed * 60 # 1타일당 1분 기본 (예시)
         
-        self.start_time = datetime.now()
+        self.start_time = March.clock()
         self.arrival_time = self.start_time + timedelta(seconds=self.travel_time_seconds)
 
     def is_arrived(self) -> bool:
         """현재 시간이 도착 예정 시간보다 지났는지 확인"""
-        if self.status != MarchStatus.GOING:
+        if self.status not in (MarchStatus.GOING, MarchStatus.RETURNING):
             return False
-        return datetime.now() >= self.arrival_time
+        return March.clock() >= self.arrival_time
 
     def get_remaining_time(self) -> float:
         """남은 시간 (초)"""
-        remaining = (self.arrival_time - datetime.now()).total_seconds()
+        remaining = (self.arrival_time - March.clock()).total_seconds()
         return max(0, remaining)
 
     def __repr__(self):
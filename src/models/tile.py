@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Callable
 from src.models.building import Building
 from src.models.army import Army
 
@@ -15,6 +15,9 @@ class ResourceType(Enum):
     STONE = "석재"
     NONE = "없음"
 
+# 타일 레벨당 시간당 생산량
+PRODUCTION_PER_LEVEL = 100
+
 class Tile:
     """
     월드 맵의 개별 타일 클래스
@@ -40,6 +43,9 @@ class Tile:
         self.max_durability = 100 * level
         self.current_durability = self.max_durability
 
+        # 소유주 변경 알림 콜백 (WorldMap이 연결)
+        self.on_owner_change: Optional[Callable[['Tile', Optional[str]], None]] = None
+
     def can_pass(self, user_id: str) -> bool:
         """이동 가능 여부 체크"""
         if self.category == TileCategory.OBSTACLE:
@@ -56,16 +62,28 @@ class Tile:
         """이 타일에서 생산되는 자원량 반환"""
         if self.category == TileCategory.RESOURCE and self.owner_id:
             # 레벨에 비례하는 생산량 (예시 공식)
-            amount = self.level * 100
+            amount = self.level * PRODUCTION_PER_LEVEL
             return {self.res_type.name: amount}
         return {}
 
-    def occupy(self, user_id: str):
-        """타일을 점령 처리"""
+    def set_owner(self, user_id: Optional[str]):
+        """소유주를 변경하고 등록된 콜백에 알림"""
+        old_owner = self.owner_id
         self.owner_id = user_id
+        if self.on_owner_change and old_owner != user_id:
+            self.on_owner_change(self, old_owner)
+
+    def occupy(self, user_id: str):
+        """타일을 점령 처리 (상태를 모두 바꾼 뒤 소유주 변경을 알려 리스너가 최종 상태를 보도록)"""
         self.current_durability = self.max_durability
         # 점령 시 중립 수비군 제거
         self.guard_army = None
+        self.set_owner(user_id)
+
+    def abandon(self):
+        """타일을 포기하여 중립으로 되돌림"""
+        self.set_owner(None)
+        self.occupying_army = None
 
     def __repr__(self):
         category_name = self.res_type.value if self.category == TileCategory.RESOURCE else self.category.value
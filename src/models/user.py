@@ -1,9 +1,11 @@
 from src.factories.champion_factory import create_champion
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Float
 from src.common.database import Base
 
 class User(Base):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True)
-    username = Column(String, unique=True, nullable=False)
\ No newline at end of file
+    username = Column(String, unique=True, nullable=False)
+    # 랭크전 레이팅 (Elo, src/logic/rating.py)
+    rating = Column(Float, nullable=False, default=1500.0, server_default="1500")
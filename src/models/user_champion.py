@@ -1,8 +1,11 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from src.common.database import Base
 
 class UserChampion(Base):
     __tablename__ = "user_champions"
+    __table_args__ = (
+        Index("ix_user_champions_user_key", "user_id", "champion_key"),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,9 +1,27 @@
 import random
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Dict
+import numpy as np
 from src.models.tile import Tile, TileCategory, ResourceType
 from src.models.building import Building, BuildingType
 from src.models.army import Army
 
+# 배열 표현에서 사용하는 열거형 코드 (정의 순서 = 코드 값)
+CATEGORY_CODES = {c: i for i, c in enumerate(TileCategory)}
+RESOURCE_CODES = {r: i for i, r in enumerate(ResourceType)}
+
+
+class WorldMapListener:
+    """
+    월드 맵 변경 알림을 받는 인덱스/서브시스템의 베이스 클래스.
+    필요한 메서드만 오버라이드하면 됩니다.
+    """
+    def on_tile_owner_changed(self, tile: Tile, old_owner: Optional[str]):
+        pass
+
+    def on_building_placed(self, building: Building):
+        pass
+
+
 class WorldMap:
     """
     전체 월드 맵 관리 클래스
@@ -12,7 +30,9 @@ class WorldMap:
         self.width = width
         self.height = height
         self.grid: List[List[Tile]] = []
+        self._listeners: List[WorldMapListener] = []
         self._generate_map()
+        self._bind_tiles()
 
     def _generate_map(self):
         """맵 생성 로직: 자원 타일과 장애물 밸런스 배치"""
@@ -33,6 +53,79 @@ class WorldMap:
                 row.append(tile)
             self.grid.append(row)
 
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], owners: List[str] = ()) -> 'WorldMap':
+        """to_arrays() 형식의 배열로부터 맵을 생성 (무작위 생성 없이)"""
+        world_map = cls.__new__(cls)
+        world_map.height, world_map.width = arrays["category"].shape
+        world_map._listeners = []
+        world_map.grid = []
+
+        categories = list(TileCategory)
+        resources = list(ResourceType)
+        owner = arrays.get("owner")
+        for y in range(world_map.height):
+            row = [
+                Tile(x, y, category=categories[c], res_type=resources[r], level=lv)
+                for x, (c, r, lv) in enumerate(zip(
+                    arrays["category"][y].tolist(),
+                    arrays["res_type"][y].tolist(),
+                    arrays["level"][y].tolist(),
+                ))
+            ]
+            if owner is not None:
+                for x in np.flatnonzero(owner[y] >= 0).tolist():
+                    row[x].owner_id = owners[owner[y, x]]
+            world_map.grid.append(row)
+
+        world_map._bind_tiles()
+        return world_map
+
+    def _bind_tiles(self):
+        """모든 타일의 소유주 변경 콜백을 맵의 리스너 디스패치에 연결"""
+        for row in self.grid:
+            for tile in row:
+                tile.on_owner_change = self._notify_owner_change
+
+    def add_listener(self, listener: WorldMapListener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: WorldMapListener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify_owner_change(self, tile: Tile, old_owner: Optional[str]):
+        for listener in self._listeners:
+            listener.on_tile_owner_changed(tile, old_owner)
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """
+        그리드를 (height, width) 배열로 변환
+        - category / res_type / level: 열거형 코드와 레벨
+        - owner: owners 리스트의 인덱스 (-1 = 중립)
+        """
+        owners: List[str] = []
+        owner_index: Dict[str, int] = {}
+        category = np.empty((self.height, self.width), dtype=np.int8)
+        res_type = np.empty((self.height, self.width), dtype=np.int8)
+        level = np.empty((self.height, self.width), dtype=np.int16)
+        owner = np.full((self.height, self.width), -1, dtype=np.int32)
+
+        for y, row in enumerate(self.grid):
+            category[y] = [CATEGORY_CODES[t.category] for t in row]
+            res_type[y] = [RESOURCE_CODES[t.res_type] for t in row]
+            level[y] = [t.level for t in row]
+            for x, tile in enumerate(row):
+                if tile.owner_id is not None:
+                    idx = owner_index.get(tile.owner_id)
+                    if idx is None:
+                        idx = owner_index[tile.owner_id] = len(owners)
+                        owners.append(tile.owner_id)
+                    owner[y, x] = idx
+
+        arrays = {"category": category, "res_type": res_type, "level": level, "owner": owner}
+        return arrays, owners
+
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         if 0 <= x < self.width and 0 <= y < self.height:
             return self.grid[y][x]
@@ -59,9 +152,12 @@ class WorldMap:
             tile = self.get_tile(x, y)
             tile.category = TileCategory.BUILDING # 카테고리 변경
             tile.building = new_building
-            tile.owner_id = owner_id
             if (x, y) == root_pos:
                 tile.is_building_root = True
+            tile.set_owner(owner_id)
+
+        for listener in self._listeners:
+            listener.on_building_placed(new_building)
         return new_building
 
     def display_ascii(self):
@@ -50,12 +50,13 @@ async function startBattle() {
     winnerBanner.style.display = 'none';
 
     try {
-        const response = await fetch('/simulate', {
+        const response = await fetch('/simulate?format=compact', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ left_id: leftId, right_id: rightId })
         });
-        const data = await response.json();
+        const raw = await response.json();
+        const data = raw.detail ? raw : decodeCompactBattle(raw);
 
         if (data.detail) {
             alert("Error: " + data.detail);
@@ -106,6 +107,47 @@ async function startBattle() {
 // Init
 loadChampions();
 
+// Compact wire format (src/api/battle_wire.py): a champion table and action dictionary,
+// then a flat int array of [turnDelta, actor, action, damage, leftHpDelta, rightHpDelta]
+// rows in fixed point. Rebuilds the same { winner, logs, left, right } shape as the
+// verbose response, with the log message rendered here instead of on the server.
+const COMPACT_STRIDE = 6;
+
+function decodeCompactBattle(data) {
+    if (data.v !== 1) throw new Error(`Unsupported battle format v${data.v}`);
+    const [left, right] = data.champions;
+    const scale = data.scale;
+    const rows = data.rows;
+    const logs = [];
+    let turn = 0;
+    let leftHp = Math.round(left.max_hp * scale);
+    let rightHp = Math.round(right.max_hp * scale);
+
+    for (let i = 0; i < rows.length; i += COMPACT_STRIDE) {
+        turn += rows[i];
+        leftHp += rows[i + 4];
+        rightHp += rows[i + 5];
+        const actorIndex = rows[i + 1];
+        const entry = {
+            turn,
+            side: actorIndex === 0 ? 'left' : 'right',
+            actor: data.champions[actorIndex].name,
+            target: data.champions[1 - actorIndex].name,
+            action: data.actions[rows[i + 2]],
+            damage: rows[i + 3] / scale,
+            left_hp: leftHp / scale,
+            right_hp: rightHp / scale
+        };
+        entry.message = formatMessage(entry);
+        logs.push(entry);
+    }
+    return { winner: data.champions[data.winner].name, logs, left, right };
+}
+
+function formatMessage(turn) {
+    return `${turn.actor}의 ${turn.action}! (${turn.damage.toFixed(1)} 데미지)`;
+}
+
 function updateHp(side, current, max) {
     const percent = Math.max(0, (current / max) * 100);
     document.getElementById(`${side}-hp-bar`).style.width = percent + '%';
@@ -134,7 +176,8 @@ async function playBattle(winnerName) {
 }
 
 function renderTurn(turn) {
-    const actorSide = (turn.actor === document.getElementById('left-name').innerText) ? 'left' : 'right';
+    // Mirror matches share a name, so prefer the explicit side
+    const actorSide = turn.side || ((turn.actor === document.getElementById('left-name').innerText) ? 'left' : 'right');
     const targetSide = (actorSide === 'left') ? 'right' : 'left';
 
     // Highlight Actor
@@ -148,8 +191,7 @@ function renderTurn(turn) {
     const logBox = document.getElementById('logs');
     const entry = document.createElement('div');
     entry.className = 'log-entry highlight';
-    entry.innerHTML = `[Turn ${turn.turn}] <b>${turn.actor}</b> used ${turn.action}!`;
-    if (turn.damage > 0) entry.innerHTML += ` Dealt <b>${turn.damage}</b> damage.`;
+    entry.innerText = `[Turn ${turn.turn}] ${turn.message || formatMessage(turn)}`;
     logBox.prepend(entry);
 
     // Apply Damage / Update HP
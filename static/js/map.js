@@ -0,0 +1,238 @@
+// Canvas world map client: fetches only the chunks visible in the viewport
+const RES_COLORS = { FOOD: '#27ae60', WOOD: '#a04000', IRON: '#7f8c8d', STONE: '#2471a3', NONE: '#222' };
+const OBSTACLE_COLOR = '#1a1a1a';
+const BUILDING_COLOR = '#c8aa6e';
+const MY_COLOR = 'rgba(30, 200, 100, 0.45)';
+const ENEMY_COLOR = 'rgba(200, 50, 50, 0.45)';
+const FOG_COLOR = '#000';
+
+let mapMeta = null;
+let tileSize = 16;
+let camX = 0;
+let camY = 0;
+const chunkCache = new Map();   // "cx,cy" -> { rev, etag, data }
+let refreshTimer = null;
+let socket = null;
+
+async function initMap() {
+    const res = await fetch('/map/meta');
+    mapMeta = await res.json();
+    setupInput();
+    connectSocket();
+    await refreshView();
+    // Polling is only a fallback while the delta socket is down (or fog of war is on)
+    setInterval(() => { if (!socketLive()) refreshView(); }, 2000);
+}
+
+// -------------------------
+// Live deltas over WebSocket
+// -------------------------
+function socketLive() {
+    return socket && socket.readyState === WebSocket.OPEN && !document.getElementById('fog-toggle').checked;
+}
+
+function connectSocket() {
+    const proto = location.protocol === 'https:' ? 'wss' : 'ws';
+    socket = new WebSocket(`${proto}://${location.host}/map/ws`);
+    socket.onopen = () => subscribeChunks();
+    socket.onmessage = e => {
+        const msg = JSON.parse(e.data);
+        if (msg.type === 'error') {
+            console.warn('map socket:', msg.detail);
+            return;
+        }
+        // Deltas were dropped server-side: refetch chunks whose revision moved on
+        if (msg.type === 'resync') {
+            if (socketLive()) refreshView();
+            return;
+        }
+        if (msg.type !== 'delta' || !socketLive()) return;
+        msg.chunks.forEach(applyDelta);
+        draw();
+    };
+    socket.onclose = () => setTimeout(connectSocket, 3000);
+}
+
+function subscribeChunks() {
+    if (!socket || socket.readyState !== WebSocket.OPEN) return;
+    const v = visibleTiles();
+    const cs = mapMeta.chunk_size;
+    const chunks = [];
+    for (let cy = Math.floor(v.y / cs); cy <= Math.floor((v.y + v.h - 1) / cs); cy++) {
+        for (let cx = Math.floor(v.x / cs); cx <= Math.floor((v.x + v.w - 1) / cs); cx++) {
+            chunks.push([cx, cy]);
+        }
+    }
+    socket.send(JSON.stringify({ subscribe: chunks }));
+}
+
+// Delta tiles: [index, category, res, level, owner, army marker or null]
+function applyDelta(delta) {
+    const cached = chunkCache.get(`${delta.cx},${delta.cy}`);
+    if (!cached) return;
+    const chunk = cached.data;
+    const ownerIndex = name => {
+        let i = chunk.owners.indexOf(name);
+        if (i < 0) { i = chunk.owners.length; chunk.owners.push(name); }
+        return i;
+    };
+
+    const changed = new Set(delta.tiles.map(t => t[0]));
+    chunk.armies = chunk.armies.filter(([i]) => !changed.has(i));
+    for (const [i, category, res, level, owner, army] of delta.tiles) {
+        chunk.category[i] = category;
+        chunk.res[i] = res;
+        chunk.level[i] = level;
+        chunk.owner[i] = owner >= 0 ? ownerIndex(delta.owners[owner]) : -1;
+        if (army) chunk.armies.push([i, ownerIndex(delta.owners[army[0]]), army[1], army[2]]);
+    }
+    // Keep the revision in step so the next viewport poll doesn't refetch the chunk
+    if (delta.rev !== undefined) cached.rev = delta.rev;
+}
+
+function visibleTiles() {
+    const canvas = document.getElementById('map-canvas');
+    return {
+        x: Math.floor(camX),
+        y: Math.floor(camY),
+        w: Math.ceil(canvas.width / tileSize) + 1,
+        h: Math.ceil(canvas.height / tileSize) + 1,
+    };
+}
+
+// With fog of war on, the server only reveals tiles visible to "My ID"
+function userQuery() {
+    if (!document.getElementById('fog-toggle').checked) return '';
+    return `user=${encodeURIComponent(document.getElementById('my-id').value)}`;
+}
+
+async function refreshView() {
+    if (!mapMeta) return;
+    const v = visibleTiles();
+    const res = await fetch(`/map/viewport?x=${v.x}&y=${v.y}&w=${v.w}&h=${v.h}&${userQuery()}`);
+    const view = await res.json();
+
+    // Only chunks whose revision changed are requested again
+    await Promise.all(view.chunks.map(([cx, cy, rev]) => {
+        const cached = chunkCache.get(`${cx},${cy}`);
+        if (cached && cached.rev === rev) return null;
+        return loadChunk(cx, cy, cached, rev);
+    }));
+
+    document.getElementById('map-status').innerText =
+        `${mapMeta.width}x${mapMeta.height} · view (${v.x}, ${v.y}) · ${chunkCache.size} chunks cached`;
+    draw();
+}
+
+async function loadChunk(cx, cy, cached, rev) {
+    const headers = cached ? { 'If-None-Match': cached.etag } : {};
+    const res = await fetch(`/map/chunk/${cx}/${cy}?${userQuery()}`, { headers });
+    if (res.status === 304) {
+        cached.rev = rev;
+        return;
+    }
+    if (!res.ok) return;
+    const data = await res.json();
+    chunkCache.set(`${cx},${cy}`, { rev, etag: res.headers.get('ETag'), data });
+}
+
+function draw() {
+    const canvas = document.getElementById('map-canvas');
+    const ctx = canvas.getContext('2d');
+    const myId = document.getElementById('my-id').value;
+    ctx.fillStyle = '#050a14';
+    ctx.fillRect(0, 0, canvas.width, canvas.height);
+
+    for (const { data } of chunkCache.values()) {
+        // Skip chunks fully outside the canvas
+        const left = (data.x - camX) * tileSize;
+        const top = (data.y - camY) * tileSize;
+        if (left > canvas.width || top > canvas.height) continue;
+        if (left + data.w * tileSize < 0 || top + data.h * tileSize < 0) continue;
+        drawChunk(ctx, data, myId);
+    }
+}
+
+function drawChunk(ctx, chunk, myId) {
+    const categories = mapMeta.categories;
+    const resources = mapMeta.resources;
+
+    for (let i = 0; i < chunk.category.length; i++) {
+        const px = (chunk.x + (i % chunk.w) - camX) * tileSize;
+        const py = (chunk.y + Math.floor(i / chunk.w) - camY) * tileSize;
+        if (chunk.category[i] < 0) {
+            ctx.fillStyle = FOG_COLOR;
+            ctx.fillRect(px, py, tileSize - 1, tileSize - 1);
+            continue;
+        }
+        const category = categories[chunk.category[i]];
+
+        if (category === 'OBSTACLE') ctx.fillStyle = OBSTACLE_COLOR;
+        else if (category === 'BUILDING') ctx.fillStyle = BUILDING_COLOR;
+        else ctx.fillStyle = RES_COLORS[resources[chunk.res[i]]];
+        ctx.fillRect(px, py, tileSize - 1, tileSize - 1);
+
+        const owner = chunk.owner[i];
+        if (owner >= 0) {
+            ctx.fillStyle = chunk.owners[owner] === myId ? MY_COLOR : ENEMY_COLOR;
+            ctx.fillRect(px, py, tileSize - 1, tileSize - 1);
+        }
+
+        if (tileSize >= 14 && category === 'RESOURCE') {
+            ctx.fillStyle = '#f0e6d2';
+            ctx.font = `${Math.floor(tileSize / 2)}px sans-serif`;
+            ctx.fillText(chunk.level[i], px + 2, py + tileSize / 2);
+        }
+    }
+
+    // Army markers: [tile index, owner index, champion name, troops]
+    for (const [i, owner, name, troops] of chunk.armies) {
+        const px = (chunk.x + (i % chunk.w) - camX) * tileSize;
+        const py = (chunk.y + Math.floor(i / chunk.w) - camY) * tileSize;
+        ctx.fillStyle = chunk.owners[owner] === myId ? '#f1c40f' : '#e74c3c';
+        ctx.beginPath();
+        ctx.arc(px + tileSize / 2, py + tileSize / 2, tileSize / 3, 0, Math.PI * 2);
+        ctx.fill();
+        if (tileSize >= 20) {
+            ctx.fillStyle = '#000';
+            ctx.fillText(`${name[0]} ${troops}`, px + 1, py + tileSize - 2);
+        }
+    }
+}
+
+function scheduleRefresh() {
+    draw();
+    clearTimeout(refreshTimer);
+    refreshTimer = setTimeout(() => { refreshView(); subscribeChunks(); }, 100);
+}
+
+function setupInput() {
+    const canvas = document.getElementById('map-canvas');
+    let dragging = null;
+
+    canvas.addEventListener('mousedown', e => { dragging = { x: e.clientX, y: e.clientY }; });
+    window.addEventListener('mouseup', () => { dragging = null; });
+    window.addEventListener('mousemove', e => {
+        if (!dragging) return;
+        camX = clampCam(camX - (e.clientX - dragging.x) / tileSize, mapMeta.width);
+        camY = clampCam(camY - (e.clientY - dragging.y) / tileSize, mapMeta.height);
+        dragging = { x: e.clientX, y: e.clientY };
+        scheduleRefresh();
+    });
+    canvas.addEventListener('wheel', e => {
+        e.preventDefault();
+        tileSize = Math.min(48, Math.max(4, tileSize + (e.deltaY < 0 ? 2 : -2)));
+        scheduleRefresh();
+    });
+    // Switching user or fog mode invalidates every cached chunk
+    const resetCache = () => { chunkCache.clear(); refreshView(); };
+    document.getElementById('my-id').addEventListener('change', resetCache);
+    document.getElementById('fog-toggle').addEventListener('change', resetCache);
+}
+
+function clampCam(value, limit) {
+    return Math.max(0, Math.min(limit - 1, value));
+}
+
+// Init
+initMap();
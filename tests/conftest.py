@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.common.database import init_db
+from src.db_manager import DatabaseManager
+from src.factories.champion_factory import create_champion
+from src.logic.battle.battle import Battle
+
+
+@pytest.fixture
+def engine():
+    """최신 스키마로 마이그레이션된 인메모리 SQLite (스레드 간 같은 연결 공유)"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    init_db(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sessions(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db(engine, sessions):
+    manager = DatabaseManager(sessions)
+    manager.engine = engine
+    return manager
+
+
+@pytest.fixture
+def make_battle():
+    """make_battle(left, right) → 끝까지 진행된 Battle"""
+    def make(left: str = "Garen", right: str = "Darius") -> Battle:
+        battle = Battle(create_champion(left), create_champion(right))
+        battle.start()
+        return battle
+    return make
+
+
+@pytest.fixture
+def battle(make_battle):
+    return make_battle()
@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+from src.api.admission import AdmissionController, ClientRateLimiter, Rejected, BudgetExceeded, check_deadline
+
+
+def test_rate_limiter_refills_per_client():
+    now = [0.0]
+    limiter = ClientRateLimiter(rate=2, burst=3, max_clients=2, clock=lambda: now[0])
+    for _ in range(3):
+        limiter.check("a")
+    with pytest.raises(Rejected) as e:
+        limiter.check("a")
+    assert e.value.status == 429 and e.value.retry_after == pytest.approx(0.5)
+
+    # 다른 클라이언트는 영향 없음, 0.5초 뒤 토큰 1개 회복
+    limiter.check("b")
+    now[0] = 0.5
+    limiter.check("a")
+    with pytest.raises(Rejected):
+        limiter.check("a")
+
+    # max_clients를 넘으면 가장 오래된 버킷부터 제거
+    limiter.check("c")
+    assert list(limiter._buckets) == ["a", "c"]
+
+
+def test_admission_queue_bounds_and_timeout():
+    async def scenario():
+        admission = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=0.05)
+        acquired = asyncio.Event()
+        release = asyncio.Event()
+
+        async def hold():
+            async with admission.slot():
+                acquired.set()
+                await release.wait()
+
+        async def quick():
+            async with admission.slot():
+                return "ok"
+
+        tasks = []
+        try:
+            tasks.append(asyncio.create_task(hold()))
+            await acquired.wait()
+            waiter = asyncio.create_task(quick())
+            tasks.append(waiter)
+            while admission.waiting < 1:
+                await asyncio.sleep(0)
+            assert (admission.running, admission.waiting) == (1, 1)
+
+            # 대기열이 가득 차면 즉시 거절
+            with pytest.raises(Rejected) as e:
+                await quick()
+            assert e.value.status == 503
+
+            # 대기 시간 초과도 거절
+            with pytest.raises(Rejected):
+                await waiter
+            release.set()
+            await tasks[0]
+            assert await quick() == "ok"
+            assert (admission.running, admission.waiting, admission.rejected) == (0, 0, 2)
+        finally:
+            release.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_deadline_check():
+    check_deadline(None)
+    with pytest.raises(BudgetExceeded):
+        check_deadline(0.0)
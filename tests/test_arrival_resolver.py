@@ -0,0 +1,49 @@
+from concurrent.futures import ProcessPoolExecutor
+from src.models.world_map import WorldMap
+from src.models.march import March
+from src.models.tile import TileCategory
+from src.factories.champion_factory import create_champion
+from src.logic.map_manager import MapManager
+from src.logic.arrival_resolver import ArrivalResolver, battle_seed
+from src.logic.simulation import VirtualClock
+
+TARGETS = [(3, 0), (0, 3), (3, 3), (2, 2), (2, 2), (4, 1), (1, 4), (4, 4)]
+
+
+def _run(monkeypatch, resolver=None):
+    clock = VirtualClock()
+    monkeypatch.setattr(March, "clock", clock.now)
+    world_map = WorldMap(6, 6)
+    for row in world_map.grid:
+        for tile in row:
+            tile.category = TileCategory.RESOURCE
+            tile.owner_id = None
+            tile.level = 1 + (tile.x + tile.y) % 4
+    manager = MapManager(world_map)
+    manager.resolver = resolver
+
+    # 수비군과 같은 챔피언 → 속도가 같아 선공이 난수로 결정됨
+    armies = []
+    for i, target in enumerate(TARGETS):
+        army = manager.create_army(f"P{i}", create_champion("Darius"))
+        army.set_position(0, 0)
+        manager.send_march(army, target)
+        armies.append(army)
+
+    clock.advance(600)
+    manager.update()
+    state = [(a.champion.current_hp, a.champion.level, a.champion.exp, a.pos_x, a.pos_y) for a in armies]
+    owners = [[t.owner_id for t in row] for row in world_map.grid]
+    return state, owners
+
+
+def test_parallel_resolution_matches_serial(monkeypatch):
+    serial = _run(monkeypatch)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = _run(monkeypatch, ArrivalResolver(executor=executor, min_parallel=2))
+    assert parallel == serial
+
+
+def test_battle_seed_depends_on_tick_and_armies():
+    assert battle_seed(1, "a") == battle_seed(1, "a")
+    assert len({battle_seed(1, "a"), battle_seed(2, "a"), battle_seed(1, "b"), battle_seed(1, "a", "b")}) == 4
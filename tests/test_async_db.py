@@ -0,0 +1,54 @@
+import asyncio
+import threading
+from src.async_db_manager import AsyncDatabaseManager
+
+
+def test_operations_run_off_the_event_loop(sessions):
+    db = AsyncDatabaseManager(sessions, max_workers=2)
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        user_id = await db.get_or_create_user("tester")
+        await db.add_champion_to_user(user_id, "Garen")
+        champs = await db.get_user_champions(user_id)
+        worker = await db.run(threading.get_ident)
+        await db.batch(lambda uow: uow.update_champions([(champs[0]["id"], 5, 10)]))
+        return loop_thread, worker, await db.get_user_champions(user_id)
+
+    try:
+        loop_thread, worker, champs = asyncio.run(scenario())
+    finally:
+        db.close()
+    assert worker != loop_thread
+    assert (champs[0]["level"], champs[0]["exp"]) == (5, 10)
+
+
+def test_in_flight_queries_are_capped(sessions):
+    # 워커는 넉넉하게 두고 세마포어만으로 동시 실행 수가 제한되는지 확인
+    db = AsyncDatabaseManager(sessions, max_workers=6, max_in_flight=3)
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+    release = threading.Event()
+
+    def slow():
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        release.wait(1)
+        with lock:
+            state["now"] -= 1
+
+    async def scenario():
+        tasks = [asyncio.create_task(db.run(slow)) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        running = state["now"]
+        release.set()
+        await asyncio.gather(*tasks)
+        return running
+
+    try:
+        running = asyncio.run(scenario())
+    finally:
+        db.close()
+    assert running == 3
+    assert state["peak"] == 3 and state["now"] == 0
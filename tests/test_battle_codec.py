@@ -0,0 +1,73 @@
+import json
+import zlib
+import numpy as np
+import pytest
+from src.common.battle_codec import (
+    encode_history, decode_history, decode_columns, CODEC_VERSION, COLUMNS_BY_VERSION, TABLE_HEADER,
+)
+from src.models.battle_log import BattleLog
+
+
+def test_round_trip_and_size(battle):
+    blob = encode_history(battle.history)
+    assert blob[0] == CODEC_VERSION
+    assert decode_history(blob) == [
+        {**row, "damage": float(row["damage"]), "left_hp": float(row["left_hp"]),
+         "right_hp": float(row["right_hp"])}
+        for row in battle.history
+    ]
+    assert len(blob) < len(json.dumps(battle.history, ensure_ascii=False).encode("utf-8")) / 2
+
+    cols = decode_columns(blob)
+    assert set(cols["names"]) == {"Garen", "Darius"}
+    assert len(cols["turn"]) == len(battle.history)
+
+
+def test_fractional_values_round_trip_exactly():
+    history = [
+        {"turn": 1, "actor": "Garen", "target": "Darius", "action": "일반 공격",
+         "damage": 123.456789, "left_hp": 1000.1, "right_hp": 876.543211},
+        {"turn": 1, "actor": "Darius", "target": "Garen", "action": "녹서스의 단두대",
+         "damage": 0.1 + 0.2, "left_hp": 999.8, "right_hp": 876.543211},
+    ]
+    assert decode_history(encode_history(history)) == history
+
+
+def test_version_1_blobs_still_decode():
+    # v1 인코딩(float32)을 직접 구성
+    tables = json.dumps({"names": ["Garen", "Darius"], "actions": ["일반 공격"]}).encode("utf-8")
+    values = {"turn": [1], "actor": [0], "target": [1], "action": [0],
+              "damage": [12.5], "left_hp": [100.0], "right_hp": [87.5]}
+    body = [TABLE_HEADER.pack(len(tables), 1), tables]
+    body.extend(np.asarray(values[key], dtype=dtype).tobytes() for key, dtype in COLUMNS_BY_VERSION[1])
+    blob = bytes([1]) + zlib.compress(b"".join(body))
+
+    assert decode_history(blob) == [{"turn": 1, "actor": "Garen", "target": "Darius", "action": "일반 공격",
+                                     "damage": 12.5, "left_hp": 100.0, "right_hp": 87.5}]
+    with pytest.raises(ValueError):
+        decode_history(bytes([99]) + blob[1:])
+
+
+def test_old_json_rows_are_migrated_on_read(db, battle):
+    session = db.session_factory()
+    session.add(BattleLog(user_id=1, left_champion="Garen", right_champion="Darius", winner="Garen",
+                          turn_count=battle.turn, history_json=json.dumps(battle.history)))
+    session.commit()
+    session.close()
+
+    log = db.get_battle_log(1)
+    assert log["history"] == battle.history
+
+    session = db.session_factory()
+    row = session.get(BattleLog, 1)
+    assert row.history_json is None and row.history_blob is not None
+    session.close()
+    assert len(db.get_battle_log(1)["history"]) == len(battle.history)
+
+
+def test_normalized_turns_allow_sql_aggregation(db, battle):
+    db.save_battle_log(1, battle, normalize=True)
+    stats = db.get_action_stats()
+    assert sum(s["count"] for s in stats) == len(battle.history)
+    total = sum(s["total_damage"] for s in stats)
+    assert total == pytest.approx(sum(row["damage"] for row in battle.history))
@@ -0,0 +1,53 @@
+import base64
+import json
+import pytest
+from datetime import datetime
+from sqlalchemy import insert
+from src.common.battle_codec import decode_history
+from src.battle_export import iter_battle_logs, fetch_page, decode_cursor, to_ndjson
+from src.models.battle_log import BattleLog
+
+
+def test_keyset_pages_cover_every_row_once(db, sessions, make_battle):
+    # 같은 초에 저장된 행이 많아도 id로 순서가 정해져야 함
+    with db.batch() as uow:
+        for i in range(23):
+            uow.add_battle_log(1 + i % 3, make_battle())
+    with sessions.begin() as s:
+        s.execute(insert(BattleLog.__table__), [{
+            "user_id": 1, "left_champion": "Ahri", "right_champion": "Garen", "winner": "Ahri",
+            "turn_count": 2, "history_json": json.dumps([{"turn": 1}]),
+            "created_at": datetime(2020, 1, 1, 12, 0, 0),
+        }])
+
+    exported = list(iter_battle_logs(sessions, page_size=5, history="none"))
+    assert len(exported) == 24 and len({r["id"] for r in exported}) == 24
+    # 구형 행(2020년)이 가장 먼저
+    assert exported[0]["left_champion"] == "Ahri"
+
+    # 중간 커서에서 이어받기
+    resumed = list(iter_battle_logs(sessions, after=exported[9]["cursor"], page_size=4, history="none"))
+    assert [r["id"] for r in resumed] == [r["id"] for r in exported[10:]]
+
+    # 필터와 limit
+    mine = list(iter_battle_logs(sessions, user_id=2, history="none"))
+    assert mine and all(r["user_id"] == 2 for r in mine)
+    assert [r["id"] for r in iter_battle_logs(sessions, champion="Ahri")] == [exported[0]["id"]]
+    assert len(list(iter_battle_logs(sessions, until="2021-01-01", history="none"))) == 1
+    assert len(list(iter_battle_logs(sessions, since="2021-01-01", limit=7, page_size=5))) == 7
+
+
+def test_history_formats(db, sessions, battle):
+    db.save_battle_log(1, battle)
+
+    (row,), cursor = fetch_page(sessions, history="rows")
+    assert cursor is None
+    assert [h["action"] for h in row["history"]] == [h["action"] for h in battle.history]
+    json.loads(to_ndjson(row))
+
+    (packed,), _ = fetch_page(sessions, history="blob")
+    assert decode_history(base64.b64decode(packed["history"])) == row["history"]
+    assert decode_cursor(packed["cursor"])[1] == packed["id"]
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
@@ -0,0 +1,148 @@
+import queue
+import threading
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from src.battle_log_writer import BattleLogWriter
+from src.models.battle_log import BattleLog
+
+
+def _count(engine):
+    session = sessionmaker(bind=engine)()
+    try:
+        return session.query(BattleLog).count()
+    finally:
+        session.close()
+
+
+def test_logs_are_written_in_batches(engine, battle):
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+    with BattleLogWriter(sessionmaker(bind=engine), max_batch=50, flush_interval=0.5) as writer:
+        for i in range(200):
+            writer.submit(i, battle)
+        writer.flush()
+        assert writer.written == 200
+    assert _count(engine) == 200
+    assert len(commits) <= 200 // 50 + 1
+
+
+def test_close_flushes_pending_logs(engine, battle):
+    writer = BattleLogWriter(sessionmaker(bind=engine), flush_interval=10)
+    for i in range(10):
+        writer.submit(i, battle)
+    writer.close()
+    assert _count(engine) == 10
+    with pytest.raises(RuntimeError):
+        writer.submit(0, battle)
+
+
+def test_full_queue_applies_backpressure(engine, battle):
+    gate = threading.Event()
+    factory = sessionmaker(bind=engine)
+
+    def slow_factory():
+        gate.wait(5)
+        return factory()
+
+    writer = BattleLogWriter(slow_factory, max_batch=1, flush_interval=0, max_queue=2)
+    try:
+        writer.submit(0, battle)
+        while writer.pending():    # 워커가 꺼내서 세션 대기 중
+            pass
+        writer.submit(1, battle)
+        writer.submit(2, battle)
+        with pytest.raises(queue.Full):
+            writer.submit(3, battle, timeout=0.05)
+    finally:
+        gate.set()
+        writer.close()
+    assert _count(engine) == 3
+
+
+def _flaky_factory(engine, failures):
+    """처음 failures번은 커밋에서 실패하는 세션 팩토리"""
+    factory = sessionmaker(bind=engine)
+    state = {"left": failures}
+
+    def make():
+        session = factory()
+        if state["left"] > 0:
+            state["left"] -= 1
+
+            def fail():
+                session.flush()
+                raise RuntimeError("disk I/O error")
+            session.commit = fail
+        return session
+    return make
+
+
+def test_failed_batch_is_retried(engine, battle):
+    with BattleLogWriter(_flaky_factory(engine, 2), flush_interval=0.01, retry_delay=0) as writer:
+        for i in range(5):
+            writer.submit(i, battle)
+    assert (writer.written, writer.failed) == (5, 0)
+    assert _count(engine) == 5
+
+
+def test_batch_is_handed_back_after_retries(engine, battle):
+    handed = []
+    writer = BattleLogWriter(_flaky_factory(engine, 100), flush_interval=0.01, retries=1, retry_delay=0,
+                             on_error=lambda rows, e: handed.append((len(rows), str(e))))
+    writer.submit(1, battle)
+    writer.close()
+    assert handed == [(1, "disk I/O error")] and writer.failed == 1
+    assert _count(engine) == 0
+
+
+def test_submit_never_lands_behind_close(engine, battle):
+    writer = BattleLogWriter(sessionmaker(bind=engine), flush_interval=0)
+    accepted = []
+    errors = []
+
+    def producer():
+        for i in range(200):
+            try:
+                writer.submit(i, battle)
+                accepted.append(i)
+            except RuntimeError:
+                errors.append(i)
+                return
+
+    threads = [threading.Thread(target=producer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    writer.close()
+    for t in threads:
+        t.join()
+    # 받아들인 행은 모두 저장되고 큐에는 아무것도 남지 않음
+    assert _count(engine) == len(accepted) == writer.written
+    assert writer.pending() == 0
+
+
+def test_database_manager_saves_through_writer(engine, sessions, battle):
+    from src.db_manager import DatabaseManager
+    with BattleLogWriter(sessions, flush_interval=0.5) as writer:
+        db = DatabaseManager(sessions, log_writer=writer)
+        db.save_battle_log(1, battle)
+        assert _count(engine) == 0
+        writer.flush()
+        assert _count(engine) == 1
+        # battle_turns까지 저장하는 경로는 큐를 거치지 않고 바로 커밋
+        db.save_battle_log(1, battle, normalize=True)
+        assert _count(engine) == 2 and writer.written == 1
+
+
+def test_failed_rows_are_capped(engine, battle):
+    from src.battle_log_writer import BATTLE_LOGS_DROPPED
+    dropped_before = BATTLE_LOGS_DROPPED._default().value
+    writer = BattleLogWriter(_flaky_factory(engine, 100), max_batch=2, flush_interval=0.01, retries=0,
+                             max_failed_rows=3)
+    for i in range(5):
+        writer.submit(i, battle)
+    writer.close()
+    assert writer.failed == 5 and len(writer.failed_rows) == 3
+    assert [row.user_id for row in writer.failed_rows] == [2, 3, 4]
+    assert writer.dropped == 2
+    assert BATTLE_LOGS_DROPPED._default().value == dropped_before + 2
@@ -0,0 +1,78 @@
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from src.battle_log_writer import BattleLogWriter
+from src.db_manager import _battle_log_row, record_battle_stats
+from src.models.battle_stat import MatchupDailyStat, TurnHistogramDaily
+
+
+def test_stats_follow_saved_battles(db, make_battle):
+    battles = [make_battle() for _ in range(5)] + [make_battle("Garen", "Garen")]
+    for b in battles[:3]:
+        db.save_battle_log(1, b)
+    with db.batch() as uow:
+        for b in battles[3:]:
+            uow.add_battle_log(1, b)
+
+    garen_wins = sum(1 for b in battles[:5] if b.winner is b.left)
+    stats = db.get_matchup_stats("Garen", "Darius")
+    assert (stats["wins"], stats["losses"]) == (garen_wins, 5 - garen_wins)
+    assert len(stats["by_day"]) == 1
+
+    # 미러전은 1승 1패로 집계되어 챔피언 전체 전적에 포함
+    overall = db.get_matchup_stats("Garen")
+    assert overall["wins"] + overall["losses"] == 7
+    assert db.get_matchup_stats("Darius", "Garen")["wins"] == 5 - garen_wins
+
+    histogram = db.get_turn_histogram()
+    assert sum(histogram.values()) == 6
+    assert histogram.get(battles[0].turn, 0) >= 1
+
+
+def test_writer_batches_update_stats(db, make_battle):
+    with BattleLogWriter(db.session_factory, flush_interval=0.05) as writer:
+        for _ in range(20):
+            writer.submit(1, make_battle())
+    stats = db.get_matchup_stats("Darius", "Garen")
+    assert stats["wins"] + stats["losses"] == 20
+    assert stats["avg_turns"] > 0
+
+
+def test_draws_are_counted_separately(db, make_battle):
+    decided = make_battle()
+    draw = make_battle()
+    draw.winner = None
+    with db.batch() as uow:
+        uow.add_battle_log(1, decided)
+        uow.add_battle_log(1, draw)
+
+    garen = db.get_matchup_stats("Garen", "Darius")
+    darius = db.get_matchup_stats("Darius", "Garen")
+    garen_won = int(decided.winner is decided.left)
+    assert (garen["wins"], garen["losses"], garen["draws"]) == (garen_won, 1 - garen_won, 1)
+    assert (darius["wins"], darius["losses"], darius["draws"]) == (1 - garen_won, garen_won, 1)
+    assert garen["win_rate"] == garen_won / 2
+    assert db.get_battle_log(2)["winner"] == ""
+
+
+def test_stats_are_bucketed_by_battle_time(db, make_battle):
+    # 자정 직전 전투가 자정 이후 한 배치로 플러시돼도 각자 전투한 날짜로 집계
+    before, after = _battle_log_row(1, make_battle()), _battle_log_row(1, make_battle())
+    before.created_at = datetime(2025, 3, 1, 23, 59, 59)
+    after.created_at = datetime(2025, 3, 2, 0, 0, 1)
+    session = db.session_factory()
+    try:
+        session.add_all([before, after])
+        record_battle_stats(session, [before, after])
+        session.commit()
+        days = session.query(MatchupDailyStat.day).filter_by(champion="Garen").order_by(MatchupDailyStat.day).all()
+        assert [d for (d,) in days] == ["2025-03-01", "2025-03-02"]
+        assert session.query(TurnHistogramDaily).count() >= 2
+    finally:
+        session.close()
+
+
+def test_stats_upsert_rejects_unsupported_dialect(make_battle):
+    mysql_session = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="mysql")))
+    with pytest.raises(NotImplementedError, match="mysql"):
+        record_battle_stats(mysql_session, [_battle_log_row(1, make_battle())])
@@ -0,0 +1,56 @@
+import json
+import random
+import pytest
+from types import SimpleNamespace
+from src.api.battle_wire import encode_compact, decode_compact, STRIDE
+from src.factories.champion_factory import create_champion
+
+
+def _battle(seed=3, turns=40):
+    rng = random.Random(seed)
+    left, right = create_champion("Garen"), create_champion("Garen")
+    left_hp, right_hp = left.max_hp, right.max_hp
+    logs = []
+    for turn in range(1, turns + 1):
+        for side in ("left", "right"):
+            damage = rng.uniform(0, 40)
+            if side == "left":
+                right_hp -= damage
+            else:
+                left_hp -= damage
+            logs.append({"turn": turn, "side": side, "actor": "Garen", "target": "Garen",
+                         "action": rng.choice(["일반 공격", "결정타"]), "damage": damage,
+                         "left_hp": left_hp, "right_hp": right_hp})
+    right.current_hp = 0
+    return SimpleNamespace(left=left, right=right, logs=logs)
+
+
+def test_round_trip_without_drift():
+    battle = _battle()
+    data = encode_compact(battle)
+    assert len(data["rows"]) == STRIDE * len(battle.logs)
+    assert data["actions"] == sorted(set(data["actions"]), key=data["actions"].index)
+    assert data["winner"] == 0
+
+    decoded = decode_compact(json.loads(json.dumps(data)))
+    for original, row in zip(battle.logs, decoded):
+        assert row["turn"] == original["turn"] and row["action"] == original["action"]
+        # 미러전에서도 행동자 쪽이 보존됨
+        assert (row["actor"], row["target"]) == ("Garen", "Garen")
+        assert row["damage"] == pytest.approx(original["damage"], abs=0.05)
+        # 양자화 오차는 행이 늘어도 0.05 이내
+        assert row["left_hp"] == pytest.approx(original["left_hp"], abs=0.05)
+        assert row["right_hp"] == pytest.approx(original["right_hp"], abs=0.05)
+
+
+def test_compact_is_smaller_than_verbose():
+    battle = _battle()
+    verbose = json.dumps([dict(log, message=f"{log['actor']}의 {log['action']}!") for log in battle.logs],
+                         ensure_ascii=False)
+    compact = json.dumps(encode_compact(battle), ensure_ascii=False, separators=(",", ":"))
+    assert len(compact) * 4 < len(verbose)
+
+
+def test_rejects_unknown_version():
+    with pytest.raises(ValueError):
+        decode_compact({"v": 99})
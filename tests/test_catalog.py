@@ -0,0 +1,43 @@
+import gzip
+import json
+import pytest
+from src.api.catalog import CatalogResponses, etag_matches
+
+
+def _catalogs(data):
+    return CatalogResponses({"champions": (lambda: data, ("id", "name")), "items": (lambda: data, None)})
+
+
+def test_body_is_built_once_per_projection():
+    data = {"Garen": {"name": "가렌", "base_stat": [1, 2]}, "Ahri": {"name": "아리", "base_stat": [3, 4]}}
+    catalogs = _catalogs(data)
+    body = catalogs.get("champions")
+    assert catalogs.get("champions") is body
+    assert json.loads(body.body) == [{"id": "Garen", "name": "가렌"}, {"id": "Ahri", "name": "아리"}]
+    assert json.loads(gzip.decompress(body.gzip_body)) == json.loads(body.body)
+    assert body.etag != body.gzip_etag
+
+    # 필드 순서가 달라도 같은 캐시, 다른 조합은 다른 ETag
+    projected = catalogs.get("champions", ["base_stat", "id"])
+    assert catalogs.get("champions", ["id", "base_stat"]) is projected
+    assert projected.etag != body.etag
+    assert json.loads(catalogs.get("items").body)[0] == {"id": "Garen", "name": "가렌", "base_stat": [1, 2]}
+    with pytest.raises(ValueError):
+        catalogs.get("champions", ["nope"])
+
+
+def test_etag_follows_data_version():
+    data = {"Garen": {"name": "가렌"}}
+    catalogs = _catalogs(data)
+    before = catalogs.get("champions").etag
+    data["Garen"]["name"] = "Garen"
+    assert catalogs.get("champions").etag == before
+    catalogs.invalidate()
+    assert catalogs.get("champions").etag != before
+
+
+def test_etag_matches():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"x"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
@@ -0,0 +1,115 @@
+import pytest
+from sqlalchemy import event
+from src.game.champion_cache import ChampionIdentityMap
+from src.game.user import User
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _count_selects(engine):
+    selects = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: selects.append(stmt) if stmt.lstrip().upper().startswith("SELECT") else None)
+    return selects
+
+
+def test_roster_is_loaded_once_and_updated_in_place(db):
+    cache = ChampionIdentityMap(db)
+    user = User("tester", db, cache)
+    selects = _count_selects(db.engine)
+
+    user.add_champion("Garen")
+    user.add_champion("Darius")
+    garen = next(c for c in user.champions if c.name == "Garen")
+    assert next(c for c in User("tester", db, cache).champions if c.name == "Garen") is garen
+    assert not [s for s in selects if "user_champions" in s]
+    assert cache.loads == 1
+
+    garen.level, garen.exp = 4, 77
+    user.save_data()
+    rows = {r["champion_key"]: (r["level"], r["exp"]) for r in db.get_user_champions(user.user_id)}
+    assert rows == {"Garen": (4, 77), "Darius": (1, 0)}
+
+
+def test_lru_and_idle_eviction_flush_changes(db):
+    clock = _Clock()
+    cache = ChampionIdentityMap(db, max_users=2, idle_seconds=60, clock=clock)
+    ids = [db.get_or_create_user(f"u{i}") for i in range(3)]
+    for user_id in ids:
+        cache.add(user_id, "Garen")
+
+    assert len(cache) == 2 and ids[0] not in cache
+
+    champ = next(iter(cache.get(ids[1]).values()))
+    champ.exp = 50
+    clock.now = 120
+    assert cache.evict_idle() == 2
+    assert len(cache) == 0
+    assert db.get_user_champions(ids[1])[0]["exp"] == 50
+
+
+def test_users_without_cache_share_one_identity_map(db, engine):
+    first = User("tester", db)
+    first.add_champion("Garen")
+    selects = _count_selects(engine)
+    second = User("tester", db)
+    assert second.cache is first.cache
+    assert second.champions[0] is first.champions[0]
+    assert not [s for s in selects if "user_champions" in s]
+    # 다른 DatabaseManager는 별도 캐시
+    assert User("tester", type(db)(db.session_factory)).cache is not first.cache
+
+
+def test_reads_do_not_evict_idle_rosters(db):
+    clock = _Clock()
+    cache = ChampionIdentityMap(db, idle_seconds=60, clock=clock)
+    ids = [db.get_or_create_user(f"u{i}") for i in range(2)]
+    cache.get(ids[0])
+    clock.now = 120
+    cache.get(ids[1])
+    assert ids[0] in cache
+    assert cache.evict_idle() == 1 and ids[0] not in cache
+
+
+def test_live_user_roster_is_pinned(db):
+    clock = _Clock()
+    cache = ChampionIdentityMap(db, max_users=1, idle_seconds=60, clock=clock)
+    user = User("tester", db, cache)
+    user.add_champion("Garen")
+    garen = user.champions[0]
+
+    # 다른 유저 로드(LRU)와 유휴 만료 모두 고정된 로스터는 건드리지 않음
+    other = db.get_or_create_user("other")
+    cache.get(other)
+    clock.now = 120
+    cache.evict_idle()
+    assert user.user_id in cache and other not in cache
+    garen.exp = 30
+    assert user.champions[0] is garen
+    user.save_data()
+    assert db.get_user_champions(user.user_id)[0]["exp"] == 30
+
+    user.close()
+    assert not cache.is_pinned(user.user_id)
+    clock.now = 300
+    assert cache.evict_idle() == 1 and user.user_id not in cache
+
+
+def test_concurrent_reads_load_roster_once(db):
+    import threading
+    cache = ChampionIdentityMap(db)
+    user_id = db.get_or_create_user("tester")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(user_id))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert cache.loads == 1
+    assert all(r is results[0] for r in results)
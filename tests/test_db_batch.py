@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import event
+from src.game.user import User
+from src.logic.battle.battle import Battle
+
+
+def test_save_data_updates_all_champions_in_one_commit(db):
+    user = User("tester", db)
+    user.add_champion("Garen")
+    user.add_champion("Darius")
+    for champ in user.champions:
+        champ.level, champ.exp = 3, 40
+
+    commits = []
+    event.listen(db.engine, "commit", lambda conn: commits.append(1))
+    battle = Battle(*user.champions)
+    battle.start()
+    user.save_data(battle)
+
+    assert len(commits) == 1
+    rows = db.get_user_champions(user.user_id)
+    saved = {r["champion_key"]: (r["level"], r["exp"]) for r in rows}
+    assert saved == {c.name: (c.level, c.exp) for c in user.champions}
+    assert saved["Garen"] != (1, 0)
+
+
+def test_batch_rolls_back_on_error(db):
+    user_id = db.get_or_create_user("tester")
+    db.add_champion_to_user(user_id, "Garen")
+    champ_id = db.get_user_champions(user_id)[0]["id"]
+
+    with pytest.raises(RuntimeError):
+        with db.batch() as uow:
+            uow.update_champions([(champ_id, 9, 9)])
+            raise RuntimeError("boom")
+    assert db.get_user_champions(user_id)[0]["level"] == 1
+
+    with db.batch() as uow:
+        uow.update_champions([(champ_id, 9, 9)])
+    assert db.get_user_champions(user_id)[0]["level"] == 9
@@ -0,0 +1,69 @@
+from src.logic.guard_roster import GuardRoster
+from src.factories.champion_factory import create_champion
+
+CONFIG = {
+    "default": {"champion": "Darius"},
+    "levels": {"1": {"champion": "Darius", "level": 1}, "3": {"champion": "Garen", "level": 4}},
+    "regions": {"north": {"3": {"champion": "Darius", "level": 9, "max_hp": 1234}}},
+}
+
+
+def _pooled(roster):
+    return sum(len(v) for v in roster._free.values())
+
+
+def test_acquire_uses_template_per_level_and_region():
+    roster = GuardRoster(CONFIG)
+    assert roster.acquire(3).name == "Garen"
+    north = roster.acquire(3, "north")
+    assert (north.name, north.level, north.max_hp, north.current_hp) == ("Darius", 9, 1234, 1234)
+    # 설정에 없는 레벨은 default 항목 + 타일 레벨
+    assert roster.acquire(7).level == 7
+    # 지역에 해당 레벨이 없으면 공통 레벨 설정 사용
+    assert roster.acquire(1, "north").level == 1
+
+
+def test_released_guard_is_reused_in_template_state():
+    roster = GuardRoster(CONFIG)
+    guard = roster.acquire(3)
+    fresh_stat = dict(guard.stat)
+    guard.current_hp = 1
+    guard.level = 10
+    guard.exp = 500
+    guard.stat["ATK"] = guard.stat.get("ATK", 0) + 999
+    guard.buffs.append(object())
+    roster.release(guard)
+
+    again = roster.acquire(3)
+    assert again is guard
+    assert again.current_hp == again.max_hp
+    assert (again.level, again.exp, again.buffs, again.stat) == (4, 0, [], fresh_stat)
+
+
+def test_pool_invariants_on_add_and_remove():
+    roster = GuardRoster(CONFIG)
+    guards = [roster.acquire(1) for _ in range(3)]
+    # 사용 중인 인스턴스는 서로 다르고 풀에는 없음
+    assert len({id(g) for g in guards}) == 3 and _pooled(roster) == 0
+
+    for guard in guards:
+        roster.release(guard)
+    assert _pooled(roster) == 3
+    # 중복 반납과 풀 밖의 챔피언 반납은 무시
+    roster.release(guards[0])
+    roster.release(create_champion("Darius"))
+    assert _pooled(roster) == 3
+
+    # 다른 레벨 풀의 인스턴스를 가져가지 않음
+    other = roster.acquire(3)
+    assert all(other is not g for g in guards) and _pooled(roster) == 3
+    taken = {id(roster.acquire(1)) for _ in range(3)}
+    assert taken == {id(g) for g in guards} and _pooled(roster) == 0
+
+
+def test_prewarm_leaves_instances_in_pool():
+    roster = GuardRoster(CONFIG)
+    roster.prewarm([1, 3], count=2)
+    assert _pooled(roster) == 4
+    assert len(roster._templates) == 2
+    assert not roster._owner_key
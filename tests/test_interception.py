@@ -0,0 +1,97 @@
+import random
+from datetime import datetime, timedelta
+from src.models.world_map import WorldMap
+from src.models.march import March
+from src.models.army import Army
+from src.models.tile import TileCategory
+from src.factories.champion_factory import create_champion
+from src.logic.map_manager import MapManager
+from src.logic.interception import InterceptionDetector
+
+
+class _Clock:
+    def __init__(self):
+        self.current = datetime(2025, 1, 1)
+
+    def now(self):
+        return self.current
+
+
+def _setup(monkeypatch, size=40):
+    clock = _Clock()
+    monkeypatch.setattr(March, "clock", clock.now)
+    world_map = WorldMap(size, size)
+    for row in world_map.grid:
+        for tile in row:
+            tile.category = TileCategory.RESOURCE
+    manager = MapManager(world_map)
+    return clock, manager, InterceptionDetector(manager)
+
+
+def _army(manager, army_id, owner, pos):
+    army = Army(army_id, owner, create_champion("Garen"))
+    army.home_pos = pos
+    army.set_position(*pos)
+    manager.register_army(army)
+    return army
+
+
+def test_crossing_marches_meet_in_the_field(monkeypatch):
+    clock, manager, detector = _setup(monkeypatch)
+    a = _army(manager, "a", "P1", (0, 10))
+    b = _army(manager, "b", "P2", (10, 0))
+    manager.send_march(a, (20, 10))
+    manager.send_march(b, (10, 20))
+    assert detector.pending_count() == 1
+
+    # 둘 다 10타일(600초) 이동 후 (10, 10)에서 만남
+    clock.current += timedelta(seconds=599)
+    assert detector.pop_next() is None
+    clock.current += timedelta(seconds=1)
+    march_a, march_b, pos = detector.pop_next()
+    assert {march_a.army.id, march_b.army.id} == {"a", "b"}
+    assert pos == (10.0, 10.0)
+
+
+def test_no_encounter_for_allies_or_different_times(monkeypatch):
+    clock, manager, detector = _setup(monkeypatch)
+    manager.send_march(_army(manager, "a", "P1", (0, 10)), (20, 10))
+    manager.send_march(_army(manager, "b", "P1", (10, 0)), (10, 20))
+    assert detector.pending_count() == 0
+
+    # 같은 경로를 늦게 지나가면 교차점에 도착했을 때 상대는 이미 지나감
+    clock.current += timedelta(seconds=900)
+    manager.send_march(_army(manager, "c", "P2", (10, 0)), (10, 20))
+    assert detector.pending_count() == 0
+
+
+def test_field_battle_sends_loser_home(monkeypatch):
+    clock, manager, detector = _setup(monkeypatch)
+    a = _army(manager, "a", "P1", (0, 10))
+    b = _army(manager, "b", "P2", (20, 10))
+    manager.send_march(a, (20, 10))
+    manager.send_march(b, (0, 10))
+
+    random.seed(0)
+    clock.current += timedelta(seconds=600)
+    manager.update()
+
+    assert manager.battle_count == 1
+    assert len(manager.active_marches) == 2
+    retreat = [m for m in manager.active_marches if m.start_pos == (10, 10)]
+    assert len(retreat) == 1
+    assert retreat[0].target_pos == retreat[0].army.home_pos
+    assert detector.pending_count() == 0
+
+
+def test_many_marches_use_buckets(monkeypatch):
+    clock, manager, detector = _setup(monkeypatch, size=400)
+    rng = random.Random(1)
+    for i in range(2000):
+        army = _army(manager, f"a{i}", f"P{i % 50}", (rng.randrange(400), rng.randrange(400)))
+        target = (min(399, army.pos_x + rng.randint(-20, 20)), min(399, army.pos_y + rng.randint(-20, 20)))
+        manager.send_march(army, (max(0, target[0]), max(0, target[1])))
+
+    # 버킷 후보만 비교하므로 평균 후보 수는 전체 행군 수보다 훨씬 적음
+    assert len(detector._segments) > 1900
+    assert max(len(bucket) for bucket in detector._buckets.values()) < 200
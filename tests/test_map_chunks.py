@@ -0,0 +1,69 @@
+import json
+from src.models.world_map import WorldMap
+from src.models.army import Army
+from src.models.building import BuildingType
+from src.models.tile import TileCategory
+from src.factories.champion_factory import create_champion
+from src.logic.map_manager import MapManager
+from src.logic.map_chunks import MapChunkIndex
+
+
+def _index(size=64, chunk_size=16):
+    world_map = WorldMap(size, size)
+    for row in world_map.grid:
+        for tile in row:
+            tile.category = TileCategory.RESOURCE
+    manager = MapManager(world_map)
+    return world_map, manager, MapChunkIndex(world_map, manager, chunk_size=chunk_size)
+
+
+def test_owner_change_bumps_only_its_chunk():
+    world_map, _, chunks = _index()
+    etags = {(cx, cy): chunks.etag(cx, cy) for cy in range(4) for cx in range(4)}
+    world_map.get_tile(20, 3).occupy("P1")
+    # 같은 소유주로 다시 설정하면 알림이 없으므로 리비전도 그대로
+    world_map.get_tile(20, 3).set_owner("P1")
+
+    assert chunks.revisions[0, 1] == 1 and chunks.revisions.sum() == 1
+    for key, tag in etags.items():
+        assert (chunks.etag(*key) != tag) == (key == (1, 0))
+
+
+def test_building_and_army_bump_every_touched_chunk():
+    world_map, manager, chunks = _index()
+    # 3x3 주성이 청크 (0,0)/(1,0)/(0,1)/(1,1) 경계에 걸침
+    assert world_map.place_building(BuildingType.MAIN_CASTLE, "P1", (15, 15))
+    assert chunks.revisions[:2, :2].min() >= 1 and chunks.revisions[2:, :].sum() == 0
+
+    before = chunks.revisions.copy()
+    army = Army("a", "P1", create_champion("Garen"))
+    army.set_position(40, 40)
+    manager.register_army(army)
+    army.set_position(50, 8)
+    changed = {(int(cy), int(cx)) for cy, cx in zip(*(chunks.revisions != before).nonzero())}
+    # 이전 위치(2,2)와 새 위치(3,0) 청크
+    assert changed == {(2, 2), (0, 3)}
+
+
+def test_chunk_bytes_are_cached_per_revision():
+    world_map, _, chunks = _index()
+    first = chunks.chunk_bytes(0, 0)
+    assert chunks.chunk_bytes(0, 0) is first
+
+    world_map.get_tile(2, 1).occupy("플레이어")
+    second = chunks.chunk_bytes(0, 0)
+    assert second is not first
+    chunk = json.loads(second)
+    assert chunk["rev"] == 1
+    assert chunk["owners"] == ["플레이어"]
+    assert chunk["owner"][1 * 16 + 2] == 0 and chunk["owner"].count(-1) == 16 * 16 - 1
+
+
+def test_chunks_in_view_reports_current_revisions():
+    world_map, _, chunks = _index(size=40)
+    world_map.get_tile(35, 35).occupy("P1")
+    view = chunks.chunks_in_view(10, 10, 30, 30)
+    assert [cx for cx, _, _ in view] == [0, 1, 2, 0, 1, 2, 0, 1, 2]
+    assert [rev for _, _, rev in view if rev] == [1]
+    # 마지막 청크는 맵 끝에서 잘림
+    assert json.loads(chunks.chunk_bytes(2, 2))["w"] == 8
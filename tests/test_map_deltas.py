@@ -0,0 +1,65 @@
+from src.models.world_map import WorldMap
+from src.models.building import BuildingType
+from src.models.tile import TileCategory
+from src.factories.champion_factory import create_champion
+from src.logic.map_manager import MapManager
+from src.logic.map_chunks import MapChunkIndex
+from src.logic.map_deltas import MapDeltaTracker, ChunkSubscriptions
+
+
+def _setup(size=40):
+    world_map = WorldMap(size, size)
+    for row in world_map.grid:
+        for tile in row:
+            tile.category = TileCategory.RESOURCE
+    manager = MapManager(world_map)
+    chunks = MapChunkIndex(world_map, manager, chunk_size=16)
+    return world_map, manager, chunks, MapDeltaTracker(world_map, manager, chunks)
+
+
+def test_changes_in_a_tick_are_coalesced_per_tile():
+    world_map, manager, chunks, tracker = _setup()
+    tile = world_map.get_tile(3, 2)
+    tile.occupy("P1")
+    tile.occupy("P2")
+    tile.occupy("P1")
+    assert tracker.dirty_count == 1
+
+    deltas = tracker.flush()
+    assert list(deltas) == [(0, 0)]
+    delta = deltas[(0, 0)]
+    assert delta["owners"] == ["P1"]
+    assert len(delta["tiles"]) == 1
+    index, _, _, _, owner, army = delta["tiles"][0]
+    assert (index, owner, army) == (2 * 16 + 3, 0, None)
+    assert delta["rev"] == int(chunks.revisions[0, 0])
+    assert tracker.flush() == {}
+
+
+def test_building_and_army_moves_mark_both_chunks():
+    world_map, manager, chunks, tracker = _setup()
+    world_map.place_building(BuildingType.MAIN_CASTLE, "P1", (0, 0))
+    assert tracker.dirty_count == 9
+    tracker.flush()
+
+    army = manager.create_army("P1", create_champion("Garen"))
+    army.set_position(15, 1)
+    tracker.flush()
+    army.set_position(17, 1)
+    deltas = tracker.flush()
+    assert set(deltas) == {(0, 0), (1, 0)}
+    assert deltas[(1, 0)]["tiles"][0][0] == 1 * 16 + 1
+
+
+def test_subscriptions_route_only_to_interested_sockets():
+    subs = ChunkSubscriptions()
+    subs.subscribe("a", [(0, 0), (1, 0)])
+    subs.subscribe("b", [(1, 0)])
+    routed = subs.route({(0, 0): "d00", (1, 0): "d10", (2, 2): "d22"})
+    assert routed == {"a": ["d00", "d10"], "b": ["d10"]}
+
+    subs.subscribe("a", [(2, 2)])
+    assert subs.route({(0, 0): "d00"}) == {}
+    subs.unsubscribe("b")
+    assert subs.route({(1, 0): "d10"}) == {}
+    assert len(subs) == 1
@@ -0,0 +1,35 @@
+import numpy as np
+from src.models.world_map import CATEGORY_CODES, RESOURCE_CODES
+from src.models.tile import TileCategory, ResourceType
+from src.logic.map_generator import generate_map_arrays, generate_world, MAX_LEVEL
+
+
+def test_same_seed_same_map():
+    a = generate_map_arrays(120, 80, seed=42)
+    b = generate_map_arrays(120, 80, seed=42)
+    c = generate_map_arrays(120, 80, seed=43)
+    assert all(np.array_equal(a[k], b[k]) for k in a)
+    assert not np.array_equal(a["category"], c["category"])
+
+
+def test_generated_values_are_valid():
+    arrays = generate_map_arrays(200, 150, seed=7)
+    assert arrays["category"].shape == (150, 200)
+
+    obstacle = arrays["category"] == CATEGORY_CODES[TileCategory.OBSTACLE]
+    assert 0.05 < obstacle.mean() < 0.35
+    assert (arrays["res_type"][obstacle] == RESOURCE_CODES[ResourceType.NONE]).all()
+    assert (arrays["res_type"][~obstacle] != RESOURCE_CODES[ResourceType.NONE]).all()
+    assert arrays["level"].min() >= 1 and arrays["level"].max() <= MAX_LEVEL
+
+    # 중앙으로 갈수록 레벨이 높아짐
+    level = arrays["level"].astype(float)
+    assert level[60:90, 80:120].mean() > level[:20, :20].mean() + 2
+
+
+def test_generate_world_matches_arrays():
+    world_map = generate_world(40, 30, seed=5)
+    arrays, owners = world_map.to_arrays()
+    expected = generate_map_arrays(40, 30, seed=5)
+    assert owners == []
+    assert all(np.array_equal(arrays[k], expected[k]) for k in arrays)
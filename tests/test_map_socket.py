@@ -0,0 +1,60 @@
+import asyncio
+import json
+import pytest
+from fastapi.testclient import TestClient
+from src.api import server
+from src.api.map_socket import SocketOutbox, RESYNC_MESSAGE, parse_subscribe
+
+
+def test_parse_subscribe_validates_shape():
+    assert parse_subscribe('{"subscribe": [[0, 0], [3, 1], [-1, 0], [9, 9]]}', 4, 4) == [(0, 0), (3, 1)]
+    for bad in ("not json", "[]", '{"subscribe": 5}', '{"subscribe": [[0]]}',
+                '{"subscribe": [["a", 0]]}', '{"subscribe": [[true, 0]]}', '{"subscribe": [[0.5, 0]]}'):
+        with pytest.raises(ValueError):
+            parse_subscribe(bad, 4, 4)
+    with pytest.raises(ValueError):
+        parse_subscribe(json.dumps({"subscribe": [[0, 0]] * 3}), 4, 4, max_chunks=2)
+
+
+def test_outbox_is_bounded_and_coalesces_to_resync():
+    async def scenario():
+        outbox = SocketOutbox(maxsize=3)
+        for i in range(3):
+            outbox.put(f"delta{i}")
+        outbox.put("delta3")
+        assert outbox.pending() == 1 and outbox.dropped == 4
+        assert await outbox.get() == RESYNC_MESSAGE
+        outbox.put("delta4")
+        assert await outbox.get() == "delta4"
+    asyncio.run(scenario())
+
+
+def test_socket_replies_with_error_and_keeps_streaming():
+    client = TestClient(server.app)
+    tile = server.world_map.get_tile(1, 1)
+    owner = tile.owner_id
+    try:
+        with client.websocket_connect("/map/ws") as ws:
+            ws.send_text("{broken")
+            assert ws.receive_json()["type"] == "error"
+            ws.send_json({"subscribe": [[0, 0]]})
+            # 메시지는 순서대로 처리되므로 이 오류 응답 시점에는 구독이 등록되어 있음
+            ws.send_json({"subscribe": [[0, 0, 0]]})
+            assert ws.receive_json()["type"] == "error"
+
+            tile.set_owner("socket-test")
+            # 틱은 앱의 이벤트 루프에서 (전진은 맵 워커 스레드에서) 실행
+            ws.portal.call(server.map_tick)
+            message = ws.receive_json()
+            assert message["type"] == "delta" and [c["cx"] for c in message["chunks"]] == [0]
+    finally:
+        tile.set_owner(owner)
+        server.map_deltas.flush()
+
+
+def test_map_chunk_conditional_get_accepts_weak_and_listed_etags():
+    client = TestClient(server.app)
+    etag = client.get("/map/chunk/0/0").headers["etag"]
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        assert client.get("/map/chunk/0/0", headers={"If-None-Match": header}).status_code == 304
+    assert client.get("/map/chunk/0/0", headers={"If-None-Match": '"other"'}).status_code == 200
@@ -0,0 +1,57 @@
+import pytest
+from src.common.metrics import Registry
+
+
+def test_render_prometheus_text():
+    registry = Registry()
+    requests = registry.counter("app_requests_total", "요청 수", ["path"])
+    requests.labels("/a").inc()
+    requests.labels("/a").inc(2)
+    registry.gauge("app_queue", "대기열").set_function(lambda: 7)
+    latency = registry.histogram("app_latency_seconds", "지연", buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE app_requests_total counter" in lines
+    assert 'app_requests_total{path="/a"} 3' in lines
+    assert "app_queue 7" in lines
+    # 버킷은 누적, le 경계 포함
+    assert 'app_latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'app_latency_seconds_bucket{le="1"} 3' in lines
+    assert 'app_latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "app_latency_seconds_count 4" in lines
+    assert "app_latency_seconds_sum 3.65" in lines
+
+
+def test_registry_reuses_and_validates():
+    registry = Registry()
+    counter = registry.counter("x_total", "x")
+    assert registry.counter("x_total", "x") is counter
+    with pytest.raises(ValueError):
+        registry.gauge("x_total", "x")
+    with pytest.raises(ValueError):
+        registry.counter("y_total", "y", ["a"]).inc()
+
+
+def test_hot_paths_are_instrumented():
+    from src.common.metrics import REGISTRY
+    from src.factories.champion_factory import create_champion
+    from src.logic.map_manager import MapManager
+    from src.models.world_map import WorldMap
+
+    create_champion("Garen")
+    MapManager(WorldMap(4, 4)).update()
+    text = REGISTRY.render()
+    assert "leagueslg_champion_build_seconds_count" in text
+    assert "leagueslg_map_tick_seconds_count" in text
+    assert "leagueslg_active_marches 0" in text
+
+
+def test_simulation_paths_record_battle_cpu_time():
+    from src.api import server
+    cpu = server.BATTLE_CPU_SECONDS._default()
+    before = sum(cpu.counts)
+    server.run_simulation("Garen", "Darius")
+    server.run_ranked_battle("Garen", "Darius")
+    assert sum(cpu.counts) == before + 2
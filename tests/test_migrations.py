@@ -0,0 +1,89 @@
+from sqlalchemy import create_engine, inspect, text
+from src.common.migrations import migrate, current_version, MIGRATIONS
+from src.common.database import Base, apply_sqlite_profile
+
+
+def test_fresh_database_reaches_latest_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    assert migrate(engine) == [number for number, _, _ in MIGRATIONS]
+    assert migrate(engine) == []
+    assert current_version(engine) == MIGRATIONS[-1][0]
+
+    inspector = inspect(engine)
+    assert "ix_user_champions_user_key" in {i["name"] for i in inspector.get_indexes("user_champions")}
+    assert "ix_battle_logs_user_created" in {i["name"] for i in inspector.get_indexes("battle_logs")}
+
+
+def test_baseline_is_frozen_and_later_versions_match_models(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'frozen.db'}")
+    migrate(engine, target=1)
+    inspector = inspect(engine)
+    # v1은 모델이 아니라 고정된 DDL: 이후 버전에서 추가된 테이블/컬럼은 없어야 함
+    assert set(inspector.get_table_names()) == {"schema_migrations", "users", "user_champions",
+                                                 "battle_logs", "battle_turns"}
+    assert [c["name"] for c in inspector.get_columns("users")] == ["id", "username"]
+
+    migrate(engine)
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        migrated = {c["name"] for c in inspector.get_columns(table.name)}
+        assert migrated == {c.name for c in table.columns}, table.name
+
+
+def test_legacy_schema_is_upgraded_in_place(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT UNIQUE NOT NULL, gold INTEGER)"))
+        conn.execute(text("INSERT INTO users (username, gold) VALUES ('Geo', 1000)"))
+        conn.execute(text(
+            "CREATE TABLE battle_logs (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, left_champion TEXT, "
+            "right_champion TEXT, winner TEXT, turn_count INTEGER, history_json TEXT, created_at DATETIME)"
+        ))
+        conn.execute(text(
+            "INSERT INTO battle_logs (user_id, left_champion, right_champion, winner, turn_count, history_json, "
+            "created_at) VALUES (1, 'Garen', 'Darius', 'Darius', 7, '[]', '2025-03-01 10:00:00')"
+        ))
+
+    assert migrate(engine, target=1) == [1]
+    assert migrate(engine) == [2, 3, 4, 5, 6]
+    columns = {c["name"] for c in inspect(engine).get_columns("battle_logs")}
+    assert "history_blob" in columns
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT username FROM users")).scalar() == "Geo"
+        # 기존 전투 로그가 집계 테이블로 백필됨
+        stats = conn.execute(text(
+            "SELECT champion, wins, losses, total_turns FROM matchup_stats_daily "
+            "WHERE day = '2025-03-01' ORDER BY champion"
+        )).fetchall()
+        assert [tuple(r) for r in stats] == [("Darius", 1, 0, 7), ("Garen", 0, 1, 7)]
+
+
+def test_battles_without_winner_are_backfilled_as_draws(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'draws.db'}")
+    with engine.begin() as conn:
+        # 레거시 스키마: winner가 NULL일 수 있음
+        conn.execute(text(
+            "CREATE TABLE battle_logs (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, left_champion TEXT, "
+            "right_champion TEXT, winner TEXT, turn_count INTEGER, history_json TEXT, created_at DATETIME)"
+        ))
+        for winner in ("Garen", "Darius", None, ""):
+            conn.execute(text(
+                "INSERT INTO battle_logs (user_id, left_champion, right_champion, winner, turn_count, created_at) "
+                "VALUES (1, 'Garen', 'Darius', :w, 5, '2025-03-01 10:00:00')"
+            ), {"w": winner})
+
+    migrate(engine)
+    with engine.connect() as conn:
+        stats = conn.execute(text(
+            "SELECT champion, wins, losses, draws FROM matchup_stats_daily "
+            "WHERE day = '2025-03-01' ORDER BY champion"
+        )).fetchall()
+    assert [tuple(r) for r in stats] == [("Darius", 1, 1, 2), ("Garen", 1, 1, 2)]
+
+
+def test_sqlite_profile_is_applied(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    apply_sqlite_profile(engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
@@ -0,0 +1,25 @@
+import random
+from src.models.world_map import WorldMap
+from src.models.building import BuildingType
+from src.logic.placement import PlacementIndex
+
+
+def test_index_matches_world_map_checks():
+    random.seed(7)
+    world_map = WorldMap(25, 20)
+    index = PlacementIndex(world_map)
+
+    for i in range(15):
+        root = index.find_nearest(BuildingType.MAIN_CASTLE, (random.randrange(25), random.randrange(20)))
+        if root is None:
+            break
+        assert world_map.place_building(BuildingType.MAIN_CASTLE, f"P{i}", root)
+        world_map.place_building(BuildingType.BARRACKS, f"P{i}", (random.randrange(25), random.randrange(20)))
+
+    for b_type in BuildingType:
+        roots = set(index.valid_roots(b_type))
+        for y in range(-1, world_map.height + 1):
+            for x in range(-1, world_map.width + 1):
+                expected = world_map.can_place_building(b_type, (x, y))
+                assert index.can_place(b_type, (x, y)) == expected
+                assert ((x, y) in roots) == expected
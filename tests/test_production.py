@@ -0,0 +1,62 @@
+from src.models.world_map import WorldMap
+from src.models.building import BuildingType
+from src.models.tile import TileCategory
+from src.logic.production import ProductionEngine
+
+
+def _scan_income(world_map, owner_id):
+    """기존 방식: 그리드 전체를 순회하며 Tile.get_production 합산"""
+    total = {}
+    for row in world_map.grid:
+        for tile in row:
+            if tile.owner_id != owner_id:
+                continue
+            for res, amount in tile.get_production().items():
+                total[res] = total.get(res, 0) + amount
+    return total
+
+
+def test_incremental_income_matches_grid_scan():
+    world_map = WorldMap(30, 30)
+    world_map.get_tile(5, 5).occupy("P1")
+    engine = ProductionEngine(world_map)
+
+    for x in range(10):
+        world_map.get_tile(x, 10).occupy("P1")
+        world_map.get_tile(x, 11).occupy("P2")
+    # P2가 P1의 타일 일부를 빼앗음
+    for x in range(3):
+        world_map.get_tile(x, 10).occupy("P2")
+    world_map.get_tile(4, 11).abandon()
+    world_map.place_building(BuildingType.MAIN_CASTLE, "P1", (20, 20))
+
+    for owner_id in ("P1", "P2"):
+        assert engine.get_income(owner_id) == _scan_income(world_map, owner_id)
+
+
+def test_tick_accumulates_stockpile():
+    world_map = WorldMap(5, 5)
+    tile = world_map.get_tile(0, 0)
+    tile.category = TileCategory.RESOURCE
+    engine = ProductionEngine(world_map)
+    tile.occupy("P1")
+
+    produced = engine.tick(ticks=2)
+    expected = {res: amount * 2 for res, amount in tile.get_production().items()}
+    assert produced == {"P1": expected}
+    assert engine.get_stockpile("P1") == expected
+
+
+def test_building_on_owned_tiles_removes_their_income():
+    world_map = WorldMap(10, 10)
+    for y in range(3):
+        for x in range(3):
+            tile = world_map.get_tile(x, y)
+            tile.category = TileCategory.RESOURCE
+            tile.occupy("P1")
+    engine = ProductionEngine(world_map)
+    assert engine.get_income("P1")
+
+    # 이미 P1 소유인 타일이라 소유주 변경 알림 없이 건물 타일로 바뀜
+    world_map.place_building(BuildingType.MAIN_CASTLE, "P1", (0, 0))
+    assert engine.get_income("P1") == _scan_income(world_map, "P1") == {}
@@ -0,0 +1,54 @@
+import pytest
+from fastapi.testclient import TestClient
+from src.api import server
+from src.async_db_manager import AsyncDatabaseManager
+from src.game.ranking import RankingService
+from src.logic.rating import DEFAULT_RATING
+
+
+@pytest.fixture
+def client(sessions, monkeypatch):
+    database = AsyncDatabaseManager(sessions, max_workers=1)
+    ranking = RankingService(database.sync)
+    monkeypatch.setattr(server, "database", database)
+    monkeypatch.setattr(server, "ranking", ranking)
+    # 수명 주기(lifespan)는 실행하지 않음: 실제 DB 파일/맵 틱 없이 엔드포인트만 검증
+    yield TestClient(server.app), database.sync, ranking
+    database.close()
+
+
+def test_ranked_battle_saves_log_and_ratings_together(client):
+    http, db, ranking = client
+    alice = db.get_or_create_user("alice")
+    bob = db.get_or_create_user("bob")
+
+    response = http.post("/ranked/battle", json={
+        "left_user_id": alice, "right_user_id": bob, "left_id": "Garen", "right_id": "Darius",
+    })
+    assert response.status_code == 200
+    body = response.json()
+    winner, loser = (alice, bob) if body["winner"] == "Garen" else (bob, alice)
+
+    ratings = dict(db.get_ratings())
+    assert ratings[winner] > DEFAULT_RATING > ratings[loser]
+    assert body["ratings"] == {str(u): round(ratings[u], 1) for u in (alice, bob)}
+
+    log = db.get_battle_log(1)
+    assert log["user_id"] == alice and log["winner"] == body["winner"]
+    assert log["turn_count"] == body["turns"] and log["history"]
+
+    top = http.get("/ranking/top?n=2").json()
+    assert [row["user_id"] for row in top] == [winner, loser]
+    assert http.get(f"/ranking/{loser}").json()["rank"] == 2
+
+
+def test_ranked_battle_rejects_unknown_or_same_user(client):
+    http, db, ranking = client
+    alice = db.get_or_create_user("alice")
+    request = {"left_user_id": alice, "right_user_id": alice, "left_id": "Garen", "right_id": "Darius"}
+    assert http.post("/ranked/battle", json=request).status_code == 400
+    assert http.post("/ranked/battle", json=dict(request, right_user_id=999)).status_code == 404
+    bob = db.get_or_create_user("bob")
+    assert http.post("/ranked/battle", json=dict(request, right_user_id=bob, left_id="Nobody")).status_code == 400
+    # 실패한 요청은 로그/레이팅을 남기지 않음
+    assert db.get_battle_log(1) is None and len(ranking.index) == 0
@@ -0,0 +1,67 @@
+import random
+import pytest
+from src.game.ranking import RankingService
+from src.logic.rating import RankIndex, elo_update, expected_score
+
+
+def test_elo_update_is_zero_sum():
+    assert expected_score(1500, 1500) == pytest.approx(0.5)
+    a, b = elo_update(1500, 1500, 1.0)
+    assert (a, b) == (pytest.approx(1516), pytest.approx(1484))
+    # 약자가 이기면 더 많이 오름
+    a, b = elo_update(1400, 1600, 1.0)
+    assert a - 1400 > 16 and a + b == pytest.approx(3000)
+
+
+def test_rank_index_matches_brute_force():
+    rng = random.Random(7)
+    index = RankIndex()
+    ratings = {}
+    for _ in range(3000):
+        user_id = rng.randrange(500)
+        if rng.random() < 0.1:
+            index.remove(user_id)
+            ratings.pop(user_id, None)
+        else:
+            ratings[user_id] = rng.uniform(800, 2400)
+            index.set(user_id, ratings[user_id])
+
+    assert len(index) == len(ratings)
+    for user_id, rating in ratings.items():
+        higher = sum(1 for r in ratings.values() if int(r) > int(rating))
+        assert index.rank(user_id) == higher + 1
+
+    top = index.top(50)
+    expected = sorted(ratings.items(), key=lambda kv: (-int(kv[1]), -kv[1], kv[0]))[:50]
+    assert [uid for _, uid, _ in top] == [uid for uid, _ in expected]
+    assert all(rank == index.rank(uid) for rank, uid, _ in top)
+
+
+def test_ranking_service_persists_battle_results(db, battle):
+    alice = db.get_or_create_user("alice")
+    bob = db.get_or_create_user("bob")
+    service = RankingService(db)
+    service.load()
+    assert len(service.index) == 2
+
+    new_alice, new_bob = service.record_battle(alice, bob, battle)
+    winner, loser = (alice, bob) if battle.winner is battle.left else (bob, alice)
+
+    assert service.rank(winner) == 1 and service.rank(loser) == 2
+    assert service.top(1)[0]["user_id"] == winner
+    assert db.get_user_info(alice)["rating"] == pytest.approx(new_alice)
+
+    # 재시작 후에도 같은 순위
+    reloaded = RankingService(db)
+    reloaded.load()
+    assert reloaded.rank(winner) == 1 and reloaded.rating(bob) == pytest.approx(new_bob)
+
+
+def test_ranking_service_joins_unit_of_work(db, battle):
+    alice = db.get_or_create_user("alice")
+    bob = db.get_or_create_user("bob")
+    service = RankingService(db)
+    with db.batch() as uow:
+        uow.add_battle_log(alice, battle)
+        service.record_battle(alice, bob, battle, uow)
+    assert sorted(r for _, r in db.get_ratings()) == sorted(service.index.rating(u) for u in (alice, bob))
@@ -0,0 +1,64 @@
+from datetime import datetime
+from src.models.march import March, MarchStatus
+from src.logic.simulation import VirtualClock, WorldSimulation
+
+
+def test_virtual_clock_drives_marches_and_is_restored():
+    saved = March.clock
+    sim = WorldSimulation(size=40, bots=1, armies_per_bot=1, seed=1)
+    try:
+        assert March.clock() == datetime(2025, 1, 1)
+        sim.clock.advance(90)
+        assert (March.clock() - datetime(2025, 1, 1)).total_seconds() == 90
+    finally:
+        sim.close()
+    assert March.clock == saved
+
+
+def test_returning_march_arrives_home_on_tick():
+    sim = WorldSimulation(size=60, bots=1, armies_per_bot=1, seed=3, tick_seconds=10)
+    try:
+        manager = sim.manager
+        army = sim.bots[0].armies[0]
+        home = army.home_pos
+        army.set_position(home[0] + 3, home[1] + 4)  # 거리 5 → 300초
+        march = manager.send_march(army, home, is_retreat=True)
+        assert march.status == MarchStatus.RETURNING
+
+        for _ in range(29):
+            sim.clock.advance(10)
+            manager.update()
+        assert march in manager.active_marches and army.status == "MARCHING"
+
+        sim.clock.advance(15)
+        manager.update()
+        assert march not in manager.active_marches
+        assert march.status == MarchStatus.COMPLETED
+        assert army.status == "IDLE" and (army.pos_x, army.pos_y) == home
+        assert manager.world_map.get_tile(*home).owner_id == sim.bots[0].user_id
+        assert sim.recorder.arrivals == 1 and sim.recorder.total_lag == 5
+    finally:
+        sim.close()
+
+
+def _run(seed):
+    sim = WorldSimulation(size=80, bots=4, armies_per_bot=2, seed=seed)
+    try:
+        report = sim.run(ticks=60)
+        owners = [[t.owner_id for t in row] for row in sim.world_map.grid]
+        return report, owners, sim.tick_seconds
+    finally:
+        sim.close()
+
+
+def test_run_is_reproducible_for_a_seed():
+    report, owners, tick_seconds = _run(7)
+    assert report["ticks"] == 60 and report["bots"] == 4 and report["armies"] == 8
+    assert report["arrivals"] > 0 and report["battles"] > 0
+    # 도착은 늦어도 다음 틱에 처리
+    assert 0 <= report["avg_arrival_lag_sec"] < tick_seconds
+
+    again, again_owners, _ = _run(7)
+    for key in ("arrivals", "battles", "active_marches", "avg_arrival_lag_sec"):
+        assert again[key] == report[key]
+    assert again_owners == owners
@@ -0,0 +1,28 @@
+import json
+import threading
+from pathlib import Path
+import pytest
+from src.factories.champion_factory import create_champion
+from src.factories.skill_factory import create_skill
+from src.logic.battle.battle import Battle
+
+DATA = Path(__file__).resolve().parents[1] / "data"
+CHAMPIONS = json.loads((DATA / "champions.json").read_text(encoding="utf-8"))
+
+
+def test_every_champion_skill_has_data():
+    skills = json.loads((DATA / "skills.json").read_text(encoding="utf-8"))
+    missing = {s for champ in CHAMPIONS.values() for s in champ["skills"]} - set(skills)
+    assert not missing
+    # 데이터가 없으면 기본 확률 1.0, 위력 0으로 매 턴 헛스킬만 시전함
+    assert all(create_skill(s).power > 0 for s in skills)
+
+
+@pytest.mark.parametrize("name", ["Irelia", "Jax", "Lux"])
+def test_mirror_battle_terminates(name):
+    # Irelia 대 Irelia는 IreliaQ 데이터가 없을 때 평타 없이 위력 0 스킬만 반복해 끝나지 않았음
+    battle = Battle(create_champion(name), create_champion(name))
+    runner = threading.Thread(target=battle.start, daemon=True)
+    runner.start()
+    runner.join(timeout=5)
+    assert not runner.is_alive(), f"{name} mirror battle did not finish"
@@ -0,0 +1,57 @@
+from src.models.world_map import WorldMap
+from src.models.building import BuildingType
+from src.models.tile import TileCategory
+from src.logic.territory import TerritoryIndex
+
+
+def _open_map(width=12, height=12):
+    world_map = WorldMap(width, height)
+    for row in world_map.grid:
+        for tile in row:
+            tile.category = TileCategory.RESOURCE
+    return world_map
+
+
+def test_tiles_and_adjacency():
+    world_map = _open_map()
+    territory = TerritoryIndex(world_map)
+    world_map.place_building(BuildingType.MAIN_CASTLE, "P1", (0, 0))
+
+    assert territory.tile_count("P1") == 9
+    assert territory.is_adjacent("P1", (3, 1))
+    assert not territory.is_adjacent("P1", (4, 1))
+    assert territory.can_attack("P1", (3, 1))
+    assert not territory.can_attack("P1", (1, 1))
+
+
+def test_castle_link_breaks_and_recovers():
+    world_map = _open_map()
+    territory = TerritoryIndex(world_map)
+    world_map.place_building(BuildingType.MAIN_CASTLE, "P1", (0, 0))
+    for x in range(3, 8):
+        world_map.get_tile(x, 1).occupy("P1")
+
+    assert territory.is_connected_to_castle("P1", (7, 1))
+    assert territory.can_attack("P1", (8, 1), require_castle_link=True)
+
+    # 보급로 중간을 빼앗기면 끝부분은 주성과 끊김
+    world_map.get_tile(5, 1).occupy("P2")
+    assert territory.is_connected_to_castle("P1", (4, 1))
+    assert not territory.is_connected_to_castle("P1", (7, 1))
+    assert not territory.can_attack("P1", (8, 1), require_castle_link=True)
+    assert territory.can_attack("P1", (8, 1))
+
+    # 우회로로 다시 연결
+    for x in range(4, 7):
+        world_map.get_tile(x, 2).occupy("P1")
+    assert territory.is_connected("P1", (0, 0), (7, 1))
+    assert territory.component_size("P1", (7, 1)) == 9 + 2 + 3 + 2
+
+
+def test_index_built_from_existing_map():
+    world_map = _open_map()
+    world_map.get_tile(2, 2).occupy("P1")
+    world_map.get_tile(2, 3).occupy("P1")
+    territory = TerritoryIndex(world_map)
+    assert territory.get_tiles("P1") == {(2, 2), (2, 3)}
+    assert territory.is_connected("P1", (2, 2), (2, 3))
@@ -0,0 +1,103 @@
+from src.models.world_map import WorldMap
+from src.models.army import Army
+from src.models.building import BuildingType
+from src.models.tile import TileCategory
+from src.factories.champion_factory import create_champion
+from src.logic.map_manager import MapManager
+from src.logic.map_chunks import MapChunkIndex
+from src.logic.visibility import VisibilityIndex, ARMY_VISION
+
+
+def _world(size=40):
+    world_map = WorldMap(size, size)
+    for row in world_map.grid:
+        for tile in row:
+            tile.category = TileCategory.RESOURCE
+    manager = MapManager(world_map)
+    return world_map, manager
+
+
+def _army(manager, army_id, owner, pos):
+    army = Army(army_id, owner, create_champion("Garen"))
+    army.home_pos = pos
+    army.set_position(*pos)
+    manager.register_army(army)
+    return army
+
+
+def _rebuilt(world_map, manager, user_id):
+    """같은 상태에서 새로 만든 인덱스의 가시 타일 (증분 갱신 결과와 비교용)"""
+    fresh = VisibilityIndex(world_map, manager)
+    world_map.remove_listener(fresh)
+    manager.remove_listener(fresh)
+    return {(x, y) for y in range(world_map.height) for x in range(world_map.width)
+            if fresh.is_visible(user_id, x, y)}
+
+
+def _visible(index, world_map, user_id):
+    return {(x, y) for y in range(world_map.height) for x in range(world_map.width)
+            if index.is_visible(user_id, x, y)}
+
+
+def test_army_moves_and_removal_keep_counts_consistent():
+    world_map, manager = _world()
+    index = VisibilityIndex(world_map, manager)
+    army = _army(manager, "a", "P1", (5, 5))
+    assert index.is_visible("P1", 5 + ARMY_VISION, 5) and not index.is_visible("P1", 5 + ARMY_VISION + 1, 5)
+
+    # 겹치는 시야(타일 + 부대)는 참조 카운트로 합쳐짐
+    world_map.get_tile(6, 5).occupy("P1")
+    army.set_position(30, 30)
+    assert index.is_visible("P1", 6, 5) and not index.is_visible("P1", 2, 2)
+    assert _visible(index, world_map, "P1") == _rebuilt(world_map, manager, "P1")
+
+    # 맵에서 빠진 부대(위치 없음)는 시야를 반납, 카운트가 음수로 내려가지 않음
+    army.pos_x = army.pos_y = None
+    army.notify_changed()
+    assert not index.is_visible("P1", 30, 30)
+    assert all(int(c.min()) >= 0 for c in index._counts["P1"].values())
+    assert _visible(index, world_map, "P1") == {(x, y) for x in range(4, 9) for y in range(3, 8)}
+
+
+def test_march_target_vision_is_released_on_finish():
+    world_map, manager = _world()
+    army = _army(manager, "a", "P1", (0, 0))
+    index = VisibilityIndex(world_map, manager)
+    march = manager.send_march(army, (20, 20))
+    assert index.is_visible("P1", 20, 20)
+    march.status = march.status.COMPLETED
+    manager._finish_march(march)
+    assert not index.is_visible("P1", 20, 20)
+
+
+def test_building_vision_is_revoked_when_captured():
+    world_map, manager = _world()
+    index = VisibilityIndex(world_map, manager)
+    world_map.place_building(BuildingType.MAIN_CASTLE, "P1", (10, 10))
+    assert index.is_visible("P1", 16, 11)
+
+    world_map.get_tile(11, 11).occupy("P2")
+    # 건물 시야는 빠지고 남은 footprint 타일 시야만 유지
+    assert not index.is_visible("P1", 16, 11)
+    assert _visible(index, world_map, "P1") == {
+        (x, y) for x in range(8, 15) for y in range(8, 15)
+    }
+    assert index.visible_count("P2") == 25
+
+
+def test_chunk_etag_tracks_revisions_and_encodes_user():
+    world_map, manager = _world(64)
+    chunks = MapChunkIndex(world_map, manager, chunk_size=32)
+    index = VisibilityIndex(world_map, manager, chunk_size=32)
+    before = chunks.etag(0, 0)
+    other = chunks.etag(1, 1)
+    world_map.get_tile(3, 3).occupy("플레이어")
+    assert chunks.etag(0, 0) != before and chunks.etag(1, 1) == other
+    assert chunks.revisions.tolist() == [[1, 0], [0, 0]]
+
+    tag = chunks.etag(0, 0, index, "플레이어")
+    tag.encode("latin-1")
+    assert "플레이어" not in tag and tag != chunks.etag(0, 0, index, "P2")
+
+    # 리비전이 같으면 캐시된 바이트를 재사용
+    assert chunks.chunk_bytes(0, 0) is chunks.chunk_bytes(0, 0)
@@ -0,0 +1,76 @@
+from src.models.world_map import WorldMap
+from src.models.army import Army
+from src.models.building import BuildingType
+from src.models.tile import TileCategory
+from src.factories.champion_factory import create_champion
+from src.logic.map_manager import MapManager
+from src.common.world_store import WorldStore
+
+
+def _world():
+    world_map = WorldMap(12, 12)
+    for row in world_map.grid:
+        for tile in row:
+            tile.category = TileCategory.RESOURCE
+    manager = MapManager(world_map)
+    army = Army("army_P1", "P1", create_champion("Garen"))
+    army.home_pos = (0, 0)
+    army.set_position(0, 0)
+    manager.register_army(army)
+    return world_map, manager, army
+
+
+def _state(world_map, manager):
+    tiles = [
+        (t.x, t.y, t.category, t.owner_id, t.current_durability, t.building.id if t.building else None)
+        for row in world_map.grid for t in row
+    ]
+    armies = {
+        a.id: (a.owner_id, a.champion.current_hp, a.champion.level, (a.pos_x, a.pos_y), a.status)
+        for a in manager.armies.values()
+    }
+    marches = sorted((m.id, m.army.id, m.target_pos, m.status) for m in manager.active_marches)
+    return tiles, armies, marches
+
+
+def test_snapshot_and_log_restore_same_state(tmp_path):
+    world_map, manager, army = _world()
+    world_map.get_tile(5, 5).current_durability = 10
+    world_map.get_tile(1, 1).occupy("P1")
+    store = WorldStore(str(tmp_path))
+    store.attach(world_map, manager)
+
+    # 스냅샷 이후 변경은 델타 로그로만 남음
+    world_map.get_tile(5, 5).occupy("P2")
+    world_map.get_tile(1, 1).abandon()
+    world_map.place_building(BuildingType.MAIN_CASTLE, "P1", (8, 8))
+    manager.send_march(army, (3, 4))
+    army.take_losses(123)
+    expected = _state(world_map, manager)
+    store.close()
+
+    restored = WorldStore(str(tmp_path))
+    world_map2, manager2 = restored.load()
+    assert _state(world_map2, manager2) == expected
+    # 점령 시 초기화된 내구도까지 복원
+    assert world_map2.get_tile(5, 5).current_durability == world_map2.get_tile(5, 5).max_durability
+    assert manager2.armies["army_P1"].champion.current_hp == army.champion.current_hp < army.champion.max_hp
+
+    # 새 스냅샷 후 재시작해도 동일
+    restored.save_snapshot()
+    restored.close()
+    world_map3, manager3 = WorldStore(str(tmp_path)).load()
+    assert _state(world_map3, manager3) == expected
+
+
+def test_truncated_tail_record_is_dropped(tmp_path):
+    world_map, manager, _ = _world()
+    store = WorldStore(str(tmp_path))
+    store.attach(world_map, manager)
+    world_map.get_tile(2, 2).occupy("P1")
+    store.close()
+    with open(store.log_path, "ab") as f:
+        f.write(b"\x01\xff\x00")  # 기록 도중 중단된 레코드 헤더
+
+    world_map2, _ = WorldStore(str(tmp_path)).load()
+    assert world_map2.get_tile(2, 2).owner_id == "P1"